@@ -1,8 +1,12 @@
 import time
 import random
+from src.core.Activity_Log import Activity_Log
+
+TRACKED_CHANNEL_FIELDS = ('name', 'volume', 'is_muted', 'color', 'output_device_id', 'input_device_id')
 
 class AudioChannel:
     def __init__(self, name: str, channel_id: str, channel_type: str = 'output'):
+        self._listener = None
         self.id = channel_id
         self.name = name
         self.type = channel_type
@@ -14,10 +18,22 @@ class AudioChannel:
         random.seed(name)
         self.color = f"hsl({random.randint(0, 360)}, 70%, 50%)"
 
-        self.connected_apps = []
+        self.apps = {}
         self.output_device_id = None
         self.input_device_id = None
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in TRACKED_CHANNEL_FIELDS and self._listener is not None:
+            self._listener({'op': 'channel_set', 'id': self.id, 'field': name, 'value': value})
+
+    @property
+    def connected_apps(self):
+        return list(self.apps)
+
+    def has_app(self, app_name: str) -> bool:
+        return app_name in self.apps
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -36,48 +52,197 @@ class AudioChannel:
 class ChannelManager:
     def __init__(self):
         self.channels = {}
+        self._by_type = {'output': {}, 'input': {}}
+        self._app_channels = {}
+        self._solo = {}
+        self._listener = None
+        self.version = 0
         self._create_default_channels()
 
+    def set_listener(self, listener):
+        self._listener = listener
+        for channel in self.channels.values():
+            channel._listener = None
+            if listener is not None:
+                self._notify_create(channel)
+
+    def _notify(self, mutation):
+        if self._listener is not None:
+            self._listener(mutation)
+
     def _create_default_channels(self):
         main_output = AudioChannel(name="Principal", channel_id="main_output", channel_type='output')
         main_output.is_main = True
         main_output.color = '#2563eb'
         main_output.output_device_id = "default"
-        self.channels[main_output.id] = main_output
+        self._add(main_output)
 
         main_input = AudioChannel(name="Microfone", channel_id="main_input", channel_type='input')
         main_input.is_main = True
         main_input.color = '#dc2626'
         main_input.input_device_id = "default"
-        self.channels[main_input.id] = main_input
+        self._add(main_input)
+
+    def _add(self, channel: AudioChannel):
+        self.channels[channel.id] = channel
+        self._by_type.setdefault(channel.type, {})[channel.id] = channel
+        self.version += 1
+        if self._listener is not None:
+            self._notify_create(channel)
+
+    def _notify_create(self, channel: AudioChannel):
+        self._notify({
+            'op': 'channel_create', 'id': channel.id, 'name': channel.name, 'type': channel.type,
+            'is_main': channel.is_main, 'volume': channel.volume, 'is_muted': channel.is_muted,
+            'color': channel.color, 'output_device_id': channel.output_device_id,
+            'input_device_id': channel.input_device_id, 'apps': channel.connected_apps
+        })
+        if channel.is_solo:
+            self._notify({'op': 'solo', 'type': channel.type, 'id': channel.id})
+        channel._listener = self._listener
 
-    def create_channel(self, name: str, channel_type: str) -> AudioChannel:
-        channel_id = f"channel_{int(time.time() * 1000)}"
+    def create_channel(self, name: str, channel_type: str, channel_id: str | None = None) -> AudioChannel:
+        channel_id = channel_id or f"channel_{int(time.time() * 1000)}"
+        suffix = 1
+        while channel_id in self.channels:
+            channel_id = f"channel_{int(time.time() * 1000)}_{suffix}"
+            suffix += 1
         new_channel = AudioChannel(name=name, channel_id=channel_id, channel_type=channel_type)
-        self.channels[channel_id] = new_channel
-        print(f"Canal '{name}' (tipo: {channel_type}) criado com ID '{channel_id}'.")
+        self._add(new_channel)
+        Activity_Log.shared().info('channels', f"Canal '{name}' (tipo: {channel_type}) criado com ID '{channel_id}'.")
         return new_channel
 
     def remove_channel(self, channel_id: str) -> bool:
         channel = self.channels.get(channel_id)
         if channel and not channel.is_main:
+            for app_name in channel.apps:
+                members = self._app_channels.get(app_name)
+                if members is not None:
+                    members.pop(channel_id, None)
+                    if not members:
+                        del self._app_channels[app_name]
+            if self._solo.get(channel.type) == channel_id:
+                del self._solo[channel.type]
+            del self._by_type[channel.type][channel_id]
             del self.channels[channel_id]
-            print(f"Canal ID '{channel_id}' removido.")
+            self.version += 1
+            channel._listener = None
+            self._notify({'op': 'channel_remove', 'id': channel_id})
+            Activity_Log.shared().info('channels', f"Canal ID '{channel_id}' removido.")
             return True
-        print(f"Falha ao remover canal ID '{channel_id}'. Não encontrado ou é um canal principal.")
+        Activity_Log.shared().warning('channels', f"Falha ao remover canal ID '{channel_id}'. Não encontrado ou é um canal principal.")
         return False
 
     def get_channel(self, channel_id: str) -> AudioChannel | None:
         return self.channels.get(channel_id)
 
-    def get_all_channels_by_type(self):
-        output_channels = [ch.to_dict() for ch in self.channels.values() if ch.type == 'output']
-        input_channels = [ch.to_dict() for ch in self.channels.values() if ch.type == 'input']
+    def get_channels(self, channel_type: str) -> list:
+        return list(self._by_type.get(channel_type, {}).values())
+
+    def add_app(self, channel_id: str, app_name: str) -> bool:
+        channel = self.channels.get(channel_id)
+        if not channel or app_name in channel.apps:
+            return False
+        channel.apps[app_name] = None
+        self._app_channels.setdefault(app_name, {})[channel_id] = channel
+        self.version += 1
+        self._notify({'op': 'member_add', 'id': channel_id, 'app': app_name})
+        return True
+
+    def remove_app(self, channel_id: str, app_name: str) -> bool:
+        channel = self.channels.get(channel_id)
+        if not channel or app_name not in channel.apps:
+            return False
+        del channel.apps[app_name]
+        members = self._app_channels[app_name]
+        del members[channel_id]
+        if not members:
+            del self._app_channels[app_name]
+        self.version += 1
+        self._notify({'op': 'member_remove', 'id': channel_id, 'app': app_name})
+        return True
+
+    def get_app_channels(self, app_name: str) -> list:
+        return list(self._app_channels.get(app_name, {}).values())
+
+    def get_solo(self, channel_type: str) -> AudioChannel | None:
+        channel_id = self._solo.get(channel_type)
+        return self.channels.get(channel_id) if channel_id else None
 
-        output_channels.sort(key=lambda x: not x['is_main'])
-        input_channels.sort(key=lambda x: not x['is_main'])
+    def set_solo(self, channel_id: str, enabled: bool) -> str | None:
+        channel = self.channels.get(channel_id)
+        if not channel:
+            return None
+
+        current = self._solo.get(channel.type)
+        if enabled:
+            if current == channel_id:
+                return None
+            previous = self.channels.get(current) if current else None
+            if previous:
+                previous.is_solo = False
+            channel.is_solo = True
+            self._solo[channel.type] = channel_id
+            self._notify({'op': 'solo', 'type': channel.type, 'id': channel_id})
+            return current
+        channel.is_solo = False
+        if current == channel_id:
+            del self._solo[channel.type]
+            self._notify({'op': 'solo', 'type': channel.type, 'id': None})
+        return None
 
+    def get_all_channels_by_type(self):
         return {
-            "output_channels": output_channels,
-            "input_channels": input_channels
+            "output_channels": [ch.to_dict() for ch in self._by_type.get('output', {}).values()],
+            "input_channels": [ch.to_dict() for ch in self._by_type.get('input', {}).values()]
         }
+
+
+def main():
+    print("=== Benchmark do ChannelManager ===\n")
+
+    for channels, apps in ((100, 500), (2000, 10000)):
+        manager = ChannelManager()
+        created = [AudioChannel(f"Canal {i}", f"channel_{i}", 'output' if i % 4 else 'input') for i in range(channels)]
+        for channel in created:
+            manager._add(channel)
+        app_names = [f"app_{i}" for i in range(apps)]
+
+        start = time.perf_counter()
+        for i, app_name in enumerate(app_names):
+            manager.add_app(created[i % channels].id, app_name)
+            manager.add_app(created[(i * 7) % channels].id, app_name)
+        add_time = (time.perf_counter() - start) / (apps * 2)
+
+        start = time.perf_counter()
+        for app_name in app_names[:200]:
+            [ch for ch in manager.channels.values() if app_name in ch.connected_apps]
+        scan_time = (time.perf_counter() - start) / min(apps, 200)
+
+        start = time.perf_counter()
+        for app_name in app_names:
+            manager.get_app_channels(app_name)
+        index_time = (time.perf_counter() - start) / apps
+
+        start = time.perf_counter()
+        for channel in created[:200]:
+            manager.set_solo(channel.id, True)
+        solo_time = (time.perf_counter() - start) / 200
+
+        start = time.perf_counter()
+        for i, app_name in enumerate(app_names):
+            manager.remove_app(created[i % channels].id, app_name)
+        remove_time = (time.perf_counter() - start) / apps
+
+        start = time.perf_counter()
+        manager.get_all_channels_by_type()
+        listing = time.perf_counter() - start
+
+        print(f"{channels} canais / {apps} apps:")
+        print(f"   add_app: {add_time * 1e6:.2f} µs, remove_app: {remove_time * 1e6:.2f} µs, set_solo: {solo_time * 1e6:.2f} µs")
+        print(f"   canais de um app: varredura {scan_time * 1e6:.1f} µs vs índice {index_time * 1e6:.2f} µs")
+        print(f"   get_all_channels_by_type: {listing * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
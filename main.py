@@ -1,65 +1,501 @@
+import time
+
+PROCESS_START = time.perf_counter()
+
+import argparse
+import functools
 import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import CancelledError
 from typing import List, Dict, Any, Optional
-from src.web.Screem import Window_Service
+from src.core.Activity_Log import Activity_Log, Rotating_File_Sink
+from src.core.App_Routing import App_Router, App_Routing_Store
 from src.core.Apps_Controller import Apps_Service
+from src.core.Apps_Snapshot import Apps_Snapshot_Store
+from src.core.Audio_Backend import Audio_Backend
+from src.core.Batch_Controller import Mixer_Batch_Service
+from src.core.Com_Worker import Com_Executor, PRIORITY_CONTROL, PRIORITY_ENUMERATION, PRIORITY_ICON, init_com_thread
+from src.core.Endpoint_Inventory import Endpoint_Inventory
+from src.core.Event_Bus import Event_Bus, Webview_Event_Sink
+from src.core.Fade_Scheduler import Fade_Scheduler
+from src.core.Gain_Engine import Gain_Engine
+from src.core.Hotkeys import Hotkey_Dispatcher, Hotkey_Error, Hotkey_Store, Mixer_Hotkey_Actions, compile_bindings
+from src.core.Icon_Cache import Icon_Cache
+from src.core.Metrics import Metrics_Registry, public_methods
+from src.core.Process_Cache import Process_Metadata_Cache
+from src.core.Mixer_Store import Mixer_State_Store, restore_channels
+from src.core.Profiles import Profile_Service
+from src.core.Session_Registry import Session_Registry
+from src.core.Startup_Profiler import Startup_Profiler
 from src.core.Volume_Controller import Apps_Volume_Controller, Master_Volume_Controller
 from src.core.Device_Controller import Devices_Services
 from src.core.Virtual_Cable_Controller import Virtual_Cable_Service
+from src.core.Volume_Scheduler import Write_Behind_Scheduler
 from audio_channel import ChannelManager
 
+IMPORTS_DONE = time.perf_counter()
+
+READY_TIMEOUT = 30.0
+UNGATED_METHODS = ('initialize', 'start_background_init', 'get_activity_log', 'get_metrics', 'set_metrics_enabled', 'get_startup_profile', 'mark_startup', 'is_ready')
+STARTUP_CLIENT_PHASES = ('first_paint', 'first_data')
+COM_LOCAL_METHODS = (
+    'get_com_worker_stats', 'get_mixer_store_stats', 'get_icon_cache_stats', 'get_process_cache_stats',
+    'get_volume_scheduler_stats', 'get_fade_stats', 'get_remote_stats', 'get_meter_stats', 'get_spectrum_stats',
+    'get_hotkey_stats', 'get_routing_stats', 'get_meter_history', 'reset_meter_clips',
+    'set_app_volume', 'set_master_volume', 'set_channel_volume', 'flush_volume_updates',
+    'get_profiles', 'delete_profile', 'get_hotkeys', 'set_hotkeys', 'get_ducking_rules', 'get_ducking_state',
+    'get_audio_channels', 'create_channel', 'get_app_routes',
+)
+COM_PRIORITIES = {
+    'toggle_app_mute': PRIORITY_CONTROL,
+    'toggle_app_solo': PRIORITY_CONTROL,
+    'toggle_master_mute': PRIORITY_CONTROL,
+    'toggle_device_mute': PRIORITY_CONTROL,
+    'toggle_channel_mute': PRIORITY_CONTROL,
+    'toggle_channel_solo': PRIORITY_CONTROL,
+    'apply_batch': PRIORITY_CONTROL,
+    'switch_profile': PRIORITY_CONTROL,
+    'route_app_to_device': PRIORITY_CONTROL,
+    'route_apps_to_device': PRIORITY_CONTROL,
+    'route_channel_to_device': PRIORITY_CONTROL,
+    'reset_app_routing': PRIORITY_CONTROL,
+    'add_app_to_channel': PRIORITY_CONTROL,
+    'remove_app_from_channel': PRIORITY_CONTROL,
+    'remove_channel': PRIORITY_CONTROL,
+    'set_output_device': PRIORITY_CONTROL,
+    'set_input_device': PRIORITY_CONTROL,
+    'set_device_volume': PRIORITY_CONTROL,
+    'set_spectrum_enabled': PRIORITY_CONTROL,
+    'get_audio_master': PRIORITY_ENUMERATION,
+    'get_audio_apps': PRIORITY_ENUMERATION,
+    'get_audio_apps_delta': PRIORITY_ENUMERATION,
+    'get_master_state': PRIORITY_ENUMERATION,
+    'get_output_devices': PRIORITY_ENUMERATION,
+    'get_inputs_devices': PRIORITY_ENUMERATION,
+    'get_virtual_cables': PRIORITY_ENUMERATION,
+    'get_app_routing': PRIORITY_ENUMERATION,
+    'get_app_icon': PRIORITY_ICON,
+}
+
 class Api:
-    def __init__(self):
-        self.MasterVolumeController = Master_Volume_Controller()
-        self.ChannelManager = ChannelManager()
-        self.solo_app = None
+    def __init__(self, state_dir: Optional[str] = None, profiler: Optional[Startup_Profiler] = None, defer: bool = False):
+        self.Startup = profiler or Startup_Profiler()
+        with self.Startup.phase('api'):
+            self.Log = Activity_Log.shared()
+            self.EventBus = Event_Bus()
+            self.Metrics = Metrics_Registry.shared()
+            self.Com = Com_Executor.shared()
+            self.Remote: Optional[Any] = None
+            self.Notifications: Optional[Any] = None
+            self._state_dir = state_dir
+            self._ready = threading.Event()
+            self.Metrics.instrument(self, 'api')
+            self._route_to_com_worker()
+            self._gate_until_ready()
+        if not defer:
+            self.initialize()
+
+    def initialize(self) -> None:
+        if self._ready.is_set():
+            return
+        try:
+            with self.Startup.phase('master_volume'):
+                self.MasterVolumeController = Master_Volume_Controller()
+            with self.Startup.phase('channels'):
+                self.ChannelManager = ChannelManager()
+                self.MixerStore = Mixer_State_Store(self._state_dir)
+                self._restore_mixer_state()
+                self.GainEngine = Gain_Engine()
+                for app_name, state in self.MixerStore.state['apps'].items():
+                    self.GainEngine.seed_app(app_name, state['volume'], state['is_muted'])
+                self.GainEngine.load(self.ChannelManager.channels.values())
+                self.GainEngine.listener = self.MixerStore.record
+                self.ChannelManager.set_listener(self.MixerStore.record)
+                self.MixerStore.start()
+            with self.Startup.phase('services'):
+                from src.core.Ducking_Engine import Duck_Rule_Store, Ducking_Engine
+                from src.core.Meter_Engine import Event_Bus_Meter_Sink, Meter_Engine
+                from src.core.Spectrum_Analyzer import Event_Bus_Spectrum_Sink, Spectrum_Service
+
+                self.AppsSnapshot = Apps_Snapshot_Store()
+                self.MixerBatch = Mixer_Batch_Service(self.ChannelManager, self.MasterVolumeController, gain_engine=self.GainEngine)
+                self.Profiles = Profile_Service(self.ChannelManager, self.MixerBatch, self.GainEngine, self.MasterVolumeController)
+                self.VolumeScheduler = Write_Behind_Scheduler(self._submit_volume_update, rate_hz=60)
+                self.VolumeScheduler.start()
+                self.Fades = Fade_Scheduler(self.VolumeScheduler.submit, rate_hz=100)
+                self.Fades.start()
+                self.MeterEngine = Meter_Engine(Event_Bus_Meter_Sink(self.EventBus), channel_manager=self.ChannelManager, rate_hz=30)
+                self.Spectrum = Spectrum_Service(Event_Bus_Spectrum_Sink(self.EventBus), max_fps=30)
+                self.HotkeyStore = Hotkey_Store(os.path.join(self._state_dir, 'hotkeys.json') if self._state_dir else None)
+                self.Hotkeys = Hotkey_Dispatcher(Mixer_Hotkey_Actions(self.MixerBatch, self.Profiles, self.EventBus, self.VolumeScheduler))
+                self._load_hotkeys()
+                self.Hotkeys.start()
+                self.DuckStore = Duck_Rule_Store(os.path.join(self._state_dir, 'ducking.json') if self._state_dir else None)
+                self.Ducking = Ducking_Engine(self.GainEngine.set_ducks)
+                self._load_ducking_rules()
+                self.MeterEngine.listeners.append(self.Ducking.process)
+                self.RoutingStore = App_Routing_Store(os.path.join(self._state_dir, 'routing.json') if self._state_dir else None)
+                self.Routing = App_Router(store=self.RoutingStore, event_bus=self.EventBus)
+                self._load_routing()
+                Session_Registry.shared().listeners.append(self.Routing.on_session_added)
+            with self.Startup.phase('first_enumeration'):
+                Api.get_audio_apps(self)
+                Endpoint_Inventory.shared().get_endpoints()
+        except Exception as e:
+            self.Log.error('mixer', f"Erro ao inicializar o backend de áudio: {e}")
+        finally:
+            self._ready.set()
+
+    def start_background_init(self, on_ready: Optional[Any] = None) -> threading.Thread:
+        def run() -> None:
+            with self.Startup.phase('com_init'):
+                init_com_thread()
+            self.initialize()
+            self.EventBus.publish('backend_ready', None, {'startup_ms': self.Startup.get_report()['total_ms']})
+            if on_ready:
+                on_ready()
+
+        thread = threading.Thread(target=run, name="BackendInit", daemon=True)
+        thread.start()
+        return thread
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def mark_startup(self, phase: str) -> Optional[float]:
+        if phase not in STARTUP_CLIENT_PHASES or any(p['name'] == phase for p in self.Startup.get_report()['phases']):
+            return None
+        elapsed = self.Startup.mark(phase)
+        if phase == 'first_data':
+            report = self.Startup.get_report()
+            self.Log.info('startup', self.Startup.format_report(), report)
+            if report['over_budget']:
+                self.Log.warning('startup', f"Fases de inicialização acima do orçamento: {', '.join(report['over_budget'])}")
+        return elapsed
+
+    def get_startup_profile(self) -> Dict[str, Any]:
+        return self.Startup.get_report()
+
+    def get_com_worker_stats(self) -> Dict[str, Any]:
+        return self.Com.get_stats()
+
+    def _route_to_com_worker(self) -> None:
+        for name in public_methods(self):
+            if name in UNGATED_METHODS or name in COM_LOCAL_METHODS:
+                continue
+            priority = COM_PRIORITIES.get(name, PRIORITY_ENUMERATION if name.startswith('get_') else PRIORITY_CONTROL)
+            setattr(self, name, self._on_com_worker(name, getattr(self, name), priority))
+
+    def _on_com_worker(self, name: str, method: Any, priority: int) -> Any:
+        executor = self.Com
+        coalesce = priority != PRIORITY_CONTROL
+
+        @functools.wraps(method)
+        def routed(*args: Any, **kwargs: Any) -> Any:
+            key = (name,) + args if coalesce and not kwargs else None
+            try:
+                hash(key)
+            except TypeError:
+                key = None
+            return executor.call(method, *args, priority=priority, key=key, **kwargs)
+
+        return routed
+
+    def _submit_volume_update(self, key: Any, volume_level: float) -> None:
+        try:
+            self.Com.call(self._apply_volume_update, key, volume_level, priority=PRIORITY_CONTROL, key=('volume', key), supersede=True)
+        except CancelledError:
+            pass
+
+    def _gate_until_ready(self) -> None:
+        for name in public_methods(self):
+            if name not in UNGATED_METHODS:
+                setattr(self, name, self._gated(getattr(self, name)))
+
+    def _gated(self, method: Any) -> Any:
+        ready = self._ready
+
+        @functools.wraps(method)
+        def gated(*args: Any, **kwargs: Any) -> Any:
+            if not ready.is_set():
+                ready.wait(READY_TIMEOUT)
+            return method(*args, **kwargs)
+
+        return gated
+
+    def _restore_mixer_state(self) -> None:
+        try:
+            state = self.MixerStore.load()
+            restored = restore_channels(self.ChannelManager, state)
+            stats = self.MixerStore.get_stats()
+            self.Log.info('mixer', f"Estado do mixer restaurado: {restored} canais, {stats['replayed']} registros do journal em {stats['load_ms']:.1f} ms")
+        except Exception as e:
+            self.Log.error('mixer', f"Erro ao restaurar estado do mixer: {e}")
+
+    def _load_hotkeys(self) -> None:
+        try:
+            count = self.Hotkeys.set_bindings(self.HotkeyStore.load())
+            if count:
+                self.Log.info('hotkeys', f"{count} atalhos globais carregados")
+        except Hotkey_Error as e:
+            self.Log.error('hotkeys', f"Erro ao carregar atalhos globais: {e}")
+
+    def _load_ducking_rules(self) -> None:
+        from src.core.Ducking_Engine import Duck_Rule_Error
+
+        try:
+            count = self.Ducking.set_rules(self.DuckStore.load())
+            if count:
+                self.Log.info('ducking', f"{count} regras de ducking carregadas")
+        except Duck_Rule_Error as e:
+            self.Log.error('ducking', f"Erro ao carregar regras de ducking: {e}")
+
+    def _load_routing(self) -> None:
+        count = self.Routing.load()
+        if count:
+            self.Log.info('routing', f"{count} regras de roteamento carregadas")
+
+    def get_metrics(self, reset: bool = False) -> Dict[str, Any]:
+        return self.Metrics.snapshot(reset)
+
+    def set_metrics_enabled(self, enabled: bool) -> bool:
+        self.Metrics.enabled = bool(enabled)
+        return self.Metrics.enabled
+
+    def get_mixer_store_stats(self) -> Dict[str, Any]:
+        return self.MixerStore.get_stats()
+
+    def get_activity_log(self, after_id: int = 0, limit: int = 100, level: Optional[str] = None) -> Dict[str, Any]:
+        return self.Log.query(after_id, max(1, min(int(limit), 1000)), level)
 
     def get_audio_apps(self) -> List[Dict[str, Any]]:
         apps = Apps_Service.get_all_apps()
+        self.GainEngine.sync_apps(app['name'] for app in apps)
         for app in apps:
-            app['is_solo'] = (app['name'] == self.solo_app)
+            app['is_solo'] = (app['name'] == self.MixerBatch.solo_app)
+            state = self.GainEngine.get_app_state(app['name'])
+            if state:
+                app.update(state)
+        self.AppsSnapshot.update(apps)
         return apps
 
-    def set_app_volume(self, app_name: str, volume_level: float) -> None:
+    def get_audio_apps_delta(self, since_version: Optional[int] = None) -> Dict[str, Any]:
         try:
-            controller = Apps_Volume_Controller(f"{app_name}.exe")
-            controller.set_volume(volume_level)
+            self.get_audio_apps()
         except Exception as e:
-            print(f"Erro inesperado ao definir volume para {app_name}: {e}")
+            self.Log.error('apps', f"Erro ao atualizar snapshot de apps: {e}")
+        return self.AppsSnapshot.get_delta(since_version)
+
+    def get_app_icon(self, icon_id: str) -> Optional[str]:
+        try:
+            return Apps_Service.get_app_icon(icon_id)
+        except Exception as e:
+            self.Log.error('apps', f"Erro ao obter ícone '{icon_id}': {e}")
+            return None
+
+    def get_icon_cache_stats(self) -> Dict[str, int]:
+        return Icon_Cache.shared().get_stats()
+
+    def get_process_cache_stats(self) -> Dict[str, Any]:
+        return Process_Metadata_Cache.shared().get_stats()
+
+    def set_app_volume(self, app_name: str, volume_level: float, fade_ms: float = 0, curve: str = 'linear') -> None:
+        self._set_volume(('app', app_name), volume_level, fade_ms, curve)
+
+    def flush_volume_updates(self) -> int:
+        return self.VolumeScheduler.flush()
+
+    def get_volume_scheduler_stats(self) -> Dict[str, int]:
+        return self.VolumeScheduler.get_stats()
+
+    def get_fade_stats(self) -> Dict[str, Any]:
+        return self.Fades.get_stats()
+
+    def get_remote_stats(self) -> Dict[str, Any]:
+        return self.Remote.get_stats() if self.Remote is not None else {}
+
+    def _set_volume(self, key: Any, volume_level: float, fade_ms: float, curve: str) -> None:
+        if fade_ms and fade_ms > 0:
+            self.Com.submit(self._start_fade, key, volume_level, fade_ms / 1000.0, curve, priority=PRIORITY_CONTROL)
+            return
+        self.Fades.cancel(key)
+        self.VolumeScheduler.submit(key, volume_level)
+
+    def _start_fade(self, key: Any, volume_level: float, duration: float, curve: str) -> None:
+        try:
+            start = self.Fades.get_value(key)
+            if start is None:
+                target, target_id = key
+                if target == 'device':
+                    start = self.MixerBatch.read('device', target_id[0], 'volume', target_id[1])
+                else:
+                    start = self.MixerBatch.read(target, target_id or '', 'volume')
+            self.Fades.fade(key, start, max(0, min(100, volume_level)), duration, curve)
+        except Exception as e:
+            self.Log.error('mixer', f"Erro ao iniciar fade de {key}: {e}")
+            self.VolumeScheduler.submit(key, volume_level)
+
+    def reset_meter_clips(self) -> None:
+        self.MeterEngine.reset_clips()
+
+    def get_meter_history(self, key: str, count: Optional[int] = None) -> List[float]:
+        return self.MeterEngine.get_history(key, count)
+
+    def get_meter_stats(self) -> Dict[str, Any]:
+        return self.MeterEngine.get_stats()
+
+    def set_spectrum_enabled(self, enabled: bool) -> Dict[str, bool]:
+        if not enabled:
+            self.Spectrum.stop()
+            return {'main_output': False, 'main_input': False}
+        return {channel_id: self.Spectrum.start(channel_id) for channel_id in ('main_output', 'main_input')}
+
+    def get_spectrum_stats(self) -> Dict[str, Dict[str, int]]:
+        return self.Spectrum.get_stats()
+
+    def _apply_volume_update(self, key: Any, volume_level: float) -> None:
+        target, target_id = key
+
+        if target == 'app':
+            if self.GainEngine.governs(target_id):
+                self.GainEngine.set_app_volume(target_id, volume_level)
+                return
+            try:
+                controller = Apps_Volume_Controller(f"{target_id}.exe")
+                controller.set_volume(volume_level)
+            except Exception as e:
+                self.Log.error('apps', f"Erro inesperado ao definir volume para {target_id}: {e}")
+        elif target == 'master':
+            self.MasterVolumeController.set_volume(volume_level)
+        elif target == 'device':
+            device_id, device_type = target_id
+            Devices_Services.set_device_volume(device_id, device_type, volume_level)
+        elif target == 'channel':
+            try:
+                channel = self.ChannelManager.get_channel(target_id)
+                if channel:
+                    channel.volume = max(0, min(100, volume_level))
+                    self.GainEngine.update_channel(channel)
+                    self.Log.info('channels', f"Volume do canal '{channel.name}' definido para {channel.volume}%")
+                else:
+                    self.Log.warning('channels', f"Canal '{target_id}' não encontrado")
+            except Exception as e:
+                self.Log.error('channels', f"Erro ao definir volume do canal '{target_id}': {e}")
 
     def toggle_app_mute(self, app_name: str) -> Optional[bool]:
+        state = self.GainEngine.get_app_state(app_name)
+        if state is not None:
+            self.GainEngine.set_app_mute(app_name, not state['is_muted'])
+            return not state['is_muted']
         controller = Apps_Volume_Controller(f"{app_name}.exe")
         return controller.toggle_mute()
 
     def toggle_app_solo(self, app_name: str) -> Optional[bool]:
         try:
-            all_apps = Apps_Service.get_all_apps()
-            app_names = [app['name'] for app in all_apps]
+            enable = self.MixerBatch.solo_app != app_name
+            report = self.apply_batch([{'target': 'app', 'id': app_name, 'action': 'solo', 'value': enable}])
+            result = report['results'][0]
 
-            if app_name not in app_names:
-                print(f"App '{app_name}' não encontrado")
+            if not result['ok']:
+                self.Log.error('apps', f"Erro ao alternar solo do app '{app_name}': {result['error']}")
                 return None
 
-            if self.solo_app == app_name:
-                self.solo_app = None
-                for other_app in app_names:
-                    controller = Apps_Volume_Controller(f"{other_app}.exe")
-                    controller.set_mute(False)
-                print(f"Solo desativado de '{app_name}'")
-                return False
-            else:
-                self.solo_app = app_name
-                for other_app in app_names:
-                    controller = Apps_Volume_Controller(f"{other_app}.exe")
-                    if other_app == app_name:
-                        controller.set_mute(False)
-                    else:
-                        controller.set_mute(True)
-                print(f"Solo ativado em '{app_name}'")
-                return True
-        except Exception as e:
-            print(f"Erro ao alternar solo do app '{app_name}': {e}")
+            self.Log.info('apps', f"Solo {'ativado em' if enable else 'desativado de'} '{app_name}'")
+            return enable
+        except Exception as e:
+            self.Log.error('apps', f"Erro ao alternar solo do app '{app_name}': {e}")
+            return None
+
+    def apply_batch(self, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        try:
+            return self.MixerBatch.apply(ops)
+        except Exception as e:
+            self.Log.error('mixer', f"Erro ao aplicar lote de operações: {e}")
+            return {
+                'results': [{'index': i, 'ok': False, 'applied': 0, 'skipped': 0, 'error': str(e)} for i in range(len(ops))],
+                'applied': 0,
+                'skipped': 0
+            }
+
+    def get_profiles(self) -> Dict[str, Any]:
+        try:
+            return {'profiles': self.Profiles.store.list(), 'active': self.Profiles.active}
+        except Exception as e:
+            self.Log.error('profiles', f"Erro ao listar perfis: {e}")
+            return {'profiles': [], 'active': None}
+
+    def save_profile(self, profile_name: str) -> bool:
+        try:
+            self.flush_volume_updates()
+            self.Profiles.save(profile_name)
+            self.Log.info('profiles', f"Perfil '{profile_name}' salvo")
+            return True
+        except Exception as e:
+            self.Log.error('profiles', f"Erro ao salvar perfil '{profile_name}': {e}")
+            return False
+
+    def switch_profile(self, profile_name: str) -> Optional[Dict[str, Any]]:
+        try:
+            self.flush_volume_updates()
+            report = self.Profiles.switch(profile_name)
+            self.Log.info('profiles', f"Perfil '{profile_name}' aplicado: {report['applied']} alterações em {report['total_ms']:.1f} ms")
+            self.EventBus.publish('profile_switched', None, {'profile': profile_name})
+            return report
+        except Exception as e:
+            self.Log.error('profiles', f"Erro ao aplicar perfil '{profile_name}': {e}")
             return None
 
+    def delete_profile(self, profile_name: str) -> bool:
+        try:
+            return self.Profiles.store.delete(profile_name)
+        except Exception as e:
+            self.Log.error('profiles', f"Erro ao remover perfil '{profile_name}': {e}")
+            return False
+
+    def get_hotkeys(self) -> List[Dict[str, Any]]:
+        return self.Hotkeys.get_bindings()
+
+    def set_hotkeys(self, bindings: List[Dict[str, Any]]) -> Dict[str, Any]:
+        try:
+            compile_bindings(bindings)
+            self.HotkeyStore.save(bindings)
+            count = self.Hotkeys.set_bindings(bindings)
+            self.Log.info('hotkeys', f"{count} atalhos globais configurados")
+            return {'ok': True, 'count': count, 'error': None}
+        except Hotkey_Error as e:
+            self.Log.warning('hotkeys', f"Atalhos globais rejeitados: {e}")
+            return {'ok': False, 'count': 0, 'error': str(e)}
+        except Exception as e:
+            self.Log.error('hotkeys', f"Erro ao salvar atalhos globais: {e}")
+            return {'ok': False, 'count': 0, 'error': str(e)}
+
+    def get_hotkey_stats(self) -> Dict[str, Any]:
+        return self.Hotkeys.get_stats()
+
+    def get_ducking_rules(self) -> List[Dict[str, Any]]:
+        return self.DuckStore.load()
+
+    def set_ducking_rules(self, rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+        from src.core.Ducking_Engine import Duck_Rule_Error, compile_rules
+
+        try:
+            compile_rules(rules)
+            self.DuckStore.save(rules)
+            count = self.Ducking.set_rules(rules)
+            self.Log.info('ducking', f"{count} regras de ducking ativas")
+            return {'ok': True, 'count': count, 'error': None}
+        except Duck_Rule_Error as e:
+            self.Log.warning('ducking', f"Regras de ducking rejeitadas: {e}")
+            return {'ok': False, 'count': 0, 'error': str(e)}
+        except Exception as e:
+            self.Log.error('ducking', f"Erro ao salvar regras de ducking: {e}")
+            return {'ok': False, 'count': 0, 'error': str(e)}
+
+    def get_ducking_state(self) -> Dict[str, Any]:
+        return {'rules': self.Ducking.get_state(), 'stats': self.Ducking.get_stats()}
+
     def get_audio_master(self) -> int:
         return self.MasterVolumeController.volume
 
@@ -69,9 +505,9 @@ class Api:
     def get_master_state(self) -> Dict[str, Any]:
         return self.MasterVolumeController.get_state()
 
-    def set_master_volume(self, volume_level: float) -> int:
-        self.MasterVolumeController.set_volume(volume_level)
-        return self.MasterVolumeController.volume
+    def set_master_volume(self, volume_level: float, fade_ms: float = 0, curve: str = 'linear') -> int:
+        self._set_volume(('master', None), volume_level, fade_ms, curve)
+        return int(max(0, min(100, volume_level)))
 
     def get_inputs_devices(self) -> List[Dict[str, Any]]:
         return Devices_Services.get_input_devices()
@@ -83,30 +519,34 @@ class Api:
         try:
             service = Devices_Services()
             service.set_output_device(device_id)
-            print(f"Dispositivo de saída alterado: {device_id}")
+            self.Log.info('devices', f"Dispositivo de saída alterado: {device_id}")
         except Exception as e:
-            print(f"Erro inesperado ao alterar dispositivo de saída: {e}")
+            self.Log.error('devices', f"Erro inesperado ao alterar dispositivo de saída: {e}")
 
     def set_input_device(self, device_id: str) -> None:
         try:
             service = Devices_Services()
             service.set_input_device(device_id)
-            print(f"Dispositivo de entrada alterado: {device_id}")
+            self.Log.info('devices', f"Dispositivo de entrada alterado: {device_id}")
         except Exception as e:
-            print(f"Erro inesperado ao alterar dispositivo de entrada: {e}")
+            self.Log.error('devices', f"Erro inesperado ao alterar dispositivo de entrada: {e}")
 
-    def set_device_volume(self, device_id: str, device_type: str, volume_level: float) -> bool:
+    def set_device_volume(self, device_id: str, device_type: str, volume_level: float, fade_ms: float = 0, curve: str = 'linear') -> bool:
         try:
-            return Devices_Services.set_device_volume(device_id, device_type, volume_level)
+            if not Endpoint_Inventory.shared().get(device_id, device_type):
+                self.Log.warning('devices', f"Dispositivo {device_id} não encontrado")
+                return False
+            self._set_volume(('device', (device_id, device_type)), volume_level, fade_ms, curve)
+            return True
         except Exception as e:
-            print(f"Erro ao definir volume do dispositivo {device_id}: {e}")
+            self.Log.error('devices', f"Erro ao definir volume do dispositivo {device_id}: {e}")
             return False
 
     def toggle_device_mute(self, device_id: str, device_type: str) -> Optional[bool]:
         try:
             return Devices_Services.toggle_device_mute(device_id, device_type)
         except Exception as e:
-            print(f"Erro ao alternar mute do dispositivo {device_id}: {e}")
+            self.Log.error('devices', f"Erro ao alternar mute do dispositivo {device_id}: {e}")
             return None
 
     def get_audio_channels(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -117,136 +557,358 @@ class Api:
             channel = self.ChannelManager.create_channel(channel_name, channel_type)
             return channel.to_dict()
         except Exception as e:
-            print(f"Erro ao criar canal '{channel_name}': {e}")
+            self.Log.error('channels', f"Erro ao criar canal '{channel_name}': {e}")
             return {}
 
     def remove_channel(self, channel_id: str) -> bool:
         try:
-            return self.ChannelManager.remove_channel(channel_id)
+            removed = self.ChannelManager.remove_channel(channel_id)
+            if removed:
+                self.GainEngine.remove_channel(channel_id)
+            return removed
         except Exception as e:
-            print(f"Erro ao remover canal '{channel_id}': {e}")
+            self.Log.error('channels', f"Erro ao remover canal '{channel_id}': {e}")
             return False
 
-    def set_channel_volume(self, channel_id: str, volume_level: float) -> None:
-        try:
-            channel = self.ChannelManager.get_channel(channel_id)
-            if channel:
-                channel.volume = max(0, min(100, volume_level))
-                print(f"Volume do canal '{channel.name}' definido para {channel.volume}%")
-            else:
-                print(f"Canal '{channel_id}' não encontrado")
-        except Exception as e:
-            print(f"Erro ao definir volume do canal '{channel_id}': {e}")
+    def set_channel_volume(self, channel_id: str, volume_level: float, fade_ms: float = 0, curve: str = 'linear') -> None:
+        self._set_volume(('channel', channel_id), volume_level, fade_ms, curve)
 
     def toggle_channel_mute(self, channel_id: str) -> Optional[bool]:
         try:
             channel = self.ChannelManager.get_channel(channel_id)
             if channel:
                 channel.is_muted = not channel.is_muted
+                self.GainEngine.update_channel(channel)
                 status = "mutado" if channel.is_muted else "desmutado"
-                print(f"Canal '{channel.name}' foi {status}")
+                self.Log.info('channels', f"Canal '{channel.name}' foi {status}")
                 return channel.is_muted
             else:
-                print(f"Canal '{channel_id}' não encontrado")
+                self.Log.warning('channels', f"Canal '{channel_id}' não encontrado")
                 return None
         except Exception as e:
-            print(f"Erro ao alternar mute do canal '{channel_id}': {e}")
+            self.Log.error('channels', f"Erro ao alternar mute do canal '{channel_id}': {e}")
             return None
 
     def toggle_channel_solo(self, channel_id: str) -> Optional[bool]:
         try:
             channel = self.ChannelManager.get_channel(channel_id)
             if not channel:
-                print(f"Canal '{channel_id}' não encontrado")
+                self.Log.warning('channels', f"Canal '{channel_id}' não encontrado")
                 return None
 
-            if channel.is_solo:
-                channel.is_solo = False
-                for ch in self.ChannelManager.channels.values():
-                    if ch.type == channel.type and ch.id != channel_id:
-                        ch.is_muted = False
-                print(f"Solo desativado do canal '{channel.name}'")
-                return False
-            else:
-                for ch in self.ChannelManager.channels.values():
-                    if ch.type == channel.type:
-                        if ch.id == channel_id:
-                            ch.is_solo = True
-                            ch.is_muted = False
-                        else:
-                            ch.is_solo = False
-                            ch.is_muted = True
-                print(f"Solo ativado no canal '{channel.name}'")
-                return True
-        except Exception as e:
-            print(f"Erro ao alternar solo do canal '{channel_id}': {e}")
+            enable = not channel.is_solo
+            report = self.apply_batch([{'target': 'channel', 'id': channel_id, 'action': 'solo', 'value': enable}])
+            result = report['results'][0]
+
+            if not result['ok']:
+                self.Log.error('channels', f"Erro ao alternar solo do canal '{channel_id}': {result['error']}")
+                return None
+
+            self.Log.info('channels', f"Solo {'ativado no' if enable else 'desativado do'} canal '{channel.name}'")
+            return enable
+        except Exception as e:
+            self.Log.error('channels', f"Erro ao alternar solo do canal '{channel_id}': {e}")
             return None
 
     def add_app_to_channel(self, channel_id: str, app_name: str) -> bool:
         try:
             channel = self.ChannelManager.get_channel(channel_id)
             if channel:
-                if app_name not in channel.connected_apps:
-                    channel.connected_apps.append(app_name)
-                    print(f"App '{app_name}' adicionado ao canal '{channel.name}'")
+                if self.ChannelManager.add_app(channel_id, app_name):
+                    self.GainEngine.add_member(channel_id, app_name)
+                    self.Log.info('channels', f"App '{app_name}' adicionado ao canal '{channel.name}'")
                     return True
-            print(f"Canal '{channel_id}' não encontrado")
+            self.Log.warning('channels', f"Canal '{channel_id}' não encontrado")
             return False
         except Exception as e:
-            print(f"Erro ao adicionar app ao canal: {e}")
+            self.Log.error('channels', f"Erro ao adicionar app ao canal: {e}")
             return False
 
     def remove_app_from_channel(self, channel_id: str, app_name: str) -> bool:
         try:
             channel = self.ChannelManager.get_channel(channel_id)
             if channel:
-                if app_name in channel.connected_apps:
-                    channel.connected_apps.remove(app_name)
-                    print(f"App '{app_name}' removido do canal '{channel.name}'")
+                if self.ChannelManager.remove_app(channel_id, app_name):
+                    self.GainEngine.remove_member(channel_id, app_name)
+                    self.Log.info('channels', f"App '{app_name}' removido do canal '{channel.name}'")
                     return True
-            print(f"Canal '{channel_id}' não encontrado")
+            self.Log.warning('channels', f"Canal '{channel_id}' não encontrado")
             return False
         except Exception as e:
-            print(f"Erro ao remover app do canal: {e}")
+            self.Log.error('channels', f"Erro ao remover app do canal: {e}")
             return False
 
     def get_virtual_cables(self) -> Dict[str, List[Dict[str, Any]]]:
         try:
             return Virtual_Cable_Service.get_virtual_cables()
         except Exception as e:
-            print(f"Erro ao obter cabos virtuais: {e}")
+            self.Log.error('routing', f"Erro ao obter cabos virtuais: {e}")
             return {'output': [], 'input': []}
 
     def route_app_to_device(self, app_name: str, device_id: str) -> bool:
         try:
-            success = Virtual_Cable_Service.route_app_to_device(app_name, device_id)
-            if success:
-                print(f"App '{app_name}' roteado para dispositivo '{device_id}'")
-            return success
+            self.Routing.route_apps([app_name], device_id)
+            self.Log.info('routing', f"App '{app_name}' roteado para dispositivo '{device_id}'")
+            return True
+        except ValueError as e:
+            self.Log.warning('routing', str(e))
+            return False
         except Exception as e:
-            print(f"Erro ao rotear app '{app_name}': {e}")
+            self.Log.error('routing', f"Erro ao rotear app '{app_name}': {e}")
             return False
 
+    def route_apps_to_device(self, app_names: List[str], device_id: str) -> Dict[str, Any]:
+        try:
+            result = self.Routing.route_apps(app_names, device_id)
+            self.Log.info('routing', f"{result['apps']} apps roteados para dispositivo '{device_id}'")
+            return dict(result, ok=True)
+        except ValueError as e:
+            self.Log.warning('routing', str(e))
+            return {'ok': False, 'error': str(e)}
+        except Exception as e:
+            self.Log.error('routing', f"Erro ao rotear apps: {e}")
+            return {'ok': False, 'error': str(e)}
+
+    def route_channel_to_device(self, channel_id: str, device_id: str) -> Dict[str, Any]:
+        try:
+            channel = self.ChannelManager.get_channel(channel_id)
+            if not channel:
+                self.Log.warning('channels', f"Canal '{channel_id}' não encontrado")
+                return {'ok': False, 'error': f"Canal '{channel_id}' não encontrado"}
+            result = self.Routing.route_apps(channel.connected_apps, device_id, channel.type)
+            if channel.type == 'input':
+                channel.input_device_id = device_id
+            else:
+                channel.output_device_id = device_id
+            self.Log.info('routing', f"Canal '{channel.name}' roteado para dispositivo '{device_id}' ({result['apps']} apps)")
+            return dict(result, ok=True)
+        except ValueError as e:
+            self.Log.warning('routing', str(e))
+            return {'ok': False, 'error': str(e)}
+        except Exception as e:
+            self.Log.error('routing', f"Erro ao rotear canal '{channel_id}': {e}")
+            return {'ok': False, 'error': str(e)}
+
     def get_app_routing(self, app_name: str) -> Optional[Dict[str, Any]]:
         try:
-            return Virtual_Cable_Service.get_app_routing(app_name)
+            return self.Routing.get_route(app_name)
         except Exception as e:
-            print(f"Erro ao obter roteamento do app '{app_name}': {e}")
+            self.Log.error('routing', f"Erro ao obter roteamento do app '{app_name}': {e}")
             return None
 
+    def get_app_routes(self) -> List[Dict[str, str]]:
+        return self.Routing.get_routes()
+
     def reset_app_routing(self, app_name: str) -> bool:
         try:
-            return Virtual_Cable_Service.reset_app_routing(app_name)
+            self.Routing.reset_apps([app_name])
+            self.Log.info('routing', f"Roteamento do app '{app_name}' voltou ao dispositivo padrão")
+            return True
         except Exception as e:
-            print(f"Erro ao resetar roteamento do app '{app_name}': {e}")
+            self.Log.error('routing', f"Erro ao resetar roteamento do app '{app_name}': {e}")
             return False
 
-def main() -> None:
-    api = Api()
+    def get_routing_stats(self) -> Dict[str, Any]:
+        return self.Routing.get_stats()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sonus Mixer")
+    parser.add_argument('--simulate', action='store_true', help="usa o backend de áudio simulado em memória")
+    parser.add_argument('--sessions', type=int, default=20, help="sessões de áudio simuladas")
+    parser.add_argument('--outputs', type=int, default=4, help="dispositivos de saída simulados")
+    parser.add_argument('--inputs', type=int, default=2, help="dispositivos de entrada simulados")
+    parser.add_argument('--virtual-cables', type=int, default=1, help="cabos virtuais simulados")
+    parser.add_argument('--churn', type=float, default=0.0, help="sessões criadas/encerradas por segundo")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="latência simulada por chamada de áudio")
+    parser.add_argument('--state-dir', help="diretório do estado persistido do mixer")
+    parser.add_argument('--activity-log', nargs='?', const='', help="grava o log de atividades em arquivo rotativo (caminho opcional)")
+    parser.add_argument('--no-metrics', action='store_true', help="desliga a instrumentação de latência")
+    parser.add_argument('--metrics-dump', type=float, default=0.0, help="registra as métricas no log de atividades a cada N segundos")
+    parser.add_argument('--remote', type=int, nargs='?', const=0, help="abre o controle remoto HTTP/WebSocket (porta opcional)")
+    parser.add_argument('--remote-host', default='127.0.0.1', help="endereço do controle remoto")
+    parser.add_argument('--remote-token', help="token exigido pelo controle remoto (gerado e registrado no log se omitido)")
+    parser.add_argument('--headless', action='store_true', help="roda só o controle remoto, sem abrir a janela")
+    parser.add_argument('--benchmark', action='store_true', help="mede a Api sem abrir a janela")
+    parser.add_argument('--rounds', type=int, default=20, help="repetições de cada chamada no benchmark")
+    return parser.parse_args(argv)
+
+def run_benchmark(api: Api, rounds: int) -> None:
+    def measure(label: str, call: Any) -> None:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            call()
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        print(f"{label:<28} p50 {timings[len(timings) // 2]:8.2f} ms   max {timings[-1]:8.2f} ms")
+
+    apps = api.get_audio_apps()
+    outputs = api.get_output_devices()
+    app_names = [app['name'] for app in apps] or ['']
+    device = outputs[0] if outputs else {'id': '', 'type': 'output'}
+    version = api.AppsSnapshot.get_snapshot()['version']
+
+    print(f"=== Benchmark da Api ({Audio_Backend.shared().name}: {len(apps)} apps, {len(outputs)} saídas) ===\n")
+    measure("get_audio_apps", api.get_audio_apps)
+    measure("get_audio_apps_delta", lambda: api.get_audio_apps_delta(version))
+    measure("toggle_app_solo", lambda: api.toggle_app_solo(app_names[0]))
+    measure("get_output_devices", api.get_output_devices)
+    measure("get_virtual_cables", api.get_virtual_cables)
+    measure("set_device_volume + flush", lambda: (api.set_device_volume(device['id'], device['type'], 40), api.flush_volume_updates()))
+
+    start = time.perf_counter()
+    for name in app_names:
+        api.set_app_volume(name, 20, fade_ms=300, curve='equal_power')
+    fades = api.get_fade_stats()
+    while fades['started'] < len(app_names) or fades['active']:
+        time.sleep(0.005)
+        fades = api.get_fade_stats()
+    api.flush_volume_updates()
+    print(f"{'fade de todos os apps':<28} {(time.perf_counter() - start) * 1000:8.2f} ms   "
+          f"{fades['writes']} escritas, {fades['busy_ms_total'] / max(fades['ticks'], 1):.3f} ms por tick")
+    measure("meter tick", api.MeterEngine.tick)
+    api.Ducking.set_rules([{'id': 'voz', 'triggers': [f"app:{app_names[0]}", 'channel:main_input'], 'targets': app_names[1:]}])
+    measure("meter tick + ducking", api.MeterEngine.tick)
+    measure("apply_batch (todos os apps)", lambda: api.apply_batch([
+        {'target': 'app', 'id': name, 'action': 'volume', 'value': 50} for name in app_names
+    ]))
+
+    from src.core.Hotkeys import Fake_Key_Source
+
+    keys = Fake_Key_Source()
+    api.Hotkeys.set_bindings([
+        {'keys': 'ctrl+shift+m', 'action': 'toggle_mute', 'target': 'master'},
+        {'keys': 'f13', 'action': 'push_to_talk', 'target': 'channel', 'id': 'main_input'},
+    ])
+    api.Hotkeys.start(keys)
+    for _ in range(rounds):
+        keys.tap('ctrl+shift+m')
+        keys.tap('f13', hold=0.002)
+        time.sleep(0.005)
+    time.sleep(0.05)
+    latency = api.get_hotkey_stats()['latency']
+    print(f"{'atalho -> ação':<28} p50 {latency['p50_ms']:8.2f} ms   max {latency['max_ms']:8.2f} ms")
+
+    ducking = api.Ducking.get_stats()
+    print(f"\nDucking: {ducking['ticks']} ticks, {ducking['writes']} lotes de escrita, {ducking['apps_written']} ganhos, "
+          f"{api.GainEngine.get_stats()['ducked_apps']} apps atenuados")
+
+    from src.core.Simulated_Backend import Simulated_Backend
+
+    backend = Audio_Backend.shared()
+    if isinstance(backend, Simulated_Backend):
+        print(f"\nChamadas ao backend: {backend.get_stats()['calls']}")
+
+    series = api.get_metrics()['series']
+    if series:
+        print("\nMétricas do backend:")
+        for name, stats in series.items():
+            if not name.startswith('api.'):
+                print(f"{name:<28} {stats['count']:6d}x  p50 {stats['p50_ms']:8.3f} ms   p95 {stats['p95_ms']:8.3f} ms")
+
+def shutdown(api: Api) -> None:
+    api.Metrics.stop_dump()
+    for name in ('Remote', 'Notifications', 'Hotkeys', 'MeterEngine'):
+        service = getattr(api, name, None)
+        if service is not None:
+            service.stop()
+    ducking = getattr(api, 'Ducking', None)
+    if ducking is not None:
+        ducking.release_all()
+    for name in ('Fades', 'VolumeScheduler', 'MixerStore'):
+        service = getattr(api, name, None)
+        if service is not None:
+            service.stop()
+    api.Com.stop()
+    Activity_Log.shared().stop()
 
-    window = Window_Service("Sonus Mixer", "src/web/index.html", js_api=api, icon="src/web/assets/icon.ico")
-    window.create_window()
+def main() -> None:
+    args = parse_args()
+    profiler = Startup_Profiler(PROCESS_START)
+    profiler.record('imports', PROCESS_START, IMPORTS_DONE)
+    Metrics_Registry.shared().enabled = not args.no_metrics
+
+    if args.simulate:
+        from src.core.Simulated_Backend import Simulated_Backend
+
+        Audio_Backend.set_shared(Simulated_Backend(
+            sessions=args.sessions,
+            outputs=args.outputs,
+            inputs=args.inputs,
+            virtual_cables=args.virtual_cables,
+            churn_rate=args.churn,
+            latency=args.latency_ms / 1000.0
+        ))
+
+    state_dir = args.state_dir
+    if state_dir is None and args.simulate:
+        state_dir = os.path.join(tempfile.gettempdir(), 'SonusMixer-simulated')
+
+    sink = Rotating_File_Sink(args.activity_log or None) if args.activity_log is not None else None
+    Activity_Log.set_shared(Activity_Log(sink=sink, echo=not args.benchmark))
+    Activity_Log.shared().start()
+
+    api = Api(state_dir, profiler, defer=not args.benchmark)
+    if args.metrics_dump > 0:
+        api.Metrics.start_dump(args.metrics_dump)
+
+    if args.benchmark:
+        print(profiler.format_report() + "\n")
+        run_benchmark(api, args.rounds)
+        shutdown(api)
+        return
+
+    if args.headless and args.remote is None:
+        args.remote = 0
+    if args.remote is not None:
+        from src.core.Remote_Server import REMOTE_DEFAULT_PORT, Remote_Server
+
+        api.Remote = Remote_Server(api, args.remote_host, args.remote or REMOTE_DEFAULT_PORT, args.remote_token)
+        try:
+            api.Remote.start()
+            api.EventBus.subscribe(api.Remote.broadcast)
+        except OSError as e:
+            Activity_Log.shared().error('remote', str(e))
+            api.Remote = None
+
+    def on_ready() -> None:
+        api.MeterEngine.start()
+        if sys.platform == 'win32':
+            from src.core.Hotkeys import Windows_Keyboard_Hook
+
+            api.Hotkeys.start(Windows_Keyboard_Hook())
+        if Audio_Backend.shared().supports_notifications:
+            from src.core.Audio_Notifications import Audio_Notification_Service
+            from src.core.Command_Host import Command_Host_Pool
+
+            api.Notifications = Audio_Notification_Service(api.EventBus, gain_engine=api.GainEngine)
+            if not api.Notifications.start():
+                api.Notifications.stop()
+                api.Notifications = None
+            threading.Thread(target=Command_Host_Pool.shared().warm_up, name="CommandHostWarmUp", daemon=True).start()
+
+    if args.headless:
+        api.EventBus.start()
+        api.start_background_init(on_ready)
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            pass
+        shutdown(api)
+        return
+
+    with profiler.phase('window'):
+        from src.web.Screem import Window_Service
+
+        window = Window_Service("Sonus Mixer", "src/web/index.html", js_api=api, icon="src/web/assets/icon.ico")
+        webview_window = window.create_window()
+
+    api.EventBus.subscribe(Webview_Event_Sink(webview_window))
+    api.EventBus.start()
+    api.start_background_init(on_ready)
     window.start()
+    shutdown(api)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
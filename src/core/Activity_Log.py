@@ -0,0 +1,282 @@
+import io
+import itertools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+Activity_Entry = Dict[str, Any]
+_Pending_Entry = Tuple[float, str, str, str, Optional[Dict[str, Any]]]
+
+ACTIVITY_LEVELS = ('info', 'warning', 'error')
+
+
+def _default_log_path() -> str:
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'SonusMixer', 'logs', 'activity.log')
+
+
+class Rotating_File_Sink:
+    def __init__(self, path: Optional[str] = None, max_bytes: int = 1024 * 1024, backups: int = 3) -> None:
+        self.path = path if path is not None else _default_log_path()
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._file: Optional[io.TextIOWrapper] = None
+
+    def write(self, entries: List[Activity_Entry]) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(''.join(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n' for entry in entries))
+        self._file.flush()
+        if self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _rotate(self) -> None:
+        self.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+class Activity_Log:
+    _shared: Optional['Activity_Log'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, capacity: int = 5000, sink: Optional[Any] = None, echo: bool = True,
+                 interval: float = 0.05, max_pending: int = 50000) -> None:
+        self.capacity = capacity
+        self.sink = sink
+        self.echo = echo
+        self.interval = interval
+        self._pending: Deque[_Pending_Entry] = deque(maxlen=max_pending)
+        self._high_water = max(1, max_pending // 4)
+        self._entries: Deque[Activity_Entry] = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._drain_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.stats = {
+            'written': 0,
+            'batches': 0,
+            'sink_errors': 0,
+            'overflows': 0,
+        }
+
+    @classmethod
+    def shared(cls) -> 'Activity_Log':
+        log = cls._shared
+        if log is not None:
+            return log
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def set_shared(cls, log: Optional['Activity_Log']) -> None:
+        with cls._shared_lock:
+            previous, cls._shared = cls._shared, log
+        if previous is not None and previous is not log:
+            previous.stop()
+
+    def log(self, level: str, source: str, message: str, data: Optional[Dict[str, Any]] = None) -> None:
+        self._pending.append((time.time(), level, source, message, data))
+        if len(self._pending) >= self._high_water and not self._wake.is_set():
+            self._wake.set()
+
+    def info(self, source: str, message: str, data: Optional[Dict[str, Any]] = None) -> None:
+        self.log('info', source, message, data)
+
+    def warning(self, source: str, message: str, data: Optional[Dict[str, Any]] = None) -> None:
+        self.log('warning', source, message, data)
+
+    def error(self, source: str, message: str, data: Optional[Dict[str, Any]] = None) -> None:
+        self.log('error', source, message, data)
+
+    def flush(self) -> int:
+        with self._drain_lock:
+            batch: List[Activity_Entry] = []
+            pending = self._pending
+            for _ in range(len(pending)):
+                timestamp, level, source, message, data = pending.popleft()
+                entry = {'id': next(self._ids), 'time': timestamp, 'level': level, 'source': source, 'message': message}
+                if data:
+                    entry['data'] = data
+                batch.append(entry)
+            if not batch:
+                return 0
+            if len(batch) >= pending.maxlen:
+                self.stats['overflows'] += 1
+
+            self._entries.extend(batch)
+            self.stats['written'] += len(batch)
+            self.stats['batches'] += 1
+
+            if self.echo:
+                try:
+                    sys.stdout.write(''.join(f"{entry['message']}\n" for entry in batch))
+                    sys.stdout.flush()
+                except (OSError, ValueError, AttributeError):
+                    pass
+
+            if self.sink is not None:
+                try:
+                    self.sink.write(batch)
+                except Exception as e:
+                    self.stats['sink_errors'] += 1
+                    sys.stderr.write(f"Erro ao gravar log de atividades: {e}\n")
+            return len(batch)
+
+    def query(self, after_id: int = 0, limit: int = 100, level: Optional[str] = None) -> Dict[str, Any]:
+        self.flush()
+        with self._drain_lock:
+            entries = self._entries
+            first_id = entries[0]['id'] if entries else 0
+            last_id = entries[-1]['id'] if entries else 0
+            start = max(0, int(after_id) - first_id + 1) if entries else 0
+
+            page: List[Activity_Entry] = []
+            for entry in itertools.islice(entries, start, None):
+                if level is None or entry['level'] == level:
+                    page.append(entry)
+                    if len(page) >= limit:
+                        break
+            return {
+                'entries': page,
+                'last_id': last_id,
+                'truncated': bool(entries) and int(after_id) + 1 < first_id
+            }
+
+    def start(self) -> None:
+        with self._drain_lock:
+            if self._running:
+                return
+            self._running = True
+            self._wake.clear()
+            self._thread = threading.Thread(target=self._run, name="ActivityLog", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self.flush()
+        if self.sink is not None:
+            self.sink.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._drain_lock:
+            return dict(self.stats, pending=len(self._pending), buffered=len(self._entries))
+
+    def _run(self) -> None:
+        while self._running:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                sys.stderr.write(f"Erro no log de atividades: {e}\n")
+
+
+def main():
+    print("=== Benchmark do Activity Log ===\n")
+
+    calls = 200000
+    log = Activity_Log(capacity=5000, echo=False, max_pending=calls)
+    start = time.perf_counter()
+    for i in range(calls):
+        log.info('apps', f"Volume de 'app_{i % 50}' definido para {i % 101}%")
+    enqueue = (time.perf_counter() - start) / calls
+    start = time.perf_counter()
+    log.flush()
+    drain = (time.perf_counter() - start) / calls
+    print(f"log.info no caminho quente: {enqueue * 1e6:.2f} µs por chamada ({calls} chamadas)")
+    print(f"escritor em segundo plano: {drain * 1e6:.2f} µs por entrada")
+
+    log.start()
+    start = time.perf_counter()
+    for i in range(calls):
+        log.info('apps', f"Volume de 'app_{i % 50}' definido para {i % 101}%")
+    sustained = (time.perf_counter() - start) / calls
+    log.stop()
+    print(f"rajada com escritor ativo: {sustained * 1e6:.2f} µs por chamada")
+
+    class Slow_Console(io.StringIO):
+        def write(self, text: str) -> int:
+            time.sleep(0.002)
+            return super().write(text)
+
+    stdout = sys.stdout
+    samples = 200
+    sys.stdout = Slow_Console()
+    try:
+        print_latencies = []
+        for i in range(samples):
+            start = time.perf_counter()
+            print(f"Volume de 'app_{i % 50}' definido para {i % 101}%", flush=True)
+            print_latencies.append(time.perf_counter() - start)
+        echo_log = Activity_Log(echo=True)
+        echo_log.start()
+        log_latencies = []
+        for i in range(samples):
+            start = time.perf_counter()
+            echo_log.info('apps', f"Volume de 'app_{i % 50}' definido para {i % 101}%")
+            log_latencies.append(time.perf_counter() - start)
+            time.sleep(0.001)
+        echo_log.stop()
+    finally:
+        sys.stdout = stdout
+    print_latencies.sort()
+    log_latencies.sort()
+    print(f"\nConsole lento (2 ms por escrita), {samples} mensagens:")
+    print(f"   print(): p50 {print_latencies[samples // 2] * 1e6:.0f} µs, max {print_latencies[-1] * 1e6:.0f} µs")
+    print(f"   log.info: p50 {log_latencies[samples // 2] * 1e6:.2f} µs, max {log_latencies[-1] * 1e6:.0f} µs")
+    print("   (sem I/O lento o custo por chamada é equivalente ao de print(); o ganho é não bloquear no console)")
+
+    stats = log.get_stats()
+    print(f"\nEscritor: {stats['written']} entradas em {stats['batches']} lotes, {stats['buffered']} no buffer")
+
+    start = time.perf_counter()
+    after_id = 0
+    pages = 0
+    while True:
+        page = log.query(after_id, limit=100)
+        if not page['entries']:
+            break
+        after_id = page['entries'][-1]['id']
+        pages += 1
+    print(f"Paginação do buffer: {pages} páginas em {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        sink = Rotating_File_Sink(os.path.join(directory, 'activity.log'), max_bytes=256 * 1024, backups=2)
+        file_log = Activity_Log(sink=sink, echo=False)
+        file_log.start()
+        start = time.perf_counter()
+        for i in range(calls // 4):
+            file_log.warning('devices', f"Dispositivo {i} não encontrado", {'device_id': i})
+        per_call = (time.perf_counter() - start) / (calls // 4)
+        file_log.stop()
+        files = sorted(os.listdir(directory))
+        print(f"\nCom arquivo rotativo: {per_call * 1e6:.2f} µs por chamada, arquivos: {', '.join(files)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+from src.core.Activity_Log import Activity_Log
+from src.core.Endpoint_Inventory import Endpoint_Inventory
+from src.core.Process_Cache import normalize_app_name
+from src.core.Session_Registry import Session_Entry, Session_Registry
+
+ROUTING_FORMAT_VERSION = 1
+ROUTE_FLOWS = ('output', 'input')
+DEFAULT_DEVICE_ID = 'default'
+MAX_APPLIED_ENTRIES = 4096
+
+App_Route = Dict[str, str]
+
+
+def _default_routing_path() -> str:
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'SonusMixer', 'state', 'routing.json')
+
+
+class App_Routing_Store:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path if path is not None else _default_routing_path()
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, App_Route]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(state, dict) or state.get('version') != ROUTING_FORMAT_VERSION:
+            return {}
+        routes = state.get('routes', {})
+        return {key: route for key, route in routes.items() if isinstance(route, dict)} if isinstance(routes, dict) else {}
+
+    def save(self, routes: Dict[str, App_Route]) -> None:
+        data = json.dumps({'version': ROUTING_FORMAT_VERSION, 'routes': routes}, ensure_ascii=False, separators=(',', ':'))
+        directory = os.path.dirname(self.path) or '.'
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+
+
+class App_Router:
+    def __init__(self, backend: Optional[Any] = None, registry: Optional[Session_Registry] = None,
+                 inventory: Optional[Endpoint_Inventory] = None, store: Optional[App_Routing_Store] = None,
+                 event_bus: Optional[Any] = None) -> None:
+        if backend is None:
+            from src.core.Audio_Backend import Audio_Backend
+            backend = Audio_Backend.shared()
+        self.backend = backend
+        self.registry = registry or Session_Registry.shared()
+        self.inventory = inventory or Endpoint_Inventory.shared()
+        self.store = store
+        self.event_bus = event_bus
+        self._lock = threading.Lock()
+        self._routes: Dict[str, App_Route] = {}
+        self._applied: Dict[Tuple[Hashable, str], str] = {}
+        self.stats = {
+            'lookups': 0,
+            'matches': 0,
+            'applied': 0,
+            'skipped': 0,
+            'resets': 0,
+            'errors': 0,
+        }
+
+    def load(self) -> int:
+        routes = self.store.load() if self.store is not None else {}
+        with self._lock:
+            self._routes = {
+                normalize_app_name(key): {field: str(value) for field, value in route.items() if field == 'app_name' or field in ROUTE_FLOWS}
+                for key, route in routes.items()
+            }
+            return len(self._routes)
+
+    def route_apps(self, app_names: Iterable[str], device_id: str, flow: Optional[str] = None) -> Dict[str, Any]:
+        app_names = [name for name in dict.fromkeys(app_names) if name]
+        if device_id == DEFAULT_DEVICE_ID:
+            return {'apps': len(app_names), 'sessions': self.reset_apps(app_names, flow), 'flow': flow}
+
+        endpoint = self.inventory.get(device_id, flow)
+        if endpoint is None:
+            raise ValueError(f"Dispositivo '{device_id}' não encontrado")
+        flow = endpoint.flow
+
+        with self._lock:
+            for app_name in app_names:
+                route = self._routes.setdefault(normalize_app_name(app_name), {'app_name': app_name})
+                route[flow] = device_id
+        self._save()
+
+        sessions = 0
+        for entry in self._live_processes(app_names):
+            sessions += self._apply(entry, flow, device_id)
+
+        if self.event_bus is not None:
+            self.event_bus.publish('routing_changed', None, {'apps': app_names, 'device_id': device_id, 'flow': flow})
+        return {'apps': len(app_names), 'sessions': sessions, 'flow': flow}
+
+    def reset_apps(self, app_names: Iterable[str], flow: Optional[str] = None) -> int:
+        app_names = [name for name in dict.fromkeys(app_names) if name]
+        flows = (flow,) if flow else ROUTE_FLOWS
+        changed = False
+        with self._lock:
+            for app_name in app_names:
+                key = normalize_app_name(app_name)
+                route = self._routes.get(key)
+                if route is None:
+                    continue
+                for name in flows:
+                    changed = route.pop(name, None) is not None or changed
+                if not any(name in route for name in ROUTE_FLOWS):
+                    del self._routes[key]
+        if changed:
+            self._save()
+
+        sessions = 0
+        for entry in self._live_processes(app_names):
+            for name in flows:
+                sessions += self._apply(entry, name, None)
+        with self._lock:
+            self.stats['resets'] += sessions
+
+        if self.event_bus is not None:
+            self.event_bus.publish('routing_changed', None, {'apps': app_names, 'device_id': DEFAULT_DEVICE_ID, 'flow': flow})
+        return sessions
+
+    def get_route(self, app_name: str) -> Dict[str, Any]:
+        with self._lock:
+            route = dict(self._routes.get(normalize_app_name(app_name), {}))
+
+        device_id = route.get('output', DEFAULT_DEVICE_ID)
+        endpoint = self.inventory.get(device_id, 'output') if device_id != DEFAULT_DEVICE_ID else None
+        return {
+            'app_name': route.get('app_name', app_name),
+            'device_id': device_id,
+            'device_name': endpoint.name if endpoint is not None else 'Dispositivo Padrão',
+            'input_device_id': route.get('input', DEFAULT_DEVICE_ID),
+        }
+
+    def get_routes(self) -> List[App_Route]:
+        with self._lock:
+            return [dict(route) for route in self._routes.values()]
+
+    def on_session_added(self, entry: Session_Entry) -> None:
+        with self._lock:
+            self.stats['lookups'] += 1
+            route = self._routes.get(entry.normalized_name)
+            if route is None:
+                return
+            self.stats['matches'] += 1
+            targets = [(flow, route[flow]) for flow in ROUTE_FLOWS if flow in route]
+        for flow, device_id in targets:
+            self._apply(entry, flow, device_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, routes=len(self._routes), tracked_processes=len(self._applied))
+
+    def _apply(self, entry: Session_Entry, flow: str, device_id: Optional[str]) -> int:
+        process_key = entry.info.key if entry.info is not None and entry.info.key is not None else entry.pid
+        with self._lock:
+            if device_id is not None and self._applied.get((process_key, flow)) == device_id:
+                self.stats['skipped'] += 1
+                return 0
+
+        try:
+            self.backend.set_app_endpoint(entry.pid, device_id, flow)
+        except Exception as e:
+            with self._lock:
+                self.stats['errors'] += 1
+            Activity_Log.shared().error('routing', f"Erro ao rotear '{entry.app_name}' (pid {entry.pid}): {e}")
+            return 0
+
+        with self._lock:
+            if len(self._applied) >= MAX_APPLIED_ENTRIES:
+                self._applied.clear()
+            if device_id is None:
+                self._applied.pop((process_key, flow), None)
+            else:
+                self._applied[(process_key, flow)] = device_id
+            self.stats['applied'] += 1
+        return 1
+
+    def _live_processes(self, app_names: List[str]) -> List[Session_Entry]:
+        wanted = {normalize_app_name(app_name) for app_name in app_names}
+        return list({entry.pid: entry for entry in self.registry.get_sessions() if entry.normalized_name in wanted}.values())
+
+    def _save(self) -> None:
+        if self.store is None:
+            return
+        with self._lock:
+            routes = {key: dict(route) for key, route in self._routes.items()}
+        try:
+            self.store.save(routes)
+        except OSError as e:
+            Activity_Log.shared().error('routing', f"Erro ao salvar tabela de roteamento: {e}")
+
+
+def _naive_match(rules: List[Tuple[str, str]], entry: Session_Entry) -> Optional[str]:
+    for app_name, device_id in rules:
+        if app_name.lower().replace('.exe', '') == entry.normalized_name:
+            return device_id
+    return None
+
+
+def main():
+    from src.core.Simulated_Backend import SIMULATED_APP_NAMES, Simulated_Backend
+
+    print("=== Benchmark do App Router ===\n")
+
+    backend = Simulated_Backend(sessions=300, outputs=6, virtual_cables=2)
+    registry = Session_Registry(backend)
+    inventory = Endpoint_Inventory(backend)
+    cable = next(endpoint for endpoint in inventory.get_endpoints('output') if endpoint.is_virtual)
+    speakers = next(endpoint for endpoint in inventory.get_endpoints('output') if not endpoint.is_virtual)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = App_Routing_Store(os.path.join(directory, 'routing.json'))
+        router = App_Router(backend, registry, inventory, store)
+        registry.listeners.append(router.on_session_added)
+        entries = registry.get_sessions()
+
+        others = [f"app_extra_{i}" for i in range(1000)]
+        start = time.perf_counter()
+        router.route_apps(others, speakers.id)
+        print(f"1000 regras criadas em lote: {(time.perf_counter() - start) * 1000:.2f} ms (inclui salvar)")
+
+        rules = [(name, speakers.id) for name in others] + [(name, cable.id) for name in SIMULATED_APP_NAMES[:10]]
+        router.route_apps(SIMULATED_APP_NAMES[:10], cable.id)
+        rounds = 20
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for entry in entries:
+                _naive_match(rules, entry)
+        naive = (time.perf_counter() - start) / (rounds * len(entries))
+        lookups_before = router.get_stats()['lookups']
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for entry in entries:
+                router.on_session_added(entry)
+        indexed = (time.perf_counter() - start) / (router.get_stats()['lookups'] - lookups_before)
+        print(f"Busca de regra por sessão ({len(rules)} regras): {indexed * 1e6:.2f} us (tabela) vs {naive * 1e6:.2f} us (varredura)")
+
+        app_names = [entry.app_name for entry in entries]
+        calls_before = backend.get_stats()['calls']['set_app_endpoint']
+        start = time.perf_counter()
+        result = router.route_apps(app_names, cable.id)
+        elapsed = time.perf_counter() - start
+        calls = backend.get_stats()['calls']['set_app_endpoint'] - calls_before
+        print(f"Reroteamento em lote de {result['apps']} apps ({len(entries)} sessões): {elapsed * 1000:.2f} ms, "
+              f"{result['sessions']} processos alterados, {calls} chamadas ao backend")
+
+        timings = []
+        for _ in range(50):
+            session = backend.add_session('Spotify')
+            start = time.perf_counter()
+            entry = registry.notify_session_created(session)
+            timings.append(time.perf_counter() - start)
+            assert backend.app_endpoints.get((entry.pid, 'output')) == cable.id
+        timings.sort()
+        print(f"Nova sessão -> regra aplicada: p50 {timings[len(timings) // 2] * 1e6:.1f} us, max {timings[-1] * 1e6:.1f} us (sem polling)")
+
+        start = time.perf_counter()
+        reset = router.reset_apps(app_names)
+        print(f"Reset de {len(app_names)} apps: {(time.perf_counter() - start) * 1000:.2f} ms, {reset} fluxos redefinidos")
+
+        reloaded = App_Router(backend, registry, inventory, store)
+        print(f"Regras persistidas recarregadas: {reloaded.load()}")
+        print(f"   {router.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+class Apps_Snapshot_Store:
+    def __init__(self, key_field: str = 'name', max_tombstones: int = 256) -> None:
+        self.key_field = key_field
+        self.max_tombstones = max_tombstones
+        self.version = 0
+        self._lock = threading.RLock()
+        self._apps: Dict[str, Dict[str, Any]] = {}
+        self._added_versions: Dict[str, int] = {}
+        self._field_versions: Dict[str, Dict[str, int]] = {}
+        self._tombstones: 'OrderedDict[str, int]' = OrderedDict()
+        self._min_delta_version = 0
+        self._order_version = 0
+
+    def update(self, apps: List[Dict[str, Any]]) -> int:
+        with self._lock:
+            next_version = self.version + 1
+            changed = False
+            current: Dict[str, Dict[str, Any]] = {}
+
+            for app in apps:
+                key = app[self.key_field]
+                current[key] = app
+                previous = self._apps.get(key)
+
+                if previous is None:
+                    self._added_versions[key] = next_version
+                    self._field_versions[key] = {}
+                    self._tombstones.pop(key, None)
+                    changed = True
+                    continue
+
+                field_versions = self._field_versions[key]
+                for field, value in app.items():
+                    if previous.get(field) != value:
+                        field_versions[field] = next_version
+                        changed = True
+                for field in previous.keys() - app.keys():
+                    field_versions[field] = next_version
+                    changed = True
+
+            for key in self._apps.keys() - current.keys():
+                del self._added_versions[key]
+                del self._field_versions[key]
+                self._tombstones[key] = next_version
+                changed = True
+
+            while len(self._tombstones) > self.max_tombstones:
+                _, pruned_version = self._tombstones.popitem(last=False)
+                self._min_delta_version = max(self._min_delta_version, pruned_version)
+
+            if list(current) != list(self._apps):
+                self._order_version = next_version
+                changed = True
+
+            self._apps = current
+            if changed:
+                self.version = next_version
+            return self.version
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'version': self.version,
+                'full': True,
+                'apps': list(self._apps.values())
+            }
+
+    def get_delta(self, since_version: Optional[int]) -> Dict[str, Any]:
+        with self._lock:
+            if not self._can_diff_from(since_version):
+                return self.get_snapshot()
+
+            if since_version == self.version:
+                return self._delta_payload(since_version, [], [], [])
+
+            added = []
+            changed = []
+            for key, app in self._apps.items():
+                if self._added_versions[key] > since_version:
+                    added.append(app)
+                    continue
+
+                fields = {
+                    field: app.get(field)
+                    for field, version in self._field_versions[key].items()
+                    if version > since_version
+                }
+                if fields:
+                    changed.append({self.key_field: key, 'changes': fields})
+
+            removed = [
+                key for key, version in self._tombstones.items()
+                if version > since_version and key not in self._apps
+            ]
+            return self._delta_payload(since_version, added, removed, changed)
+
+    def _can_diff_from(self, since_version: Optional[int]) -> bool:
+        with self._lock:
+            if since_version is None or since_version <= 0:
+                return False
+            if since_version > self.version:
+                return False
+            return since_version >= self._min_delta_version
+
+    def _delta_payload(self, since_version: int, added: List[Dict[str, Any]], removed: List[str], changed: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'full': False,
+            'order': list(self._apps) if self._order_version > since_version else None,
+            'added': added,
+            'removed': removed,
+            'changed': changed
+        }
+
+
+def main():
+    print("=== Teste do Apps Snapshot Store ===\n")
+
+    apps = [
+        {'name': f"app{i}", 'pid': 1000 + i, 'icon_id': f"{i:016x}", 'volume': 50, 'is_muted': False, 'is_solo': False}
+        for i in range(40)
+    ]
+
+    store = Apps_Snapshot_Store()
+    version = store.update(apps)
+    full_size = len(json.dumps(store.get_snapshot()))
+
+    store.update([dict(app) for app in apps])
+    idle_size = len(json.dumps(store.get_delta(version)))
+
+    apps[3] = dict(apps[3], volume=75)
+    apps[7] = dict(apps[7], is_muted=True)
+    store.update(apps)
+    delta = store.get_delta(version)
+
+    print(f"Snapshot completo: {full_size} bytes")
+    print(f"Delta sem mudanças: {idle_size} bytes")
+    print(f"Delta com 2 mudanças: {len(json.dumps(delta))} bytes -> {delta['changed']}")
+
+
+if __name__ == "__main__":
+    main()
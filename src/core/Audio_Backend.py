@@ -0,0 +1,145 @@
+import threading
+from typing import Any, Hashable, Iterable, List, Optional
+from src.core.Audio_Policy import Audio_Policy_Config
+from src.core.Endpoint_Inventory import Endpoint_Info, Pycaw_Endpoint_Source
+from src.core.Icon_Cache import Win32_Icon_Renderer
+from src.core.Metrics import Metrics_Registry
+from src.core.Session_Registry import Pycaw_Session_Source
+
+BACKEND_METHODS = (
+    'get_sessions', 'get_endpoints', 'get_master_volume', 'get_session_meter', 'get_endpoint_meter',
+    'open_capture', 'render', 'set_default_device', 'set_app_endpoint', 'get_app_endpoint'
+)
+
+
+class Audio_Backend:
+    name = 'base'
+    supports_notifications = False
+
+    _shared: Optional['Audio_Backend'] = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'Audio_Backend':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = Pycaw_Backend()
+                Metrics_Registry.shared().instrument(cls._shared, 'backend', BACKEND_METHODS)
+            return cls._shared
+
+    @classmethod
+    def set_shared(cls, backend: Optional['Audio_Backend']) -> None:
+        from src.core.Endpoint_Inventory import Endpoint_Inventory
+        from src.core.Icon_Cache import Icon_Cache
+        from src.core.Process_Cache import Process_Metadata_Cache
+        from src.core.Session_Registry import Session_Registry
+
+        if backend is not None:
+            Metrics_Registry.shared().instrument(backend, 'backend', BACKEND_METHODS)
+        with cls._shared_lock:
+            cls._shared = backend
+        Session_Registry.set_shared(None)
+        Endpoint_Inventory.set_shared(None)
+        Icon_Cache.set_shared(None)
+        Process_Metadata_Cache.set_shared(None)
+
+    def get_sessions(self) -> Iterable[Any]:
+        raise NotImplementedError
+
+    def get_session_key(self, session: Any) -> Hashable:
+        raise NotImplementedError
+
+    def get_endpoints(self) -> List[Endpoint_Info]:
+        raise NotImplementedError
+
+    def get_master_volume(self) -> Any:
+        raise NotImplementedError
+
+    def get_session_meter(self, session: Any) -> Any:
+        raise NotImplementedError
+
+    def get_endpoint_meter(self, endpoint: Endpoint_Info) -> Any:
+        raise NotImplementedError
+
+    def open_capture(self, flow: str, sample_rate: int = 48000, block_size: int = 1024) -> Any:
+        raise NotImplementedError
+
+    def render(self, exe_path: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set_default_device(self, device_id: str, flow: str) -> bool:
+        raise NotImplementedError
+
+    def set_app_endpoint(self, pid: int, device_id: Optional[str], flow: str) -> bool:
+        raise NotImplementedError
+
+    def get_app_endpoint(self, pid: int, flow: str) -> Optional[str]:
+        raise NotImplementedError
+
+
+class Pycaw_Backend(Audio_Backend):
+    name = 'pycaw'
+    supports_notifications = True
+
+    def __init__(self) -> None:
+        self._sessions = Pycaw_Session_Source()
+        self._endpoints = Pycaw_Endpoint_Source()
+        self._icons = Win32_Icon_Renderer()
+        self._policy = Audio_Policy_Config()
+
+    def get_sessions(self) -> Iterable[Any]:
+        return self._sessions.get_sessions()
+
+    def get_session_key(self, session: Any) -> Hashable:
+        return self._sessions.get_session_key(session)
+
+    def get_endpoints(self) -> List[Endpoint_Info]:
+        return self._endpoints.get_endpoints()
+
+    def get_master_volume(self) -> Any:
+        from ctypes import POINTER, cast
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+        devices = AudioUtilities.GetSpeakers()
+        with Metrics_Registry.shared().timer('com.Activate'):
+            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+        return cast(interface, POINTER(IAudioEndpointVolume))
+
+    def get_session_meter(self, session: Any) -> Any:
+        from pycaw.pycaw import IAudioMeterInformation
+
+        return session._ctl.QueryInterface(IAudioMeterInformation)
+
+    def get_endpoint_meter(self, endpoint: Endpoint_Info) -> Any:
+        from ctypes import POINTER, cast
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import IAudioMeterInformation
+
+        with Metrics_Registry.shared().timer('com.Activate'):
+            interface = endpoint.device.Activate(IAudioMeterInformation._iid_, CLSCTX_ALL, None)
+        return cast(interface, POINTER(IAudioMeterInformation))
+
+    def open_capture(self, flow: str, sample_rate: int = 48000, block_size: int = 1024) -> Any:
+        from src.core.Spectrum_Analyzer import Soundcard_Block_Source
+
+        return Soundcard_Block_Source(flow, sample_rate, block_size)
+
+    def render(self, exe_path: str) -> Optional[bytes]:
+        return self._icons.render(exe_path)
+
+    def set_default_device(self, device_id: str, flow: str) -> bool:
+        from src.core.Command_Host import Command_Host_Pool
+
+        args = {'device_id': device_id}
+        if flow == 'input':
+            args['communication'] = True
+        Command_Host_Pool.shared().request('set_default_device', args, timeout=5)
+        return True
+
+    def set_app_endpoint(self, pid: int, device_id: Optional[str], flow: str) -> bool:
+        self._policy.set_endpoint(pid, device_id, flow)
+        return True
+
+    def get_app_endpoint(self, pid: int, flow: str) -> Optional[str]:
+        return self._policy.get_endpoint(pid, flow)
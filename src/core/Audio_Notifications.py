@@ -0,0 +1,196 @@
+import threading
+from typing import Any, Dict, Hashable, List, Optional
+from src.core.Activity_Log import Activity_Log
+from src.core.Endpoint_Inventory import Endpoint_Inventory
+from src.core.Event_Bus import Event_Bus
+from src.core.Gain_Engine import Gain_Engine
+from src.core.Metrics import Metrics_Registry
+from src.core.Session_Registry import Session_Entry, Session_Registry
+
+AUDIO_SESSION_STATE_EXPIRED = 2
+
+
+class Audio_Notification_Service:
+    def __init__(self, event_bus: Event_Bus, registry: Optional[Session_Registry] = None, inventory: Optional[Endpoint_Inventory] = None,
+                 gain_engine: Optional[Gain_Engine] = None) -> None:
+        self.event_bus = event_bus
+        self.registry = registry or Session_Registry.shared()
+        self.inventory = inventory or Endpoint_Inventory.shared()
+        self.gain_engine = gain_engine
+        self._session_manager = None
+        self._session_notification = None
+        self._device_enumerator = None
+        self._device_notification = None
+        self._master_volume = None
+        self._master_callback = None
+        self._lock = threading.Lock()
+        self._session_callbacks: Dict[Hashable, Any] = {}
+        self._expired_callbacks: List[Any] = []
+
+    def start(self) -> bool:
+        if self._on_registry_session not in self.registry.listeners:
+            self.registry.listeners.append(self._on_registry_session)
+        try:
+            self._register_session_notifications()
+            self._register_device_notifications()
+            self._register_master_notifications()
+            return True
+        except Exception as e:
+            Activity_Log.shared().error('notifications', f"Erro ao registrar notificações de áudio: {e}")
+            return False
+
+    def stop(self) -> None:
+        if self._on_registry_session in self.registry.listeners:
+            self.registry.listeners.remove(self._on_registry_session)
+        with self._lock:
+            sessions = list(self._session_callbacks.values()) + self._expired_callbacks
+            self._session_callbacks = {}
+            self._expired_callbacks = []
+        try:
+            if self._session_manager and self._session_notification:
+                self._session_manager.UnregisterSessionNotification(self._session_notification)
+            if self._device_enumerator and self._device_notification:
+                self._device_enumerator.UnregisterEndpointNotificationCallback(self._device_notification)
+            if self._master_volume and self._master_callback:
+                self._master_volume.UnregisterControlChangeNotify(self._master_callback)
+            for session in sessions:
+                session.unregister_notification()
+        except Exception as e:
+            Activity_Log.shared().error('notifications', f"Erro ao cancelar notificações de áudio: {e}")
+
+    def _register_session_notifications(self) -> None:
+        from ctypes import POINTER, cast
+        from comtypes import CLSCTX_ALL
+        from pycaw.callbacks import AudioSessionNotification
+        from pycaw.pycaw import AudioSession, AudioUtilities, IAudioSessionControl2, IAudioSessionManager2
+
+        service = self
+
+        class Session_Created_Notification(AudioSessionNotification):
+            def on_session_created(self, new_session):
+                session = AudioSession(new_session.QueryInterface(IAudioSessionControl2))
+                service._on_session_created(session)
+
+        speakers = AudioUtilities.GetSpeakers()
+        with Metrics_Registry.shared().timer('com.Activate'):
+            interface = speakers.Activate(IAudioSessionManager2._iid_, CLSCTX_ALL, None)
+        self._session_manager = cast(interface, POINTER(IAudioSessionManager2))
+        self._session_notification = Session_Created_Notification()
+        self._session_manager.RegisterSessionNotification(self._session_notification)
+        # O Windows só começa a enviar OnSessionCreated depois da primeira enumeração
+        self._session_manager.GetSessionEnumerator()
+
+        for entry in self.registry.get_sessions():
+            self._watch_session(entry.session, entry.key, entry.app_name)
+
+    def _register_device_notifications(self) -> None:
+        from pycaw.callbacks import MMNotificationClient
+        from pycaw.pycaw import AudioUtilities
+
+        service = self
+
+        class Device_Notification(MMNotificationClient):
+            def on_default_device_changed(self, flow, flow_id, role, role_id, default_device_id):
+                service._on_devices_changed({'default_changed': default_device_id})
+
+            def on_device_added(self, added_device_id):
+                service._on_devices_changed({'added': added_device_id})
+
+            def on_device_removed(self, removed_device_id):
+                service._on_devices_changed({'removed': removed_device_id})
+
+            def on_device_state_changed(self, device_id, new_state, new_state_id):
+                service._on_devices_changed({'state_changed': device_id})
+
+        self._device_enumerator = AudioUtilities.GetDeviceEnumerator()
+        self._device_notification = Device_Notification()
+        self._device_enumerator.RegisterEndpointNotificationCallback(self._device_notification)
+
+    def _register_master_notifications(self) -> None:
+        from ctypes import POINTER, cast
+        from comtypes import CLSCTX_ALL
+        from pycaw.callbacks import AudioEndpointVolumeCallback
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+        event_bus = self.event_bus
+
+        class Master_Volume_Notification(AudioEndpointVolumeCallback):
+            def on_notify(self, new_volume, new_mute, event_context, channels, channel_volumes):
+                event_bus.publish('master_changed', None, {
+                    'volume': round(new_volume * 100),
+                    'is_muted': bool(new_mute)
+                })
+
+        speakers = AudioUtilities.GetSpeakers()
+        with Metrics_Registry.shared().timer('com.Activate'):
+            interface = speakers.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+        self._master_volume = cast(interface, POINTER(IAudioEndpointVolume))
+        self._master_callback = Master_Volume_Notification()
+        self._master_volume.RegisterControlChangeNotify(self._master_callback)
+
+    def _on_devices_changed(self, data: Dict[str, Any]) -> None:
+        self.inventory.invalidate()
+        self.event_bus.publish('devices_changed', None, data)
+
+    def _on_session_created(self, session: Any) -> None:
+        entry = self.registry.notify_session_created(session)
+        if entry is None:
+            return
+        self.event_bus.publish('app_added', entry.app_name, {'name': entry.app_name, 'pid': entry.pid})
+        self._watch_session(entry.session, entry.key, entry.app_name)
+
+    def _on_registry_session(self, entry: Session_Entry) -> None:
+        self._watch_session(entry.session, entry.key, entry.app_name)
+
+    def _on_session_expired(self, key: Any, app_name: str) -> None:
+        with self._lock:
+            session = self._session_callbacks.pop(key, None)
+            # Cancelar o registro dentro do próprio callback pode travar; fica para o próximo _watch_session ou stop()
+            if session is not None:
+                self._expired_callbacks.append(session)
+        self.registry.notify_session_expired(key)
+        self.event_bus.publish('app_removed', app_name, {'name': app_name})
+
+    def _on_session_volume(self, app_name: str, new_volume: float, new_mute: bool) -> None:
+        state = self.gain_engine.get_app_state(app_name) if self.gain_engine is not None else None
+        if state is None:
+            state = {'volume': round(new_volume * 100), 'is_muted': bool(new_mute)}
+        self.event_bus.publish('app_changed', app_name, state)
+
+    def _release_expired(self) -> None:
+        with self._lock:
+            expired, self._expired_callbacks = self._expired_callbacks, []
+        for session in expired:
+            try:
+                session.unregister_notification()
+            except Exception as e:
+                Activity_Log.shared().error('notifications', f"Erro ao cancelar notificações de sessão: {e}")
+
+    def _watch_session(self, session: Any, key: Any, app_name: str) -> None:
+        from pycaw.callbacks import AudioSessionEvents
+
+        self._release_expired()
+        with self._lock:
+            if key in self._session_callbacks:
+                return
+            self._session_callbacks[key] = session
+
+        service = self
+
+        class Session_Events(AudioSessionEvents):
+            def on_simple_volume_changed(self, new_volume, new_mute, event_context):
+                service._on_session_volume(app_name, new_volume, new_mute)
+
+            def on_state_changed(self, new_state, new_state_id):
+                if new_state_id == AUDIO_SESSION_STATE_EXPIRED:
+                    service._on_session_expired(key, app_name)
+
+            def on_session_disconnected(self, disconnect_reason, disconnect_reason_id):
+                service._on_session_expired(key, app_name)
+
+        try:
+            session.register_notification(Session_Events())
+        except Exception as e:
+            with self._lock:
+                self._session_callbacks.pop(key, None)
+            Activity_Log.shared().error('notifications', f"Erro ao observar sessão de '{app_name}': {e}")
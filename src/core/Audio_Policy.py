@@ -0,0 +1,129 @@
+import threading
+from typing import Any, Optional
+
+AUDIO_POLICY_CONFIG_CLASS = 'Windows.Media.Internal.AudioPolicyConfig'
+AUDIO_POLICY_CONFIG_IIDS = (
+    '{ab3d4648-e242-459f-b02f-541c70306324}',  # Windows 10 21H2 e posteriores
+    '{2a59116d-6c4f-45e0-a74f-707e3fef9258}',  # Windows 10 1803 até 21H1
+)
+# Layout da vtable conforme EarTrumpet (EarTrumpet/Interop/MMDeviceAPI/IAudioPolicyConfigFactory*.cs),
+# igual nas duas variantes acima:
+#   0-2   IUnknown (QueryInterface, AddRef, Release)
+#   3-5   IInspectable (GetIids, GetRuntimeClassName, GetTrustLevel)
+#   6-24  19 métodos não documentados: add_CtxVolumeChange, remove_CtxVolumeChanged,
+#         add_RingerVibrateStateChanged, remove_RingerVibrateStateChange, SetVolumeGroupGainForId,
+#         GetVolumeGroupGainForId, GetActiveVolumeGroupForEndpointId, GetVolumeGroupsForEndpoint,
+#         GetCurrentVolumeContext, SetVolumeGroupMuteForId, GetVolumeGroupMuteForId, SetRingerVibrateState,
+#         GetRingerVibrateState, SetPreferredChatApplication, ResetPreferredChatApplication,
+#         GetPreferredChatApplication, GetCurrentChatApplications, add_ChatContextChanged,
+#         remove_ChatContextChanged
+#   25-27 SetPersistedDefaultAudioEndpoint, GetPersistedDefaultAudioEndpoint, ClearAllPersistedApplicationDefaultEndpoints
+VTABLE_UNDOCUMENTED_METHODS = 19
+VTABLE_SET_PERSISTED_ENDPOINT = 6 + VTABLE_UNDOCUMENTED_METHODS
+VTABLE_GET_PERSISTED_ENDPOINT = VTABLE_SET_PERSISTED_ENDPOINT + 1
+VTABLE_CLEAR_PERSISTED_ENDPOINTS = VTABLE_SET_PERSISTED_ENDPOINT + 2
+
+MMDEVAPI_PREFIX = '\\\\?\\SWD#MMDEVAPI#'
+DEVICE_INTERFACE_GUIDS = {
+    'output': '{e6327cad-dcec-4949-ae8a-991e976a79d2}',
+    'input': '{2eef81be-33fa-4800-9670-1cd474972c3f}',
+}
+DATA_FLOWS = {'output': 0, 'input': 1}
+ROLE_CONSOLE = 0
+ROLE_MULTIMEDIA = 1
+
+
+def to_policy_device_id(device_id: str, flow: str) -> str:
+    return f"{MMDEVAPI_PREFIX}{device_id}#{DEVICE_INTERFACE_GUIDS[flow]}"
+
+
+def from_policy_device_id(policy_id: str) -> str:
+    if policy_id.startswith(MMDEVAPI_PREFIX):
+        policy_id = policy_id[len(MMDEVAPI_PREFIX):]
+    return policy_id.split('#', 1)[0]
+
+
+class Audio_Policy_Config:
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._dll: Any = None
+
+    def set_endpoint(self, pid: int, device_id: Optional[str], flow: str) -> None:
+        import ctypes
+
+        combase = self._combase()
+        method = self._method(VTABLE_SET_PERSISTED_ENDPOINT, ctypes.c_uint, ctypes.c_int, ctypes.c_int, ctypes.c_void_p)
+        device = self._create_string(to_policy_device_id(device_id, flow)) if device_id else None
+        try:
+            for role in (ROLE_CONSOLE, ROLE_MULTIMEDIA):
+                method(self._factory(), pid, DATA_FLOWS[flow], role, device)
+        finally:
+            if device:
+                combase.WindowsDeleteString(device)
+
+    def get_endpoint(self, pid: int, flow: str) -> Optional[str]:
+        import ctypes
+
+        combase = self._combase()
+        method = self._method(VTABLE_GET_PERSISTED_ENDPOINT, ctypes.c_uint, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_void_p))
+        device = ctypes.c_void_p()
+        method(self._factory(), pid, DATA_FLOWS[flow], ROLE_MULTIMEDIA, ctypes.byref(device))
+        if not device:
+            return None
+        try:
+            value = combase.WindowsGetStringRawBuffer(device, None)
+        finally:
+            combase.WindowsDeleteString(device)
+        return from_policy_device_id(value) if value else None
+
+    def clear_all(self) -> None:
+        self._method(VTABLE_CLEAR_PERSISTED_ENDPOINTS)(self._factory())
+
+    def _combase(self) -> Any:
+        if self._dll is None:
+            import ctypes
+
+            combase = ctypes.windll.combase
+            combase.WindowsCreateString.argtypes = [ctypes.c_wchar_p, ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p)]
+            combase.WindowsCreateString.restype = ctypes.HRESULT
+            combase.WindowsDeleteString.argtypes = [ctypes.c_void_p]
+            combase.WindowsGetStringRawBuffer.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+            combase.WindowsGetStringRawBuffer.restype = ctypes.c_wchar_p
+            combase.RoGetActivationFactory.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p)]
+            combase.RoGetActivationFactory.restype = ctypes.c_long
+            self._dll = combase
+        return self._dll
+
+    def _create_string(self, value: str) -> Any:
+        import ctypes
+
+        handle = ctypes.c_void_p()
+        self._combase().WindowsCreateString(value, len(value), ctypes.byref(handle))
+        return handle
+
+    def _factory(self) -> Any:
+        factory = getattr(self._local, 'factory', None)
+        if factory is not None:
+            return factory
+
+        import ctypes
+        from comtypes import GUID
+
+        combase = self._combase()
+        class_id = self._create_string(AUDIO_POLICY_CONFIG_CLASS)
+        try:
+            for iid in AUDIO_POLICY_CONFIG_IIDS:
+                factory = ctypes.c_void_p()
+                guid = GUID(iid)
+                if combase.RoGetActivationFactory(class_id, ctypes.byref(guid), ctypes.byref(factory)) == 0 and factory:
+                    self._local.factory = factory
+                    return factory
+        finally:
+            combase.WindowsDeleteString(class_id)
+        raise OSError("IAudioPolicyConfig indisponível (requer Windows 10 1803 ou posterior)")
+
+    def _method(self, index: int, *argtypes: Any) -> Any:
+        import ctypes
+
+        vtable = ctypes.cast(self._factory(), ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p)))[0]
+        return ctypes.WINFUNCTYPE(ctypes.HRESULT, ctypes.c_void_p, *argtypes)(vtable[index])
@@ -0,0 +1,280 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from src.core.Endpoint_Inventory import Endpoint_Inventory
+from src.core.Session_Registry import Session_Registry
+
+BATCH_TARGETS = ('app', 'channel', 'device', 'master')
+BATCH_ACTIONS = ('volume', 'mute', 'solo')
+
+Write_Key = Tuple[str, str, str, str]
+
+
+class Batch_Error(Exception):
+    pass
+
+
+class Mixer_Batch_Service:
+    def __init__(self, channel_manager: Any, master_controller: Any = None, registry: Optional[Session_Registry] = None, inventory: Optional[Endpoint_Inventory] = None, gain_engine: Any = None) -> None:
+        self.channel_manager = channel_manager
+        self.master_controller = master_controller
+        self.registry = registry
+        self.inventory = inventory
+        self.gain_engine = gain_engine
+        self.solo_app: Optional[str] = None
+
+    def apply(self, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        apps: Dict[str, List[Any]] = {}
+        if any(op.get('target') == 'app' for op in ops):
+            registry = self.registry or Session_Registry.shared()
+            for entry in registry.get_sessions():
+                if "svchost" not in entry.app_name:
+                    apps.setdefault(entry.app_name, []).append(entry)
+
+        results = [{'index': i, 'ok': True, 'applied': 0, 'skipped': 0, 'error': None} for i in range(len(ops))]
+        writes: Dict[Write_Key, Tuple[Any, int]] = {}
+        solo: Optional[Tuple[int, Optional[str]]] = None
+
+        for index, op in enumerate(ops):
+            try:
+                for key, value in self._expand(op, apps):
+                    previous = writes.get(key)
+                    if previous is not None:
+                        results[previous[1]]['skipped'] += 1
+                    writes[key] = (value, index)
+                if op.get('target') == 'app' and op.get('action') == 'solo':
+                    solo = (index, op['id'] if op.get('value') else None)
+            except Exception as e:
+                results[index]['ok'] = False
+                results[index]['error'] = str(e)
+
+        for key, (value, index) in writes.items():
+            result = results[index]
+            try:
+                if self._read(key, apps) == value:
+                    result['skipped'] += 1
+                    continue
+                self._write(key, value, apps)
+                result['applied'] += 1
+            except Exception as e:
+                result['ok'] = False
+                result['error'] = str(e)
+
+        if solo is not None and results[solo[0]]['ok']:
+            self.solo_app = solo[1]
+        return {
+            'results': results,
+            'applied': sum(result['applied'] for result in results),
+            'skipped': sum(result['skipped'] for result in results)
+        }
+
+    def read(self, target: str, target_id: str, action: str, device_type: str = '') -> Any:
+        if target not in BATCH_TARGETS:
+            raise Batch_Error(f"Alvo inválido: {target}")
+        if action not in BATCH_ACTIONS:
+            raise Batch_Error(f"Ação inválida: {action}")
+        if action == 'solo' and target not in ('app', 'channel'):
+            raise Batch_Error(f"Solo não suportado para '{target}'")
+        if target == 'app' and action == 'solo':
+            return self.solo_app == target_id
+
+        apps: Dict[str, List[Any]] = {}
+        if target == 'app':
+            registry = self.registry or Session_Registry.shared()
+            apps[target_id] = registry.find_all_by_app(target_id)
+            if not apps[target_id] and not (self.gain_engine and self.gain_engine.get_app_state(target_id)):
+                raise Batch_Error(f"App '{target_id}' não encontrado")
+        elif target == 'channel' and not self.channel_manager.get_channel(target_id):
+            raise Batch_Error(f"Canal '{target_id}' não encontrado")
+        elif target == 'device':
+            inventory = self.inventory or Endpoint_Inventory.shared()
+            if not inventory.get(target_id, device_type or None):
+                raise Batch_Error(f"Dispositivo {target_id} não encontrado")
+        elif target == 'master' and self.master_controller is None:
+            raise Batch_Error("Controle master indisponível")
+        return self._read((target, target_id, device_type, action), apps)
+
+    def _expand(self, op: Dict[str, Any], apps: Dict[str, List[Any]]) -> List[Tuple[Write_Key, Any]]:
+        target = op.get('target')
+        action = op.get('action')
+        target_id = str(op.get('id', ''))
+        device_type = op.get('device_type', '')
+        value = op.get('value')
+
+        if target not in BATCH_TARGETS:
+            raise Batch_Error(f"Alvo inválido: {target}")
+        if action not in BATCH_ACTIONS:
+            raise Batch_Error(f"Ação inválida: {action}")
+
+        if action == 'volume':
+            value = round(max(0, min(100, float(value))))
+        else:
+            value = bool(value)
+
+        if target == 'app':
+            if target_id not in apps:
+                raise Batch_Error(f"App '{target_id}' não encontrado")
+            if action == 'solo':
+                return [
+                    (('app', name, '', 'mute'), value and name != target_id)
+                    for name in apps
+                ]
+            return [(('app', target_id, '', action), value)]
+
+        if target == 'channel':
+            channel = self.channel_manager.get_channel(target_id)
+            if not channel:
+                raise Batch_Error(f"Canal '{target_id}' não encontrado")
+            if action == 'solo':
+                return self._expand_channel_solo(channel, value)
+            return [(('channel', target_id, '', action), value)]
+
+        if action == 'solo':
+            raise Batch_Error(f"Solo não suportado para '{target}'")
+
+        if target == 'device':
+            inventory = self.inventory or Endpoint_Inventory.shared()
+            if not inventory.get(target_id, device_type or None):
+                raise Batch_Error(f"Dispositivo {target_id} não encontrado")
+            return [(('device', target_id, device_type, action), value)]
+
+        if self.master_controller is None:
+            raise Batch_Error("Controle master indisponível")
+        return [(('master', '', '', action), value)]
+
+    def _expand_channel_solo(self, channel: Any, value: bool) -> List[Tuple[Write_Key, Any]]:
+        writes = [(('channel', channel.id, '', 'solo'), value)]
+        current = self.channel_manager.get_solo(channel.type)
+        if value and current and current.id != channel.id:
+            writes.append((('channel', current.id, '', 'solo'), False))
+        return writes
+
+    def _read(self, key: Write_Key, apps: Dict[str, List[Any]]) -> Any:
+        target, target_id, device_type, field = key
+
+        if target == 'app':
+            state = self.gain_engine.get_app_state(target_id) if self.gain_engine else None
+            if state is not None:
+                return state['volume'] if field == 'volume' else state['is_muted']
+            interface = apps[target_id][0].interface
+            if field == 'volume':
+                return round(interface.GetMasterVolume() * 100)
+            return bool(interface.GetMute())
+
+        if target == 'channel':
+            channel = self.channel_manager.get_channel(target_id)
+            if field == 'volume':
+                return round(channel.volume)
+            return channel.is_muted if field == 'mute' else channel.is_solo
+
+        if target == 'device':
+            inventory = self.inventory or Endpoint_Inventory.shared()
+            endpoint = inventory.get(target_id, device_type or None)
+            return endpoint.get_volume() if field == 'volume' else endpoint.get_mute()
+
+        state = self.master_controller.get_state()
+        return state['volume'] if field == 'volume' else bool(state['is_muted'])
+
+    def _write(self, key: Write_Key, value: Any, apps: Dict[str, List[Any]]) -> None:
+        target, target_id, device_type, field = key
+
+        if target == 'app':
+            if self.gain_engine and self.gain_engine.governs(target_id):
+                if field == 'volume':
+                    self.gain_engine.set_app_volume(target_id, value)
+                else:
+                    self.gain_engine.set_app_mute(target_id, value)
+                return
+            for entry in apps[target_id]:
+                if field == 'volume':
+                    entry.interface.SetMasterVolume(value / 100.0, None)
+                else:
+                    entry.interface.SetMute(value, None)
+            return
+
+        if target == 'channel':
+            channel = self.channel_manager.get_channel(target_id)
+            if field == 'volume':
+                channel.volume = value
+            elif field == 'mute':
+                channel.is_muted = value
+            else:
+                self.channel_manager.set_solo(target_id, value)
+            if self.gain_engine:
+                self.gain_engine.update_channel(channel)
+            return
+
+        if target == 'device':
+            inventory = self.inventory or Endpoint_Inventory.shared()
+            endpoint = inventory.get(target_id, device_type or None)
+            if field == 'volume':
+                endpoint.volume_interface.SetMasterVolumeLevelScalar(value / 100.0, None)
+            else:
+                endpoint.volume_interface.SetMute(value, None)
+            return
+
+        if field == 'volume':
+            self.master_controller.set_volume(value)
+        else:
+            self.master_controller.set_mute(value)
+
+
+class Fake_Master_Controller:
+    def __init__(self) -> None:
+        self.volume = 50
+        self.is_muted = False
+
+    def get_state(self) -> Dict[str, Any]:
+        return {'volume': self.volume, 'is_muted': self.is_muted}
+
+    def set_volume(self, level: float) -> None:
+        self.volume = int(level)
+
+    def set_mute(self, mute_state: bool) -> None:
+        self.is_muted = bool(mute_state)
+
+
+def main():
+    from audio_channel import ChannelManager
+    from src.core.Endpoint_Inventory import Fake_Endpoint_Source
+    from src.core.Session_Registry import Fake_Session_Source
+
+    print("=== Benchmark do Mixer Batch Service ===\n")
+
+    source = Fake_Session_Source(60, latency=0.00005)
+    registry = Session_Registry(source)
+    inventory = Endpoint_Inventory(Fake_Endpoint_Source())
+    service = Mixer_Batch_Service(ChannelManager(), Fake_Master_Controller(), registry, inventory)
+    app_names = [session.Process.name().replace('.exe', '') for session in source.sessions]
+
+    start = time.perf_counter()
+    for name in app_names:
+        session = next(s for s in source.get_sessions() if s.Process.name() == f"{name}.exe")
+        session.SimpleAudioVolume.SetMute(name != app_names[0], None)
+    naive = time.perf_counter() - start
+    for session in source.sessions:
+        session.SimpleAudioVolume.SetMute(False, None)
+
+    start = time.perf_counter()
+    report = service.apply([{'target': 'app', 'id': app_names[0], 'action': 'solo', 'value': True}])
+    batched = time.perf_counter() - start
+
+    start = time.perf_counter()
+    repeated = service.apply([{'target': 'app', 'id': app_names[0], 'action': 'solo', 'value': True}])
+    repeated_time = time.perf_counter() - start
+
+    print(f"Solo com {len(app_names)} apps:")
+    print(f"   chamadas individuais: {naive * 1000:.2f} ms")
+    print(f"   lote: {batched * 1000:.2f} ms (aplicados {report['applied']}, ignorados {report['skipped']})")
+    print(f"   lote repetido: {repeated_time * 1000:.2f} ms (aplicados {repeated['applied']}, ignorados {repeated['skipped']})")
+
+    def unplugged(*args: Any) -> None:
+        raise OSError("sessão desconectada")
+
+    source.sessions[0].SimpleAudioVolume.SetMute = unplugged
+    failed = service.apply([{'target': 'app', 'id': app_names[1], 'action': 'solo', 'value': True}])
+    print(f"   solo com escrita falha: ok={failed['results'][0]['ok']}, solo mantido em '{service.solo_app}' "
+          f"(esperado '{app_names[0]}')")
+
+
+if __name__ == "__main__":
+    main()
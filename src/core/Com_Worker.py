@@ -0,0 +1,274 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from src.core.Metrics import Metrics_Registry
+
+PRIORITY_CONTROL = 0
+PRIORITY_ENUMERATION = 1
+PRIORITY_ICON = 2
+PRIORITY_NAMES = {PRIORITY_CONTROL: 'control', PRIORITY_ENUMERATION: 'enumeration', PRIORITY_ICON: 'icon'}
+
+
+def init_com_thread() -> None:
+    try:
+        import comtypes
+        comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
+    except Exception:
+        pass
+
+
+class _Job:
+    __slots__ = ('priority', 'seq', 'func', 'args', 'kwargs', 'future', 'key', 'submitted')
+
+    def __init__(self, priority: int, seq: int, func: Callable[..., Any], args: Any, kwargs: Any, key: Optional[Hashable]) -> None:
+        self.priority = priority
+        self.seq = seq
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.key = key
+        self.submitted = time.perf_counter()
+
+    def __lt__(self, other: '_Job') -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class Com_Executor:
+    _shared: Optional['Com_Executor'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, workers: int = 2, reserved: int = 1, thread_initializer: Optional[Callable[[], None]] = init_com_thread,
+                 metrics: Optional[Metrics_Registry] = None) -> None:
+        self.workers = max(1, workers)
+        self.reserved = max(0, min(reserved, self.workers - 1))
+        self.thread_initializer = thread_initializer
+        self.metrics = metrics or Metrics_Registry.shared()
+        self._cond = threading.Condition()
+        self._heap: List[_Job] = []
+        self._keyed: Dict[Hashable, _Job] = {}
+        self._seq = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._worker_idents: set = set()
+        self._running = False
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'superseded': 0,
+            'joined': 0,
+            'inline': 0,
+            'max_depth': 0,
+        }
+
+    @classmethod
+    def shared(cls) -> 'Com_Executor':
+        executor = cls._shared
+        if executor is not None:
+            return executor
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                cls._shared.start()
+            return cls._shared
+
+    @classmethod
+    def set_shared(cls, executor: Optional['Com_Executor']) -> None:
+        with cls._shared_lock:
+            cls._shared = executor
+
+    def submit(self, func: Callable[..., Any], *args: Any, priority: int = PRIORITY_ENUMERATION,
+               key: Optional[Hashable] = None, supersede: bool = False, **kwargs: Any) -> Future:
+        if threading.get_ident() in self._worker_idents:
+            with self._cond:
+                self.stats['inline'] += 1
+            future: Future = Future()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+
+        with self._cond:
+            self.stats['submitted'] += 1
+            if key is not None:
+                pending = self._keyed.get(key)
+                if pending is not None:
+                    if not supersede:
+                        self.stats['joined'] += 1
+                        return pending.future
+                    pending.future.cancel()
+                    self.stats['superseded'] += 1
+
+            job = _Job(priority, next(self._seq), func, args, kwargs, key)
+            heapq.heappush(self._heap, job)
+            if key is not None:
+                self._keyed[key] = job
+            depth = len(self._heap)
+            if depth > self.stats['max_depth']:
+                self.stats['max_depth'] = depth
+            self._cond.notify_all()
+            return job.future
+
+    def call(self, func: Callable[..., Any], *args: Any, priority: int = PRIORITY_ENUMERATION, key: Optional[Hashable] = None,
+             supersede: bool = False, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        return self.submit(func, *args, priority=priority, key=key, supersede=supersede, **kwargs).result(timeout)
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            for index in range(self.workers):
+                max_priority = PRIORITY_CONTROL if index < self.reserved else None
+                thread = threading.Thread(target=self._run, args=(max_priority,), name=f"ComWorker-{index}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._running = False
+            pending, self._heap = self._heap, []
+            self._keyed.clear()
+            self._cond.notify_all()
+        for job in pending:
+            job.future.cancel()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def get_depth(self) -> Dict[str, int]:
+        with self._cond:
+            depth = {name: 0 for name in PRIORITY_NAMES.values()}
+            for job in self._heap:
+                if not job.future.cancelled():
+                    depth[PRIORITY_NAMES.get(job.priority, str(job.priority))] += 1
+            return depth
+
+    def get_stats(self) -> Dict[str, Any]:
+        depth = self.get_depth()
+        with self._cond:
+            return dict(self.stats, depth=depth, workers=self.workers, reserved=self.reserved)
+
+    def _take(self, max_priority: Optional[int]) -> Optional[_Job]:
+        with self._cond:
+            while True:
+                while self._heap and self._heap[0].future.cancelled():
+                    heapq.heappop(self._heap)
+                if not self._running:
+                    return None
+                if self._heap and (max_priority is None or self._heap[0].priority <= max_priority):
+                    job = heapq.heappop(self._heap)
+                    if job.key is not None and self._keyed.get(job.key) is job:
+                        del self._keyed[job.key]
+                    if job.future.set_running_or_notify_cancel():
+                        return job
+                    continue
+                self._cond.wait()
+
+    def _run(self, max_priority: Optional[int]) -> None:
+        self._worker_idents.add(threading.get_ident())
+        if self.thread_initializer:
+            self.thread_initializer()
+
+        while True:
+            job = self._take(max_priority)
+            if job is None:
+                return
+
+            name = PRIORITY_NAMES.get(job.priority, str(job.priority))
+            started = time.perf_counter()
+            self.metrics.record(f"com_worker.wait.{name}", started - job.submitted)
+            try:
+                result = job.func(*job.args, **job.kwargs)
+            except BaseException as e:
+                job.future.set_exception(e)
+                failed = True
+            else:
+                job.future.set_result(result)
+                failed = False
+            self.metrics.record(f"com_worker.run.{name}", time.perf_counter() - started, failed)
+            with self._cond:
+                self.stats['failed' if failed else 'completed'] += 1
+
+
+def main():
+    print("=== Benchmark do Com Executor ===\n")
+
+    def enumerate_devices() -> int:
+        time.sleep(0.01)
+        return 12
+
+    def set_mute(value: bool) -> bool:
+        time.sleep(0.0005)
+        return value
+
+    def render_icon(index: int) -> int:
+        time.sleep(0.003)
+        return index
+
+    for label, workers, reserved, prioritized in (
+        ("FIFO, 1 worker", 1, 0, False),
+        ("prioridade, 1 worker", 1, 0, True),
+        ("prioridade, 2 workers (1 reservado)", 2, 1, True),
+    ):
+        metrics = Metrics_Registry()
+        executor = Com_Executor(workers=workers, reserved=reserved, thread_initializer=None, metrics=metrics)
+        executor.start()
+        stop = threading.Event()
+
+        def flood() -> None:
+            while not stop.is_set():
+                for _ in range(4):
+                    executor.submit(enumerate_devices, priority=PRIORITY_ENUMERATION if prioritized else PRIORITY_CONTROL)
+                for index in range(8):
+                    executor.submit(render_icon, index, priority=PRIORITY_ICON if prioritized else PRIORITY_CONTROL)
+                time.sleep(0.1)
+
+        producers = [threading.Thread(target=flood, daemon=True)]
+        for producer in producers:
+            producer.start()
+
+        latencies = []
+        for i in range(60):
+            start = time.perf_counter()
+            executor.call(set_mute, i % 2 == 0, priority=PRIORITY_CONTROL, timeout=30)
+            latencies.append((time.perf_counter() - start) * 1000)
+            time.sleep(0.013)
+
+        stop.set()
+        for producer in producers:
+            producer.join()
+        stats = executor.get_stats()
+        executor.stop()
+
+        latencies.sort()
+        print(f"{label}:")
+        print(f"   mute: p50 {latencies[len(latencies) // 2]:7.2f} ms, p95 {latencies[int(len(latencies) * 0.95)]:7.2f} ms, "
+              f"max {latencies[-1]:7.2f} ms")
+        print(f"   fila máxima: {stats['max_depth']}, concluídos: {stats['completed']}")
+
+    executor = Com_Executor(workers=1, reserved=0, thread_initializer=None, metrics=Metrics_Registry())
+    executor.start()
+    blocker = executor.submit(time.sleep, 0.05, priority=PRIORITY_CONTROL)
+    futures = [executor.submit(set_mute, i, priority=PRIORITY_CONTROL, key=('volume', 'spotify'), supersede=True) for i in range(100)]
+    reads = [executor.submit(enumerate_devices, key=('get_output_devices',)) for _ in range(50)]
+    blocker.result()
+    final = futures[-1].result()
+    cancelled = sum(1 for future in futures if future.cancelled())
+    try:
+        futures[0].result()
+    except CancelledError:
+        pass
+    reads[0].result()
+    stats = executor.get_stats()
+    executor.stop()
+    print(f"\nSupersessão: 100 volumes -> {cancelled} cancelados, valor final {final}")
+    print(f"Leituras idênticas: 50 pedidos -> {len({id(f) for f in reads})} execução(ões), {stats['joined']} agregados")
+
+
+if __name__ == "__main__":
+    main()
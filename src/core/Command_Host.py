@@ -0,0 +1,342 @@
+import itertools
+import json
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as Future_Timeout
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.core.Activity_Log import Activity_Log
+from src.core.Metrics import Metrics_Registry
+
+POWERSHELL_WORKER_SCRIPT = r'''
+[Console]::InputEncoding = [Text.Encoding]::UTF8
+[Console]::OutputEncoding = [Text.Encoding]::UTF8
+$importError = $null
+try {
+    Import-Module AudioDeviceCmdlets -Force -ErrorAction Stop
+} catch {
+    $importError = $_.Exception.Message
+}
+[Console]::Out.WriteLine('{"ready":true}')
+[Console]::Out.Flush()
+
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if ($line -eq $null) { break }
+    if ($line.Trim() -eq '') { continue }
+
+    $response = @{ id = $null; ok = $true; result = $null; error = $null }
+    try {
+        $request = $line | ConvertFrom-Json
+        $response.id = $request.id
+        $params = $request.args
+
+        switch ($request.command) {
+            'ping' {
+                $response.result = 'pong'
+            }
+            'set_default_device' {
+                if ($importError) { throw $importError }
+                if ($params.communication) {
+                    Set-AudioDevice -ID $params.device_id -CommunicationOnly -ErrorAction Stop | Out-Null
+                } else {
+                    Set-AudioDevice -ID $params.device_id -ErrorAction Stop | Out-Null
+                }
+                $response.result = $params.device_id
+            }
+            default {
+                throw "Comando desconhecido: $($request.command)"
+            }
+        }
+    } catch {
+        $response.ok = $false
+        $response.error = $_.Exception.Message
+    }
+
+    [Console]::Out.WriteLine(($response | ConvertTo-Json -Compress -Depth 5))
+    [Console]::Out.Flush()
+}
+'''
+
+PYTHON_STANDIN_WORKER_SCRIPT = r'''
+import json, sys, time
+print(json.dumps({'ready': True}), flush=True)
+for line in sys.stdin:
+    if not line.strip():
+        continue
+    request = json.loads(line)
+    response = {'id': request.get('id'), 'ok': True, 'result': None, 'error': None}
+    args = request.get('args') or {}
+    command = request.get('command')
+    if command == 'ping':
+        response['result'] = 'pong'
+    elif command == 'echo':
+        response['result'] = args
+    elif command == 'sleep':
+        time.sleep(args.get('seconds', 0))
+        response['result'] = args.get('seconds', 0)
+    elif command == 'crash':
+        sys.exit(1)
+    else:
+        response['ok'] = False
+        response['error'] = 'Comando desconhecido: %s' % command
+    print(json.dumps(response), flush=True)
+'''
+
+
+def powershell_host_argv() -> List[str]:
+    return ['powershell', '-NoProfile', '-NoLogo', '-ExecutionPolicy', 'Bypass', '-Command', POWERSHELL_WORKER_SCRIPT]
+
+
+def python_standin_host_argv() -> List[str]:
+    return [sys.executable, '-u', '-c', PYTHON_STANDIN_WORKER_SCRIPT]
+
+
+class Command_Host_Error(Exception):
+    pass
+
+
+class Command_Timeout(Command_Host_Error):
+    pass
+
+
+class _Worker_Process:
+    def __init__(self, process: subprocess.Popen) -> None:
+        self.process = process
+        self.closed = False
+
+    def is_alive(self) -> bool:
+        return not self.closed and self.process.poll() is None
+
+
+class Command_Host:
+    def __init__(self, argv: List[str], ready_timeout: float = 20.0) -> None:
+        self.argv = argv
+        self.ready_timeout = ready_timeout
+        self.in_flight = 0
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._worker: Optional[_Worker_Process] = None
+        self._pending: Dict[int, Tuple[Future, _Worker_Process]] = {}
+        self._ids = itertools.count(1)
+        self._started_once = False
+        self.stats = {
+            'requests': 0,
+            'failures': 0,
+            'timeouts': 0,
+            'restarts': 0,
+        }
+
+    def is_alive(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.is_alive():
+                return
+            if self._started_once:
+                self.stats['restarts'] += 1
+            self._started_once = True
+            self._spawn()
+
+    def stop(self) -> None:
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None:
+            self._kill(worker)
+
+    def request(self, command: str, args: Optional[Dict[str, Any]] = None, timeout: float = 10.0) -> Any:
+        with Metrics_Registry.shared().timer(f"command_host.{command}"):
+            return self._request(command, args, timeout)
+
+    def _request(self, command: str, args: Optional[Dict[str, Any]], timeout: float) -> Any:
+        request_id = next(self._ids)
+        future: Future = Future()
+        with self._lock:
+            self.start()
+            worker = self._worker
+            self._pending[request_id] = (future, worker)
+            self.in_flight += 1
+            self.stats['requests'] += 1
+
+        frame = json.dumps({'id': request_id, 'command': command, 'args': args or {}}) + '\n'
+        try:
+            with self._write_lock:
+                worker.process.stdin.write(frame)
+                worker.process.stdin.flush()
+            response = future.result(timeout=timeout)
+        except Future_Timeout:
+            with self._lock:
+                self.stats['timeouts'] += 1
+            self._restart(worker)
+            raise Command_Timeout(f"Timeout de {timeout}s no comando '{command}'")
+        except (OSError, ValueError) as e:
+            with self._lock:
+                self.stats['failures'] += 1
+            self._restart(worker)
+            raise Command_Host_Error(f"Falha ao enviar comando '{command}': {e}")
+        except Command_Host_Error:
+            with self._lock:
+                self.stats['failures'] += 1
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+                self.in_flight -= 1
+
+        if not response.get('ok'):
+            with self._lock:
+                self.stats['failures'] += 1
+            raise Command_Host_Error(response.get('error') or f"Comando '{command}' falhou")
+        return response.get('result')
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats, in_flight=self.in_flight, alive=self.is_alive())
+
+    def _spawn(self) -> None:
+        with Metrics_Registry.shared().timer('subprocess.spawn'):
+            self._spawn_worker()
+
+    def _spawn_worker(self) -> None:
+        process = subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+        worker = _Worker_Process(process)
+        ready = threading.Event()
+        threading.Thread(target=self._read_loop, args=(worker, ready), name="CommandHostReader", daemon=True).start()
+
+        if not ready.wait(self.ready_timeout) or not worker.is_alive():
+            self._kill(worker)
+            raise Command_Host_Error("Processo de comandos não ficou pronto a tempo")
+        self._worker = worker
+
+    def _read_loop(self, worker: _Worker_Process, ready: threading.Event) -> None:
+        try:
+            for line in worker.process.stdout:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+
+                if not isinstance(message, dict):
+                    continue
+                if message.get('ready'):
+                    ready.set()
+                    continue
+
+                with self._lock:
+                    pending = self._pending.get(message.get('id'))
+                if pending and not pending[0].done():
+                    pending[0].set_result(message)
+        except (OSError, ValueError):
+            pass
+        finally:
+            worker.closed = True
+            ready.set()
+            with self._lock:
+                orphaned = [future for future, owner in self._pending.values() if owner is worker]
+            for future in orphaned:
+                if not future.done():
+                    future.set_exception(Command_Host_Error("Processo de comandos encerrado"))
+
+    def _restart(self, worker: _Worker_Process) -> None:
+        with self._lock:
+            if self._worker is worker:
+                self._worker = None
+        self._kill(worker)
+
+    @staticmethod
+    def _kill(worker: _Worker_Process) -> None:
+        try:
+            worker.process.kill()
+            worker.process.wait(timeout=2)
+        except Exception:
+            pass
+
+
+class Command_Host_Pool:
+    _shared: Optional['Command_Host_Pool'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, factory: Optional[Callable[[], Command_Host]] = None, size: int = 2) -> None:
+        self.factory = factory or (lambda: Command_Host(powershell_host_argv()))
+        self.hosts = [self.factory() for _ in range(size)]
+
+    @classmethod
+    def shared(cls) -> 'Command_Host_Pool':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def set_shared(cls, pool: Optional['Command_Host_Pool']) -> None:
+        with cls._shared_lock:
+            cls._shared = pool
+
+    def request(self, command: str, args: Optional[Dict[str, Any]] = None, timeout: float = 10.0) -> Any:
+        host = min(self.hosts, key=lambda h: (h.in_flight, not h.is_alive()))
+        return host.request(command, args, timeout)
+
+    def warm_up(self) -> None:
+        for host in self.hosts:
+            try:
+                host.start()
+            except Exception as e:
+                Activity_Log.shared().error('commands', f"Erro ao iniciar processo de comandos: {e}")
+
+    def stop(self) -> None:
+        for host in self.hosts:
+            host.stop()
+
+    def get_stats(self) -> List[Dict[str, int]]:
+        return [host.get_stats() for host in self.hosts]
+
+
+def main():
+    print("=== Teste do Command Host (worker Python substituto) ===\n")
+
+    runs = 10
+    start = time.perf_counter()
+    for _ in range(runs):
+        subprocess.run([sys.executable, '-c', 'print("pong")'], capture_output=True, text=True, timeout=10)
+    spawn_time = (time.perf_counter() - start) / runs
+
+    pool = Command_Host_Pool(lambda: Command_Host(python_standin_host_argv()), size=2)
+    pool.warm_up()
+
+    start = time.perf_counter()
+    for i in range(200):
+        assert pool.request('echo', {'device_id': f'{{0.0.0.00000000}}.{{{i}}}" ; Remove-Item *'}) is not None
+    warm_time = (time.perf_counter() - start) / 200
+
+    print(f"Processo por comando: {spawn_time * 1000:.2f} ms por chamada")
+    print(f"Host persistente: {warm_time * 1000:.3f} ms por chamada")
+
+    try:
+        pool.hosts[0].request('sleep', {'seconds': 2}, timeout=0.2)
+    except Command_Timeout as e:
+        print(f"Timeout tratado: {e}")
+
+    try:
+        pool.hosts[1].request('crash')
+    except Command_Host_Error as e:
+        print(f"Crash tratado: {e}")
+
+    print(f"Após reinício: {pool.request('ping')} / {pool.hosts[1].request('ping')}")
+    print(f"Estatísticas: {pool.get_stats()}")
+    pool.stop()
+
+
+if __name__ == "__main__":
+    main()
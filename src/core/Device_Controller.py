@@ -1,127 +1,58 @@
-from pycaw.pycaw import AudioUtilities
-from comtypes import CLSCTX_ALL
-from pycaw.pycaw import IAudioEndpointVolume
-import subprocess
 from typing import List, Dict, Any, Optional
+from src.core.Activity_Log import Activity_Log
+from src.core.Audio_Backend import Audio_Backend
+from src.core.Command_Host import Command_Timeout
+from src.core.Endpoint_Inventory import Endpoint_Inventory
 
 class Devices_Services:
     @staticmethod
     def get_output_devices() -> List[Dict[str, Any]]:
-        try:
-            devices_enum = AudioUtilities.GetDeviceEnumerator()
-            devices = devices_enum.EnumAudioEndpoints(0, 1)
-            default_device = AudioUtilities.GetSpeakers()
-
-            output_devices = []
-            for i in range(devices.GetCount()):
-                device = devices.Item(i)
-                if device:
-                    try:
-                        device_id = device.GetId()
-                        created_device = AudioUtilities.CreateDevice(device)
-
-                        if created_device and hasattr(created_device, 'FriendlyName'):
-                            friendly_name = created_device.FriendlyName
-                        else:
-                            friendly_name = f"Dispositivos de saida {device_id}"
-
-                        volume = Devices_Services.get_device_volume(device_id, 'output') or 50
-                        is_muted = Devices_Services.get_device_mute_state(device_id, 'output')
-                        is_default = (default_device.GetId() == device_id) if default_device else False
-
-                        output_devices.append({
-                            'id': device_id,
-                            'name': friendly_name,
-                            'type': 'output',
-                            'volume': volume,
-                            'is_muted': is_muted,
-                            'is_default': is_default
-                        })
-                    except Exception as e:
-                        print(f"Erro ao processar dispositivo de saída: {e}")
-
-            return output_devices
-        except Exception as e:
-            print(f"Erro ao obter dispositivos de saída: {e}")
-            return []
+        return Devices_Services._list_devices('output')
 
     @staticmethod
     def get_input_devices() -> List[Dict[str, Any]]:
+        return Devices_Services._list_devices('input')
+
+    @staticmethod
+    def _list_devices(device_type: str) -> List[Dict[str, Any]]:
+        label = "saída" if device_type == 'output' else "entrada"
         try:
-            devices_enum = AudioUtilities.GetDeviceEnumerator()
-            devices = devices_enum.EnumAudioEndpoints(1, 1)
-            default_device = AudioUtilities.GetMicrophone()
-
-            input_devices = []
-            for i in range(devices.GetCount()):
-                device = devices.Item(i)
-                if device:
-                    try:
-                        device_id = device.GetId()
-                        created_device = AudioUtilities.CreateDevice(device)
-
-                        if created_device and hasattr(created_device, 'FriendlyName'):
-                            friendly_name = created_device.FriendlyName
-                        else:
-                            friendly_name = f"Dispositivo de Entrada {device_id}"
-
-                        volume = Devices_Services.get_device_volume(device_id, 'input') or 50
-                        is_muted = Devices_Services.get_device_mute_state(device_id, 'input')
-                        is_default = (default_device.GetId() == device_id) if default_device else False
-
-                        input_devices.append({
-                            'id': device_id,
-                            'name': friendly_name,
-                            'type': 'input',
-                            'volume': volume,
-                            'is_muted': is_muted,
-                            'is_default': is_default
-                        })
-                    except Exception as e:
-                        print(f"Erro ao processar dispositivo de entrada: {e}")
-
-            return input_devices
+            devices = []
+            for endpoint in Endpoint_Inventory.shared().get_endpoints(device_type):
+                try:
+                    devices.append(endpoint.to_dict())
+                except Exception as e:
+                    Activity_Log.shared().error('devices', f"Erro ao processar dispositivo de {label}: {e}")
+            return devices
         except Exception as e:
-            print(f"Erro ao obter dispositivos de entrada: {e}")
+            Activity_Log.shared().error('devices', f"Erro ao obter dispositivos de {label}: {e}")
             return []
 
     @staticmethod
     def set_output_device(device_id: str) -> bool:
         try:
-            script = f'''
-            Import-Module AudioDeviceCmdLets -Force
-            Set-AudioDevice -ID "{device_id}"
-            '''
-
-            result = subprocess.run([
-                'powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', script
-            ], capture_output=True, text=True, timeout=5)
-
-            return result.returncode == 0
+            Audio_Backend.shared().set_default_device(device_id, 'output')
+            Endpoint_Inventory.shared().invalidate()
+            return True
 
-        except subprocess.TimeoutExpired:
-            print("Timeout ao executar script PowerShell para dispositivo de saída")
+        except Command_Timeout:
+            Activity_Log.shared().error('devices', "Timeout ao executar script PowerShell para dispositivo de saída")
         except Exception as e:
-            print(f"Erro ao definir dispositivo de saída: {e}")
+            Activity_Log.shared().error('devices', f"Erro ao definir dispositivo de saída: {e}")
+        return False
 
     @staticmethod
     def set_input_device(device_id: str) -> bool:
         try:
-            script = f'''
-            Import-Module AudioDeviceCmdlets -Force
-            Set-AudioDevice -ID "{device_id}" -CommunicationDefault
-            '''
-
-            result = subprocess.run([
-                'powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', script
-            ], capture_output=True, text=True, timeout=5)
-
-            return result.returncode == 0
+            Audio_Backend.shared().set_default_device(device_id, 'input')
+            Endpoint_Inventory.shared().invalidate()
+            return True
 
-        except subprocess.TimeoutExpired:
-            print("Timeout ao executar script PowerShell para dispositivo de entrada")
+        except Command_Timeout:
+            Activity_Log.shared().error('devices', "Timeout ao executar script PowerShell para dispositivo de entrada")
         except Exception as e:
-            print(f"Erro ao definir dispositivo de entrada: {e}")
+            Activity_Log.shared().error('devices', f"Erro ao definir dispositivo de entrada: {e}")
+        return False
 
     @staticmethod
     def get_all_devices() -> Dict[str, List[Dict[str, Any]]]:
@@ -133,90 +64,57 @@ class Devices_Services:
     @staticmethod
     def get_device_by_id(device_id: str, device_type: str) -> Optional[Any]:
         try:
-            devices_enum = AudioUtilities.GetDeviceEnumerator()
-            endpoint_type = 0 if device_type == 'output' else 1
-            devices = devices_enum.EnumAudioEndpoints(endpoint_type, 1)
-
-            for i in range(devices.GetCount()):
-                device = devices.Item(i)
-                if device and device.GetId() == device_id:
-                    return device
-            return None
+            endpoint = Endpoint_Inventory.shared().get(device_id, device_type)
+            return endpoint.device if endpoint else None
         except Exception as e:
-            print(f"Erro ao buscar dispositivo {device_id}: {e}")
+            Activity_Log.shared().error('devices', f"Erro ao buscar dispositivo {device_id}: {e}")
             return None
 
     @staticmethod
     def set_device_volume(device_id: str, device_type: str, volume_level: float) -> bool:
         try:
-            device = Devices_Services.get_device_by_id(device_id, device_type)
-            if not device:
-                print(f"Dispositivo {device_id} não encontrado")
+            endpoint = Endpoint_Inventory.shared().get(device_id, device_type)
+            if not endpoint:
+                Activity_Log.shared().warning('devices', f"Dispositivo {device_id} não encontrado")
                 return False
 
-            interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            volume_interface = interface.QueryInterface(IAudioEndpointVolume)
-
             volume_scalar = max(0.0, min(1.0, volume_level / 100.0))
-            volume_interface.SetMasterVolumeLevelScalar(volume_scalar, None)
+            endpoint.volume_interface.SetMasterVolumeLevelScalar(volume_scalar, None)
 
-            print(f"Volume do dispositivo {device_id} definido para {volume_level}%")
+            Activity_Log.shared().info('devices', f"Volume do dispositivo {device_id} definido para {volume_level}%")
             return True
         except Exception as e:
-            print(f"Erro ao definir volume do dispositivo {device_id}: {e}")
+            Activity_Log.shared().error('devices', f"Erro ao definir volume do dispositivo {device_id}: {e}")
             return False
 
     @staticmethod
     def toggle_device_mute(device_id: str, device_type: str) -> Optional[bool]:
         try:
-            device = Devices_Services.get_device_by_id(device_id, device_type)
-            if not device:
-                print(f"Dispositivo {device_id} não encontrado")
+            endpoint = Endpoint_Inventory.shared().get(device_id, device_type)
+            if not endpoint:
+                Activity_Log.shared().warning('devices', f"Dispositivo {device_id} não encontrado")
                 return None
 
-            interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            volume_interface = interface.QueryInterface(IAudioEndpointVolume)
-
+            volume_interface = endpoint.volume_interface
             current_mute = volume_interface.GetMute()
             new_mute = not current_mute
             volume_interface.SetMute(new_mute, None)
 
-            print(f"Dispositivo {device_id} {'mutado' if new_mute else 'desmutado'}")
+            Activity_Log.shared().info('devices', f"Dispositivo {device_id} {'mutado' if new_mute else 'desmutado'}")
             return new_mute
         except Exception as e:
-            print(f"Erro ao alternar mute do dispositivo {device_id}: {e}")
+            Activity_Log.shared().error('devices', f"Erro ao alternar mute do dispositivo {device_id}: {e}")
             return None
 
     @staticmethod
     def get_device_volume(device_id: str, device_type: str) -> Optional[int]:
-        try:
-            device = Devices_Services.get_device_by_id(device_id, device_type)
-            if not device:
-                return None
-
-            interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            volume_interface = interface.QueryInterface(IAudioEndpointVolume)
-
-            volume_scalar = volume_interface.GetMasterVolumeLevelScalar()
-            return int(volume_scalar * 100)
-        except Exception as e:
-            print(f"Erro ao obter volume do dispositivo {device_id}: {e}")
-            return None
+        endpoint = Endpoint_Inventory.shared().get(device_id, device_type)
+        return endpoint.get_volume() if endpoint else None
 
     @staticmethod
     def get_device_mute_state(device_id: str, device_type: str) -> bool:
-        try:
-            device = Devices_Services.get_device_by_id(device_id, device_type)
-            if not device:
-                return False
-
-            interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-            volume_interface = interface.QueryInterface(IAudioEndpointVolume)
-
-            return volume_interface.GetMute()
-        except Exception as e:
-            print(f"Erro ao obter estado de mute do dispositivo {device_id}: {e}")
-            return False
+        endpoint = Endpoint_Inventory.shared().get(device_id, device_type)
+        return endpoint.get_mute() if endpoint else False
 
 def main():
     pass
@@ -0,0 +1,314 @@
+import json
+import math
+import os
+import random
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import numpy as np
+from src.core.Process_Cache import normalize_app_name
+
+DUCK_FORMAT_VERSION = 1
+
+DUCK_RULE_DEFAULTS = {
+    'threshold_db': -36.0,
+    'depth_db': 12.0,
+    'attack_ms': 40.0,
+    'hold_ms': 500.0,
+    'release_ms': 800.0,
+    'enabled': True,
+}
+
+Duck_Rule = Dict[str, Any]
+
+
+class Duck_Rule_Error(Exception):
+    pass
+
+
+def _default_rules_path() -> str:
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'SonusMixer', 'state', 'ducking.json')
+
+
+def normalize_meter_key(key: str) -> str:
+    if key.startswith('app:'):
+        return 'app:' + normalize_app_name(key[4:])
+    return key
+
+
+def compile_rules(rules: Iterable[Duck_Rule]) -> List[Duck_Rule]:
+    compiled = []
+    seen = set()
+    for index, rule in enumerate(rules):
+        rule = dict(DUCK_RULE_DEFAULTS, **rule)
+        rule['id'] = str(rule.get('id') or f"rule_{index}")
+        if rule['id'] in seen:
+            raise Duck_Rule_Error(f"Regra de ducking duplicada: '{rule['id']}'")
+        seen.add(rule['id'])
+
+        rule['triggers'] = [normalize_meter_key(str(key)) for key in rule.get('triggers', [])]
+        rule['targets'] = [normalize_app_name(str(name)) for name in rule.get('targets', [])]
+        if not rule['triggers'] or not rule['targets']:
+            raise Duck_Rule_Error(f"Regra '{rule['id']}' precisa de gatilhos e alvos")
+        for field in ('threshold_db', 'depth_db', 'attack_ms', 'hold_ms', 'release_ms'):
+            try:
+                rule[field] = float(rule[field])
+            except (TypeError, ValueError):
+                raise Duck_Rule_Error(f"Valor inválido para '{field}' na regra '{rule['id']}'")
+        rule['depth_db'] = max(0.0, min(96.0, rule['depth_db']))
+        if rule['enabled']:
+            compiled.append(rule)
+    return compiled
+
+
+class Ducking_Engine:
+    def __init__(self, sink: Optional[Callable[[Dict[str, float]], Any]] = None, rules: Iterable[Duck_Rule] = (), step_db: float = 0.5) -> None:
+        self.sink = sink
+        self.step_db = step_db
+        self._lock = threading.Lock()
+        self.rules: List[Duck_Rule] = []
+        self._env = np.zeros(0, dtype=np.float64)
+        self._hold_left = np.zeros(0, dtype=np.float64)
+        self._keys: Optional[List[str]] = None
+        self._written: Dict[str, float] = {}
+        self._released: Dict[str, float] = {}
+        self.stats = {
+            'ticks': 0,
+            'layouts': 0,
+            'writes': 0,
+            'apps_written': 0,
+            'tick_ms_total': 0.0,
+        }
+        self.set_rules(rules)
+
+    def set_rules(self, rules: Iterable[Duck_Rule]) -> int:
+        compiled = compile_rules(rules)
+        with self._lock:
+            previous = {rule['id']: (env, hold) for rule, env, hold in zip(self.rules, self._env, self._hold_left)}
+            self.rules = compiled
+            self._threshold = np.array([10.0 ** (rule['threshold_db'] / 20.0) for rule in compiled], dtype=np.float64)
+            self._depth = np.array([rule['depth_db'] for rule in compiled], dtype=np.float64)
+            self._attack = np.array([max(rule['attack_ms'], 0.1) / 1000.0 for rule in compiled], dtype=np.float64)
+            self._release = np.array([max(rule['release_ms'], 0.1) / 1000.0 for rule in compiled], dtype=np.float64)
+            self._hold = np.array([max(rule['hold_ms'], 0.0) / 1000.0 for rule in compiled], dtype=np.float64)
+            self._env = np.array([previous.get(rule['id'], (0.0, 0.0))[0] for rule in compiled], dtype=np.float64)
+            self._hold_left = np.array([previous.get(rule['id'], (0.0, 0.0))[1] for rule in compiled], dtype=np.float64)
+            self._keys = None
+            return len(compiled)
+
+    def process(self, keys: List[str], peaks: np.ndarray, dt: float) -> Dict[str, float]:
+        started = time.perf_counter()
+        with self._lock:
+            if keys is not self._keys:
+                self._compile_layout(keys)
+
+            changes = self._released
+            self._released = {}
+            if len(self.rules):
+                levels = self._levels
+                levels[1:len(peaks) + 1] = peaks
+                rule_level = np.maximum.reduceat(levels[self._trigger_order], self._trigger_offsets)
+
+                active = rule_level >= self._threshold
+                self._hold_left = np.where(active, self._hold, np.maximum(self._hold_left - dt, 0.0))
+                gate = (active | (self._hold_left > 0.0)).astype(np.float64)
+                tau = np.where(gate > self._env, self._attack, self._release)
+                self._env += (gate - self._env) * -np.expm1(-dt / tau)
+
+                if len(self._target_names):
+                    attenuation = np.maximum.reduceat((self._env * self._depth)[self._pair_rule], self._pair_offsets)
+                    quantized = np.round(attenuation / self.step_db) * self.step_db
+                    for index in np.flatnonzero(quantized != self._written_db):
+                        name = self._target_names[index]
+                        self._written_db[index] = quantized[index]
+                        if quantized[index]:
+                            self._written[name] = float(quantized[index])
+                        else:
+                            self._written.pop(name, None)
+                        changes[name] = 10.0 ** (-quantized[index] / 20.0)
+
+            self.stats['ticks'] += 1
+            self.stats['tick_ms_total'] += (time.perf_counter() - started) * 1000.0
+
+        if changes and self.sink is not None:
+            self.sink(changes)
+            with self._lock:
+                self.stats['writes'] += 1
+                self.stats['apps_written'] += len(changes)
+        return changes
+
+    def release_all(self) -> Dict[str, float]:
+        with self._lock:
+            changes = {name: 1.0 for name in self._written}
+            changes.update(self._released)
+            self._written.clear()
+            self._released = {}
+            self._env[:] = 0.0
+            self._hold_left[:] = 0.0
+            self._keys = None
+        if changes and self.sink is not None:
+            self.sink(changes)
+        return changes
+
+    def get_state(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    'id': rule['id'],
+                    'active': bool(self._hold_left[index] > 0.0),
+                    'attenuation_db': round(float(self._env[index] * self._depth[index]), 2)
+                }
+                for index, rule in enumerate(self.rules)
+            ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            ticks = self.stats['ticks']
+            return dict(
+                self.stats,
+                rules=len(self.rules),
+                ducked=len(self._written),
+                tick_ms_avg=self.stats['tick_ms_total'] / ticks if ticks else 0.0
+            )
+
+    def _compile_layout(self, keys: List[str]) -> None:
+        positions = {normalize_meter_key(key): position for position, key in enumerate(keys, start=1)}
+        apps = {normalize_app_name(key[4:]): key[4:] for key in keys if key.startswith('app:')}
+
+        trigger_order, trigger_offsets = [], []
+        targets: Dict[str, List[int]] = {}
+        for index, rule in enumerate(self.rules):
+            trigger_offsets.append(len(trigger_order))
+            members = [positions[key] for key in rule['triggers'] if key in positions]
+            trigger_order.extend(members or [0])
+            for target in rule['targets']:
+                if target in apps:
+                    targets.setdefault(apps[target], []).append(index)
+
+        pair_rule, pair_offsets = [], []
+        for rule_indexes in targets.values():
+            pair_offsets.append(len(pair_rule))
+            pair_rule.extend(rule_indexes)
+
+        for name in list(self._written):
+            if name not in targets:
+                self._released[name] = 1.0
+                del self._written[name]
+
+        self._levels = np.zeros(len(keys) + 1, dtype=np.float64)
+        self._trigger_order = np.asarray(trigger_order, dtype=np.intp)
+        self._trigger_offsets = np.asarray(trigger_offsets, dtype=np.intp)
+        self._pair_rule = np.asarray(pair_rule, dtype=np.intp)
+        self._pair_offsets = np.asarray(pair_offsets, dtype=np.intp)
+        self._target_names = list(targets)
+        self._written_db = np.array([self._written.get(name, 0.0) for name in self._target_names], dtype=np.float64)
+        self._keys = keys
+        self.stats['layouts'] += 1
+
+
+class Duck_Rule_Store:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path if path is not None else _default_rules_path()
+        self._lock = threading.Lock()
+
+    def load(self) -> List[Duck_Rule]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(state, dict) or state.get('version') != DUCK_FORMAT_VERSION:
+            return []
+        return [rule for rule in state.get('rules', []) if isinstance(rule, dict)]
+
+    def save(self, rules: List[Duck_Rule]) -> None:
+        data = json.dumps({'version': DUCK_FORMAT_VERSION, 'rules': rules}, ensure_ascii=False, separators=(',', ':'))
+        directory = os.path.dirname(self.path) or '.'
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+
+
+def _naive_ducking(rules: List[Duck_Rule], keys: List[str], trace: np.ndarray, dt: float) -> int:
+    positions = {key: index for index, key in enumerate(keys)}
+    env = [0.0] * len(rules)
+    hold_left = [0.0] * len(rules)
+    written: Dict[str, float] = {}
+    writes = 0
+    for peaks in trace:
+        attenuation: Dict[str, float] = {}
+        for index, rule in enumerate(rules):
+            level = max((peaks[positions[key]] for key in rule['triggers'] if key in positions), default=0.0)
+            if level >= 10.0 ** (rule['threshold_db'] / 20.0):
+                hold_left[index] = rule['hold_ms'] / 1000.0
+            else:
+                hold_left[index] = max(hold_left[index] - dt, 0.0)
+            gate = 1.0 if hold_left[index] > 0.0 else 0.0
+            tau = (rule['attack_ms'] if gate > env[index] else rule['release_ms']) / 1000.0
+            env[index] += (gate - env[index]) * (1.0 - math.exp(-dt / tau))
+            for target in rule['targets']:
+                attenuation[target] = max(attenuation.get(target, 0.0), env[index] * rule['depth_db'])
+        for target, value in attenuation.items():
+            value = round(value / 0.5) * 0.5
+            if written.get(target, 0.0) != value:
+                written[target] = value
+                writes += 1
+    return writes
+
+
+def main():
+    print("=== Benchmark do Ducking Engine ===\n")
+
+    dt = 1.0 / 30.0
+    ticks = 300
+    rng = random.Random(0)
+    np_rng = np.random.default_rng(0)
+
+    for apps, rule_count in ((40, 4), (400, 100), (2000, 1000)):
+        keys = [f"app:app{i}" for i in range(apps)] + ['channel:main_input']
+        rules = compile_rules([
+            {
+                'id': f"rule_{r}",
+                'triggers': [f"app:app{rng.randrange(apps)}" for _ in range(2)] + (['channel:main_input'] if r % 4 == 0 else []),
+                'targets': [f"app{rng.randrange(apps)}" for _ in range(5)],
+            }
+            for r in range(rule_count)
+        ])
+
+        speaking = np.repeat(np_rng.random((ticks // 15 + 1, len(keys))) < 0.3, 15, axis=0)[:ticks]
+        trace = np.where(speaking, np_rng.uniform(0.05, 0.9, (ticks, len(keys))), np_rng.uniform(0.0, 0.005, (ticks, len(keys))))
+
+        writes = []
+        engine = Ducking_Engine(lambda changes: writes.append(len(changes)), rules)
+        start = time.perf_counter()
+        for peaks in trace:
+            engine.process(keys, peaks, dt)
+        vectorized = (time.perf_counter() - start) / ticks
+
+        naive_ticks = min(ticks, 60)
+        start = time.perf_counter()
+        _naive_ducking(rules, keys, trace[:naive_ticks], dt)
+        naive = (time.perf_counter() - start) / naive_ticks
+
+        silent = np.zeros(len(keys))
+        settle = 0
+        for _ in range(ticks):
+            if engine.process(keys, silent, dt):
+                settle += 1
+        idle_writes = len(writes)
+        for _ in range(30):
+            engine.process(keys, silent, dt)
+
+        print(f"{apps} apps / {rule_count} regras:")
+        print(f"   vetorizado: {vectorized * 1000:.3f} ms por tick, laço por regra: {naive * 1000:.3f} ms por tick")
+        print(f"   escritas: {sum(writes)} ganhos em {idle_writes} lotes ({ticks} ticks com fala, {settle} ticks de release)")
+        print(f"   em silêncio depois do release: {len(writes) - idle_writes} lotes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from src.core.Activity_Log import Activity_Log
+from src.core.Metrics import Metrics_Registry
+
+VIRTUAL_CABLE_KEYWORDS = [
+    'CABLE',
+    'VB-Audio',
+    'Virtual',
+    'Voicemeeter',
+    'VAC',
+    'Virtual Audio Cable'
+]
+
+FLOW_IDS = {'output': 0, 'input': 1}
+
+
+def is_virtual_cable_name(device_name: str) -> bool:
+    return any(keyword.lower() in device_name.lower() for keyword in VIRTUAL_CABLE_KEYWORDS)
+
+
+class Endpoint_Info:
+    def __init__(self, device_id: str, name: str, flow: str, is_default: bool, device: Any, volume_interface: Any) -> None:
+        self.id = device_id
+        self.name = name
+        self.flow = flow
+        self.is_default = is_default
+        self.is_virtual = is_virtual_cable_name(name)
+        self.device = device
+        self.volume_interface = volume_interface
+
+    def get_volume(self) -> Optional[int]:
+        try:
+            return int(self.volume_interface.GetMasterVolumeLevelScalar() * 100)
+        except Exception as e:
+            Activity_Log.shared().error('devices', f"Erro ao obter volume do dispositivo {self.id}: {e}")
+            return None
+
+    def get_mute(self) -> bool:
+        try:
+            return bool(self.volume_interface.GetMute())
+        except Exception as e:
+            Activity_Log.shared().error('devices', f"Erro ao obter estado de mute do dispositivo {self.id}: {e}")
+            return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        volume = self.get_volume()
+        return {
+            'id': self.id,
+            'name': self.name,
+            'type': self.flow,
+            'volume': volume if volume is not None else 50,
+            'is_muted': self.get_mute(),
+            'is_default': self.is_default
+        }
+
+    def __repr__(self) -> str:
+        return f"Endpoint_Info({self.name!r}, flow={self.flow!r})"
+
+
+class Pycaw_Endpoint_Source:
+    def get_endpoints(self) -> List[Endpoint_Info]:
+        from ctypes import POINTER, cast
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+        devices_enum = AudioUtilities.GetDeviceEnumerator()
+        default_ids = {
+            'output': self._get_default_id(AudioUtilities.GetSpeakers),
+            'input': self._get_default_id(AudioUtilities.GetMicrophone),
+        }
+
+        endpoints = []
+        for flow, flow_id in FLOW_IDS.items():
+            with Metrics_Registry.shared().timer('com.EnumAudioEndpoints'):
+                devices = devices_enum.EnumAudioEndpoints(flow_id, 1)
+            for i in range(devices.GetCount()):
+                device = devices.Item(i)
+                if not device:
+                    continue
+                try:
+                    device_id = device.GetId()
+                    created_device = AudioUtilities.CreateDevice(device)
+
+                    if created_device and getattr(created_device, 'FriendlyName', None):
+                        friendly_name = created_device.FriendlyName
+                    elif flow == 'output':
+                        friendly_name = f"Dispositivos de saida {device_id}"
+                    else:
+                        friendly_name = f"Dispositivo de Entrada {device_id}"
+
+                    with Metrics_Registry.shared().timer('com.Activate'):
+                        interface = device.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+                    volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
+
+                    endpoints.append(Endpoint_Info(
+                        device_id, friendly_name, flow,
+                        device_id == default_ids[flow],
+                        device, volume_interface
+                    ))
+                except Exception as e:
+                    Activity_Log.shared().error('devices', f"Erro ao processar dispositivo de áudio: {e}")
+        return endpoints
+
+    @staticmethod
+    def _get_default_id(get_default: Any) -> Optional[str]:
+        try:
+            device = get_default()
+            return device.GetId() if device else None
+        except Exception:
+            return None
+
+
+class Endpoint_Inventory:
+    _shared: Optional['Endpoint_Inventory'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, source: Optional[Any] = None, max_age: Optional[float] = None) -> None:
+        if source is None:
+            from src.core.Audio_Backend import Audio_Backend
+            source = Audio_Backend.shared()
+        self.source = source
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._endpoints: List[Endpoint_Info] = []
+        self._by_id: Dict[Tuple[str, str], Endpoint_Info] = {}
+        self._by_flow: Dict[str, List[Endpoint_Info]] = {'output': [], 'input': []}
+        self._built_at: Optional[float] = None
+        self.version = 0
+        self.stats = {
+            'builds': 0,
+            'lookups': 0,
+            'invalidations': 0,
+        }
+
+    @classmethod
+    def shared(cls) -> 'Endpoint_Inventory':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def set_shared(cls, inventory: Optional['Endpoint_Inventory']) -> None:
+        with cls._shared_lock:
+            cls._shared = inventory
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._built_at = None
+            self.version += 1
+            self.stats['invalidations'] += 1
+
+    def get_endpoints(self, flow: Optional[str] = None) -> List[Endpoint_Info]:
+        with self._lock:
+            self._ensure_built()
+            if flow is None:
+                return list(self._endpoints)
+            return list(self._by_flow.get(flow, []))
+
+    def get(self, device_id: str, flow: Optional[str] = None) -> Optional[Endpoint_Info]:
+        with self._lock:
+            self._ensure_built()
+            self.stats['lookups'] += 1
+            if flow is not None:
+                return self._by_id.get((flow, device_id))
+            return self._by_id.get(('output', device_id)) or self._by_id.get(('input', device_id))
+
+    def get_default(self, flow: str) -> Optional[Endpoint_Info]:
+        with self._lock:
+            self._ensure_built()
+            return next((endpoint for endpoint in self._by_flow.get(flow, []) if endpoint.is_default), None)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats, endpoints=len(self._endpoints))
+
+    def _ensure_built(self) -> None:
+        if self._built_at is not None:
+            if self.max_age is None or time.monotonic() - self._built_at < self.max_age:
+                return
+
+        endpoints = self.source.get_endpoints()
+        self.stats['builds'] += 1
+
+        self._endpoints = endpoints
+        self._by_id = {(endpoint.flow, endpoint.id): endpoint for endpoint in endpoints}
+        self._by_flow = {'output': [], 'input': []}
+        for endpoint in endpoints:
+            self._by_flow.setdefault(endpoint.flow, []).append(endpoint)
+        self._built_at = time.monotonic()
+
+
+class Fake_Endpoint_Volume:
+    def __init__(self, volume: float = 0.5, muted: bool = False, latency: float = 0.0) -> None:
+        self._volume = volume
+        self._muted = muted
+        self.latency = latency
+
+    def GetMasterVolumeLevelScalar(self) -> float:
+        self._wait()
+        return self._volume
+
+    def SetMasterVolumeLevelScalar(self, level: float, context: Any) -> None:
+        self._wait()
+        self._volume = level
+
+    def GetMute(self) -> bool:
+        self._wait()
+        return self._muted
+
+    def SetMute(self, muted: bool, context: Any) -> None:
+        self._wait()
+        self._muted = bool(muted)
+
+    def _wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+
+class Fake_Endpoint_Source:
+    def __init__(self, outputs: int = 4, inputs: int = 2, virtual: int = 1, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.enumerations = 0
+        self.definitions = []
+        for i in range(outputs):
+            name = f"CABLE Input {i}" if i < virtual else f"Alto-falantes {i}"
+            self.definitions.append((f"{{out-{i}}}", name, 'output', i == virtual))
+        for i in range(inputs):
+            self.definitions.append((f"{{in-{i}}}", f"Microfone {i}", 'input', i == 0))
+        self.volumes = {device_id: Fake_Endpoint_Volume() for device_id, _, _, _ in self.definitions}
+
+    def get_endpoints(self) -> List[Endpoint_Info]:
+        self.enumerations += 1
+        if self.latency:
+            time.sleep(self.latency * len(self.definitions))
+        return [
+            Endpoint_Info(device_id, name, flow, is_default, None, self.volumes[device_id])
+            for device_id, name, flow, is_default in self.definitions
+        ]
+
+
+def main():
+    print("=== Benchmark do Endpoint Inventory ===\n")
+
+    for outputs in (4, 50):
+        source = Fake_Endpoint_Source(outputs=outputs, inputs=outputs // 2, virtual=2, latency=0.0002)
+
+        start = time.perf_counter()
+        for endpoint in source.get_endpoints():
+            next(e for e in source.get_endpoints() if e.id == endpoint.id).get_volume()
+            next(e for e in source.get_endpoints() if e.id == endpoint.id).get_mute()
+        source.get_endpoints()
+        naive = time.perf_counter() - start
+        naive_enumerations = source.enumerations
+
+        source.enumerations = 0
+        inventory = Endpoint_Inventory(source)
+        start = time.perf_counter()
+        listed = [endpoint.to_dict() for endpoint in inventory.get_endpoints()]
+        cables = [endpoint for endpoint in inventory.get_endpoints() if endpoint.is_virtual]
+        for device in listed:
+            inventory.get(device['id'], device['type']).volume_interface.SetMasterVolumeLevelScalar(0.3, None)
+        indexed = time.perf_counter() - start
+
+        print(f"{len(listed)} dispositivos ({len(cables)} cabos virtuais):")
+        print(f"   enumeração repetida: {naive * 1000:.2f} ms ({naive_enumerations} enumerações)")
+        print(f"   inventário: {indexed * 1000:.2f} ms ({source.enumerations} enumeração)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from src.core.Activity_Log import Activity_Log
+
+Event_Batch = List[Dict[str, Any]]
+
+
+class Event_Bus:
+    def __init__(self, window: float = 1 / 30) -> None:
+        self.window = window
+        self._cond = threading.Condition()
+        self._pending: 'OrderedDict[Tuple[str, Hashable], Dict[str, Any]]' = OrderedDict()
+        self._subscribers: List[Callable[[Event_Batch], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.stats = {
+            'published': 0,
+            'coalesced': 0,
+            'batches': 0,
+            'dispatched': 0,
+            'subscriber_errors': 0,
+        }
+
+    def subscribe(self, callback: Callable[[Event_Batch], None]) -> None:
+        with self._cond:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Event_Batch], None]) -> None:
+        with self._cond:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def publish(self, topic: str, key: Hashable = None, data: Optional[Dict[str, Any]] = None) -> None:
+        with self._cond:
+            self.stats['published'] += 1
+            pending_key = (topic, key)
+            event = self._pending.get(pending_key)
+            if event is None:
+                self._pending[pending_key] = {'topic': topic, 'key': key, 'data': dict(data or {})}
+                if len(self._pending) == 1:
+                    self._cond.notify()
+            else:
+                event['data'].update(data or {})
+                self.stats['coalesced'] += 1
+
+    def flush(self) -> Event_Batch:
+        with self._cond:
+            if not self._pending:
+                return []
+            batch = list(self._pending.values())
+            self._pending.clear()
+            subscribers = list(self._subscribers)
+            self.stats['batches'] += 1
+            self.stats['dispatched'] += len(batch)
+
+        for callback in subscribers:
+            try:
+                callback(batch)
+            except Exception as e:
+                with self._cond:
+                    self.stats['subscriber_errors'] += 1
+                Activity_Log.shared().error('events', f"Erro ao despachar eventos: {e}")
+        return batch
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="EventBus", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._cond:
+            return dict(self.stats, pending=len(self._pending))
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+            time.sleep(self.window)
+            self.flush()
+
+
+class Webview_Event_Sink:
+    def __init__(self, window: Any, callback_name: str = 'onMixerEvents') -> None:
+        self.window = window
+        self.callback_name = callback_name
+
+    def __call__(self, batch: Event_Batch) -> None:
+        payload = json.dumps(batch, default=str)
+        self.window.evaluate_js(f"window.{self.callback_name} && window.{self.callback_name}({payload})")
+
+
+def main():
+    print("=== Teste de carga do Event Bus ===\n")
+
+    received = []
+    latencies = []
+
+    def sink(batch):
+        now = time.perf_counter()
+        received.append(len(batch))
+        latencies.extend(now - event['data']['sent_at'] for event in batch)
+
+    bus = Event_Bus(window=1 / 60)
+    bus.subscribe(sink)
+    bus.start()
+
+    def producer(worker):
+        for i in range(20000):
+            bus.publish('app_changed', f"app{(worker * 7 + i) % 50}", {'volume': i % 101, 'sent_at': time.perf_counter()})
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=producer, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    bus.stop()
+
+    stats = bus.get_stats()
+    latencies.sort()
+    print(f"Eventos publicados: {stats['published']} em {elapsed * 1000:.1f} ms ({stats['published'] / elapsed:,.0f} eventos/s)")
+    print(f"Eventos coalescidos: {stats['coalesced']}")
+    print(f"Lotes enviados: {stats['batches']} (média de {sum(received) / max(len(received), 1):.1f} eventos por lote)")
+    if latencies:
+        print(f"Latência p50: {latencies[len(latencies) // 2] * 1000:.2f} ms, p99: {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from src.core.Activity_Log import Activity_Log
+
+FADE_TABLE_SIZE = 256
+FADE_DB_RANGE = 60.0
+WHEEL_SLOTS = 256
+
+
+def _build_curve(shape: Callable[[float], float]) -> Tuple[List[float], List[float]]:
+    rise = [shape(i / FADE_TABLE_SIZE) for i in range(FADE_TABLE_SIZE + 1)]
+    fall = [1.0 - value for value in reversed(rise)]
+    return rise, fall
+
+
+def _db_shape(t: float) -> float:
+    floor = 10.0 ** (-FADE_DB_RANGE / 20.0)
+    return (10.0 ** (FADE_DB_RANGE * (t - 1.0) / 20.0) - floor) / (1.0 - floor)
+
+
+FADE_CURVES = {
+    'linear': _build_curve(lambda t: t),
+    'equal_power': _build_curve(lambda t: math.sin(t * math.pi / 2.0)),
+    'db': _build_curve(_db_shape),
+}
+
+
+class _Fade:
+    __slots__ = ('key', 'start', 'end', 'begin', 'duration', 'table', 'interval', 'due', 'last_written', 'cancelled')
+
+    def __init__(self, key: Hashable, start: float, end: float, begin: float, duration: float, table: List[float], interval: int) -> None:
+        self.key = key
+        self.start = start
+        self.end = end
+        self.begin = begin
+        self.duration = duration
+        self.table = table
+        self.interval = interval
+        self.due = 0
+        self.last_written: Optional[float] = None
+        self.cancelled = False
+
+    def value_at(self, now: float) -> float:
+        if self.duration <= 0.0 or now >= self.begin + self.duration:
+            return self.end
+        if now <= self.begin:
+            return self.start
+        position = (now - self.begin) / self.duration * FADE_TABLE_SIZE
+        index = int(position)
+        table = self.table
+        shape = table[index] + (table[index + 1] - table[index]) * (position - index)
+        return self.start + (self.end - self.start) * shape
+
+
+class Fade_Scheduler:
+    def __init__(self, sink: Callable[[Hashable, float], None], rate_hz: float = 100.0, max_steps: int = 64,
+                 resolution: float = 0.5, thread_initializer: Optional[Callable[[], None]] = None) -> None:
+        self.sink = sink
+        self.tick = 1.0 / rate_hz
+        self.max_steps = max(1, max_steps)
+        self.resolution = resolution
+        self.thread_initializer = thread_initializer
+        self._cond = threading.Condition()
+        self._slots: List[List[_Fade]] = [[] for _ in range(WHEEL_SLOTS)]
+        self._active: Dict[Hashable, _Fade] = {}
+        self._origin = time.monotonic()
+        self._current_tick = 0
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.stats = {
+            'started': 0,
+            'retargeted': 0,
+            'cancelled': 0,
+            'completed': 0,
+            'writes': 0,
+            'writes_skipped': 0,
+            'errors': 0,
+            'ticks': 0,
+            'max_active': 0,
+            'busy_ms_total': 0.0,
+        }
+
+    def fade(self, key: Hashable, start: float, end: float, duration: float, curve: str = 'linear', delay: float = 0.0) -> float:
+        tables = FADE_CURVES.get(curve)
+        if tables is None:
+            raise ValueError(f"Curva de fade inválida: {curve}")
+
+        with self._cond:
+            now = time.monotonic()
+            previous = self._active.get(key)
+            if previous is not None:
+                start = previous.value_at(now)
+                previous.cancelled = True
+                self.stats['retargeted'] += 1
+
+            duration = max(0.0, duration)
+            interval = max(1, math.ceil(duration / self.max_steps / self.tick))
+            fade = _Fade(key, float(start), float(end), now + max(0.0, delay), duration, tables[0] if end >= start else tables[1], interval)
+            if previous is not None:
+                fade.last_written = previous.last_written
+            self._active[key] = fade
+            self._schedule(fade, self._tick_at(fade.begin))
+            self.stats['started'] += 1
+            self.stats['max_active'] = max(self.stats['max_active'], len(self._active))
+            self._cond.notify()
+            return fade.start
+
+    def cancel(self, key: Hashable) -> Optional[float]:
+        with self._cond:
+            fade = self._active.pop(key, None)
+            if fade is None:
+                return None
+            fade.cancelled = True
+            self.stats['cancelled'] += 1
+            return fade.value_at(time.monotonic())
+
+    def get_value(self, key: Hashable) -> Optional[float]:
+        with self._cond:
+            fade = self._active.get(key)
+            return fade.value_at(time.monotonic()) if fade is not None else None
+
+    def is_fading(self, key: Hashable) -> bool:
+        with self._cond:
+            return key in self._active
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="FadeScheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            pending = [(fade.key, fade.end) for fade in self._active.values()]
+            self._active.clear()
+            self._slots = [[] for _ in range(WHEEL_SLOTS)]
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._write(pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return dict(self.stats, active=len(self._active))
+
+    def _tick_at(self, now: float) -> int:
+        return int((now - self._origin) / self.tick)
+
+    def _schedule(self, fade: _Fade, due: int) -> None:
+        fade.due = max(due, self._current_tick + 1)
+        self._slots[fade.due % WHEEL_SLOTS].append(fade)
+
+    def _advance(self) -> List[Tuple[Hashable, float]]:
+        now = time.monotonic()
+        tick = self._tick_at(now)
+        due: List[_Fade] = []
+        for index in range(max(self._current_tick + 1, tick - WHEEL_SLOTS + 1), tick + 1):
+            slot = self._slots[index % WHEEL_SLOTS]
+            if not slot:
+                continue
+            waiting = []
+            for fade in slot:
+                if fade.cancelled:
+                    continue
+                if fade.due > tick:
+                    waiting.append(fade)
+                else:
+                    due.append(fade)
+            self._slots[index % WHEEL_SLOTS] = waiting
+        self._current_tick = max(self._current_tick, tick)
+        self.stats['ticks'] += 1
+
+        writes = []
+        resolution = self.resolution
+        for fade in due:
+            done = now >= fade.begin + fade.duration
+            if done:
+                value = fade.end
+                if self._active.get(fade.key) is fade:
+                    del self._active[fade.key]
+                self.stats['completed'] += 1
+            else:
+                value = round(fade.value_at(now) / resolution) * resolution
+                self._schedule(fade, tick + fade.interval)
+            if fade.last_written is not None and abs(value - fade.last_written) < 1e-9:
+                self.stats['writes_skipped'] += 1
+                continue
+            fade.last_written = value
+            writes.append((fade.key, value))
+        return writes
+
+    def _write(self, writes: List[Tuple[Hashable, float]]) -> None:
+        errors = 0
+        for key, value in writes:
+            try:
+                self.sink(key, value)
+            except Exception as e:
+                errors += 1
+                Activity_Log.shared().error('mixer', f"Erro ao aplicar fade de {key}: {e}")
+        with self._cond:
+            self.stats['writes'] += len(writes) - errors
+            self.stats['errors'] += errors
+
+    def _run(self) -> None:
+        if self.thread_initializer:
+            self.thread_initializer()
+
+        while True:
+            with self._cond:
+                while self._running and not self._active:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                started = time.perf_counter()
+                writes = self._advance()
+
+            self._write(writes)
+
+            with self._cond:
+                self.stats['busy_ms_total'] += (time.perf_counter() - started) * 1000.0
+                remaining = self._origin + (self._current_tick + 1) * self.tick - time.monotonic()
+                if remaining > 0 and self._running:
+                    self._cond.wait(remaining)
+
+
+def main():
+    from src.core.Volume_Scheduler import Fake_Volume_Sink
+
+    print("=== Benchmark do Fade Scheduler ===\n")
+
+    for count in (100, 500, 2000):
+        sink = Fake_Volume_Sink()
+        scheduler = Fade_Scheduler(sink, rate_hz=100)
+        scheduler.start()
+
+        curves = list(FADE_CURVES)
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for i in range(count):
+            scheduler.fade(('app', f"app{i}"), 100.0, 0.0, 2.0, curves[i % len(curves)])
+        time.sleep(0.5)
+        for i in range(0, count, 2):
+            scheduler.fade(('app', f"app{i}"), 0.0, 80.0, 1.0, curves[i % len(curves)])
+        while scheduler.get_stats()['active']:
+            time.sleep(0.01)
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        stats = scheduler.get_stats()
+        scheduler.stop()
+
+        finals_ok = all(sink.values[('app', f"app{i}")] == (80.0 if i % 2 == 0 else 0.0) for i in range(count))
+        print(f"{count} fades simultâneos ({stats['retargeted']} redirecionados no meio):")
+        print(f"   CPU {cpu / wall * 100:.1f}% de um núcleo por {wall:.2f} s, {stats['ticks']} ticks, "
+              f"{stats['busy_ms_total'] / max(stats['ticks'], 1):.3f} ms por tick")
+        print(f"   escritas: {stats['writes']} ({stats['writes'] / count:.1f} por alvo), puladas: {stats['writes_skipped']}, "
+              f"valores finais corretos: {finals_ok}")
+
+    count = 200
+    sink = Fake_Volume_Sink()
+    stop = threading.Event()
+
+    def sleep_loop(key: str) -> None:
+        for step in range(1, 201):
+            if stop.is_set():
+                return
+            sink(key, 100.0 - step * 0.5)
+            time.sleep(0.01)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    threads = [threading.Thread(target=sleep_loop, args=(f"app{i}",), daemon=True) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    print(f"\nReferência: {count} threads com sleep: CPU {cpu / wall * 100:.1f}% por {wall:.2f} s, {sink.writes} escritas")
+
+
+if __name__ == "__main__":
+    main()
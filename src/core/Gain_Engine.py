@@ -0,0 +1,376 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from src.core.Activity_Log import Activity_Log
+from src.core.Session_Registry import Session_Registry
+
+Gain_State = Tuple[float, bool]
+
+GAIN_EPSILON = 0.0005
+RENDER_CHANNEL_TYPE = 'output'
+
+
+class Session_Gain_Sink:
+    def __init__(self, registry: Optional[Session_Registry] = None) -> None:
+        self.registry = registry
+
+    def read(self, app_name: str) -> Optional[Gain_State]:
+        registry = self.registry or Session_Registry.shared()
+        entry = registry.find_by_app(app_name)
+        if entry is None:
+            return None
+        interface = entry.interface
+        return interface.GetMasterVolume(), bool(interface.GetMute())
+
+    def write(self, app_name: str, gain: float, muted: bool) -> None:
+        registry = self.registry or Session_Registry.shared()
+        for entry in registry.find_all_by_app(app_name):
+            entry.interface.SetMasterVolume(gain, None)
+            entry.interface.SetMute(muted, None)
+
+
+class Gain_Engine:
+    def __init__(self, sink: Optional[Any] = None) -> None:
+        self.sink = sink or Session_Gain_Sink()
+        self.listener: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._lock = threading.RLock()
+        self.channel_gain: Dict[str, float] = {}
+        self.channel_muted: Dict[str, bool] = {}
+        self.channel_type: Dict[str, str] = {}
+        self.type_channels: Dict[str, Set[str]] = {}
+        self.solo: Dict[str, str] = {}
+        self.members: Dict[str, Set[str]] = {}
+        self.app_channels: Dict[str, Set[str]] = {}
+        self.app_level: Dict[str, float] = {}
+        self.app_muted: Dict[str, bool] = {}
+        self.app_duck: Dict[str, float] = {}
+        self.compiled: Dict[str, Gain_State] = {}
+        self.stats = {
+            'recomputes': 0,
+            'apps_recomputed': 0,
+            'writes': 0,
+            'writes_skipped': 0,
+            'errors': 0,
+        }
+
+    def load(self, channels: Iterable[Any]) -> int:
+        with self._lock:
+            dirty: Set[str] = set()
+            for channel in channels:
+                self.channel_gain[channel.id] = channel.volume / 100.0
+                self.channel_muted[channel.id] = bool(channel.is_muted)
+                self._register(channel)
+                if channel.is_solo:
+                    self.solo[channel.type] = channel.id
+                for app_name in channel.connected_apps:
+                    self._link(channel.id, app_name)
+                    dirty.add(app_name)
+            return self._recompute(dirty)
+
+    def governs(self, app_name: str) -> bool:
+        with self._lock:
+            return bool(self._render_channels(app_name)) or app_name in self.app_duck
+
+    def get_app_state(self, app_name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if not self.governs(app_name) or app_name not in self.app_level:
+                return None
+            return {
+                'volume': round(self.app_level[app_name] * 100),
+                'is_muted': self.app_muted[app_name]
+            }
+
+    def get_effective(self, app_name: str) -> Optional[Gain_State]:
+        with self._lock:
+            return self.compiled.get(app_name)
+
+    def set_channel_volume(self, channel_id: str, volume: float) -> int:
+        with self._lock:
+            gain = max(0.0, min(100.0, float(volume))) / 100.0
+            if self.channel_gain.get(channel_id) == gain:
+                return 0
+            self.channel_gain[channel_id] = gain
+            return self._recompute(self.members.get(channel_id, ()))
+
+    def set_channel_mute(self, channel_id: str, muted: bool) -> int:
+        with self._lock:
+            muted = bool(muted)
+            if self.channel_muted.get(channel_id) == muted:
+                return 0
+            self.channel_muted[channel_id] = muted
+            return self._recompute(self.members.get(channel_id, ()))
+
+    def set_solo(self, channel_type: str, channel_id: Optional[str]) -> int:
+        with self._lock:
+            if self.solo.get(channel_type) == channel_id:
+                return 0
+            if channel_id is None:
+                del self.solo[channel_type]
+            else:
+                self.solo[channel_type] = channel_id
+
+            dirty: Set[str] = set()
+            for member_channel in self.type_channels.get(channel_type, ()):
+                dirty.update(self.members.get(member_channel, ()))
+            return self._recompute(dirty)
+
+    def update_channel(self, channel: Any) -> int:
+        with self._lock:
+            self._register(channel)
+            changes = self.set_channel_volume(channel.id, channel.volume) + self.set_channel_mute(channel.id, channel.is_muted)
+            if channel.is_solo:
+                changes += self.set_solo(channel.type, channel.id)
+            elif self.solo.get(channel.type) == channel.id:
+                changes += self.set_solo(channel.type, None)
+            return changes
+
+    def remove_channel(self, channel_id: str) -> int:
+        with self._lock:
+            members = self.members.pop(channel_id, set())
+            self.channel_gain.pop(channel_id, None)
+            self.channel_muted.pop(channel_id, None)
+            channel_type = self.channel_type.pop(channel_id, None)
+            self.type_channels.get(channel_type, set()).discard(channel_id)
+            for app_name in members:
+                self.app_channels.get(app_name, set()).discard(channel_id)
+            if channel_type is not None and self.solo.get(channel_type) == channel_id:
+                del self.solo[channel_type]
+                for member_channel in self.type_channels.get(channel_type, ()):
+                    members |= self.members.get(member_channel, set())
+            return self._recompute(members)
+
+    def add_member(self, channel_id: str, app_name: str) -> int:
+        with self._lock:
+            if app_name in self.members.get(channel_id, ()):
+                return 0
+            self._link(channel_id, app_name)
+            return self._recompute((app_name,))
+
+    def remove_member(self, channel_id: str, app_name: str) -> int:
+        with self._lock:
+            if app_name not in self.members.get(channel_id, ()):
+                return 0
+            self.members[channel_id].discard(app_name)
+            self.app_channels[app_name].discard(channel_id)
+            return self._recompute((app_name,))
+
+    def set_app_volume(self, app_name: str, volume: float) -> int:
+        with self._lock:
+            if not self.governs(app_name):
+                return 0
+            self.app_level[app_name] = max(0.0, min(100.0, float(volume))) / 100.0
+            self.app_muted.setdefault(app_name, False)
+            self._notify_app(app_name)
+            return self._recompute((app_name,))
+
+    def set_app_mute(self, app_name: str, muted: bool) -> int:
+        with self._lock:
+            if not self.governs(app_name):
+                return 0
+            self.app_muted[app_name] = bool(muted)
+            self.app_level.setdefault(app_name, 1.0)
+            self._notify_app(app_name)
+            return self._recompute((app_name,))
+
+    def seed_app(self, app_name: str, volume: float, muted: bool) -> None:
+        with self._lock:
+            self.app_level[app_name] = max(0.0, min(100.0, float(volume))) / 100.0
+            self.app_muted[app_name] = bool(muted)
+
+    def set_ducks(self, factors: Dict[str, float]) -> int:
+        with self._lock:
+            dirty = []
+            for app_name, factor in factors.items():
+                factor = max(0.0, min(1.0, float(factor)))
+                if factor >= 1.0 - GAIN_EPSILON:
+                    if self.app_duck.pop(app_name, None) is None:
+                        continue
+                elif self.app_duck.get(app_name) == factor:
+                    continue
+                else:
+                    self.app_duck[app_name] = factor
+                dirty.append(app_name)
+            return self._recompute(dirty)
+
+    def sync_apps(self, app_names: Iterable[str]) -> int:
+        with self._lock:
+            return self._recompute([name for name in app_names if self.governs(name) and name not in self.compiled])
+
+    def reapply(self, app_name: str) -> int:
+        with self._lock:
+            self.compiled.pop(app_name, None)
+            return self._recompute((app_name,))
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(
+                self.stats,
+                channels=len(self.members),
+                governed_apps=sum(1 for app_name in self.app_channels if self._render_channels(app_name)),
+                ducked_apps=len(self.app_duck)
+            )
+
+    def _register(self, channel: Any) -> None:
+        self.members.setdefault(channel.id, set())
+        self.channel_type[channel.id] = channel.type
+        self.type_channels.setdefault(channel.type, set()).add(channel.id)
+
+    def _link(self, channel_id: str, app_name: str) -> None:
+        self.members.setdefault(channel_id, set()).add(app_name)
+        self.app_channels.setdefault(app_name, set()).add(channel_id)
+
+    def _render_channels(self, app_name: str) -> List[str]:
+        return [
+            channel_id for channel_id in self.app_channels.get(app_name, ())
+            if self.channel_type.get(channel_id, RENDER_CHANNEL_TYPE) == RENDER_CHANNEL_TYPE
+        ]
+
+    def _compute(self, app_name: str) -> Gain_State:
+        gain = self.app_level[app_name] * self.app_duck.get(app_name, 1.0)
+        muted = self.app_muted[app_name]
+        for channel_id in self._render_channels(app_name):
+            gain *= self.channel_gain.get(channel_id, 1.0)
+            muted = muted or self.channel_muted.get(channel_id, False)
+            solo = self.solo.get(self.channel_type.get(channel_id))
+            if solo is not None and app_name not in self.members.get(solo, ()):
+                muted = True
+        return gain, muted
+
+    def _recompute(self, app_names: Iterable[str]) -> int:
+        changes: List[Tuple[str, float, bool]] = []
+        self.stats['recomputes'] += 1
+
+        for app_name in list(app_names):
+            self.stats['apps_recomputed'] += 1
+
+            if not self._render_channels(app_name) and app_name not in self.app_duck:
+                if app_name in self.compiled:
+                    del self.compiled[app_name]
+                    changes.append((app_name, self.app_level.pop(app_name), self.app_muted.pop(app_name)))
+                    if self.listener:
+                        self.listener({'op': 'app_forget', 'app': app_name})
+                continue
+
+            if app_name not in self.app_level:
+                current = self._read(app_name)
+                if current is None:
+                    continue
+                self.app_level[app_name], self.app_muted[app_name] = current
+                self._notify_app(app_name)
+
+            state = self._compute(app_name)
+            previous = self.compiled.get(app_name)
+            if previous is not None and previous[1] == state[1] and abs(previous[0] - state[0]) < GAIN_EPSILON:
+                self.stats['writes_skipped'] += 1
+                continue
+            self.compiled[app_name] = state
+            changes.append((app_name, state[0], state[1]))
+
+        for app_name, gain, muted in changes:
+            try:
+                self.sink.write(app_name, gain, muted)
+                self.stats['writes'] += 1
+            except Exception as e:
+                self.stats['errors'] += 1
+                Activity_Log.shared().error('mixer', f"Erro ao aplicar ganho efetivo de '{app_name}': {e}")
+        return len(changes)
+
+    def _notify_app(self, app_name: str) -> None:
+        if self.listener:
+            self.listener({
+                'op': 'app_state',
+                'app': app_name,
+                'volume': round(self.app_level[app_name] * 100, 1),
+                'is_muted': self.app_muted[app_name]
+            })
+
+    def _read(self, app_name: str) -> Optional[Gain_State]:
+        try:
+            return self.sink.read(app_name)
+        except Exception as e:
+            Activity_Log.shared().error('mixer', f"Erro ao ler volume de '{app_name}': {e}")
+            return None
+
+
+class Fake_Gain_Sink:
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.state: Dict[str, Gain_State] = {}
+        self.writes = 0
+
+    def read(self, app_name: str) -> Optional[Gain_State]:
+        return self.state.get(app_name, (1.0, False))
+
+    def write(self, app_name: str, gain: float, muted: bool) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        self.state[app_name] = (gain, muted)
+        self.writes += 1
+
+
+class _Synthetic_Channel:
+    def __init__(self, channel_id: str, volume: float, apps: List[str]) -> None:
+        self.id = channel_id
+        self.type = 'output'
+        self.volume = volume
+        self.is_muted = False
+        self.is_solo = False
+        self.connected_apps = apps
+
+
+def build_synthetic_graph(apps: int, channels: int, memberships: int = 2, seed: int = 0) -> List[_Synthetic_Channel]:
+    rng = random.Random(seed)
+    graph = [_Synthetic_Channel(f"channel_{i}", rng.randint(20, 100), []) for i in range(channels)]
+    for i in range(apps):
+        for channel in rng.sample(graph, min(memberships, channels)):
+            channel.connected_apps.append(f"app_{i}")
+    return graph
+
+
+def main():
+    print("=== Benchmark do Gain Engine ===\n")
+
+    for apps, channels in ((100, 10), (2000, 100), (20000, 1000)):
+        graph = build_synthetic_graph(apps, channels)
+        sink = Fake_Gain_Sink()
+        engine = Gain_Engine(sink)
+
+        start = time.perf_counter()
+        engine.load(graph)
+        full = time.perf_counter() - start
+
+        moves = 200
+        sink.writes = 0
+        start = time.perf_counter()
+        for i in range(moves):
+            channel = graph[i % channels]
+            engine.set_channel_volume(channel.id, 30 + i % 50)
+        incremental = (time.perf_counter() - start) / moves
+        writes = sink.writes / moves
+
+        start = time.perf_counter()
+        engine.set_channel_volume(graph[0].id, 30)
+        engine.set_channel_volume(graph[0].id, 30)
+        repeated = time.perf_counter() - start
+
+        mean_members = sum(len(c.connected_apps) for c in graph) / channels
+        print(f"{apps} apps / {channels} canais (~{mean_members:.0f} apps por canal):")
+        print(f"   compilação completa: {full * 1000:.2f} ms")
+        print(f"   movimento de fader: {incremental * 1000:.3f} ms, {writes:.1f} escritas")
+        print(f"   fader sem mudança: {repeated * 1000:.3f} ms")
+
+    output = _Synthetic_Channel('main_output', 80, ['discord'])
+    microphone = _Synthetic_Channel('main_input', 100, ['discord'])
+    microphone.type = 'input'
+    sink = Fake_Gain_Sink()
+    engine = Gain_Engine(sink)
+    engine.load([output, microphone])
+    before = engine.get_effective('discord')
+    engine.set_channel_mute('main_input', True)
+    engine.set_channel_volume('main_input', 10)
+    print(f"\nCanal de entrada mutado/atenuado: reprodução de 'discord' inalterada: {engine.get_effective('discord') == before} {before}")
+
+
+if __name__ == "__main__":
+    main()
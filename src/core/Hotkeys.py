@@ -0,0 +1,499 @@
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from src.core.Activity_Log import Activity_Log
+from src.core.Batch_Controller import BATCH_TARGETS
+from src.core.Com_Worker import init_com_thread
+from src.core.Endpoint_Inventory import Endpoint_Inventory
+from src.core.Metrics import Latency_Histogram, Metrics_Registry
+
+HOTKEY_ACTIONS = ('toggle_mute', 'toggle_solo', 'push_to_talk', 'nudge_volume', 'switch_profile')
+HOTKEY_FORMAT_VERSION = 1
+
+MODIFIER_BITS = {
+    'ctrl': 1, 'lctrl': 1, 'rctrl': 1,
+    'shift': 2, 'lshift': 2, 'rshift': 2,
+    'alt': 4, 'lalt': 4, 'ralt': 4,
+    'win': 8, 'lwin': 8, 'rwin': 8,
+}
+MODIFIER_NAMES = ((1, 'ctrl'), (2, 'shift'), (4, 'alt'), (8, 'win'))
+
+KEY_ALIASES = {
+    'control': 'ctrl', 'option': 'alt', 'altgr': 'ralt', 'cmd': 'win', 'super': 'win', 'meta': 'win',
+    'esc': 'escape', 'return': 'enter', 'del': 'delete', 'ins': 'insert', 'pgup': 'page_up', 'pgdn': 'page_down',
+    'spacebar': 'space', 'mute': 'volume_mute', 'play': 'media_play_pause',
+}
+
+VK_NAMES: Dict[int, str] = {
+    0x08: 'backspace', 0x09: 'tab', 0x0D: 'enter', 0x10: 'shift', 0x11: 'ctrl', 0x12: 'alt', 0x13: 'pause',
+    0x1B: 'escape', 0x20: 'space', 0x21: 'page_up', 0x22: 'page_down', 0x23: 'end', 0x24: 'home',
+    0x25: 'left', 0x26: 'up', 0x27: 'right', 0x28: 'down', 0x2D: 'insert', 0x2E: 'delete',
+    0x5B: 'lwin', 0x5C: 'rwin', 0x91: 'scroll_lock',
+    0xA0: 'lshift', 0xA1: 'rshift', 0xA2: 'lctrl', 0xA3: 'rctrl', 0xA4: 'lalt', 0xA5: 'ralt',
+    0xAD: 'volume_mute', 0xAE: 'volume_down', 0xAF: 'volume_up',
+    0xB0: 'media_next', 0xB1: 'media_prev', 0xB2: 'media_stop', 0xB3: 'media_play_pause',
+}
+VK_NAMES.update({0x30 + i: str(i) for i in range(10)})
+VK_NAMES.update({0x41 + i: chr(ord('a') + i) for i in range(26)})
+VK_NAMES.update({0x60 + i: f"num{i}" for i in range(10)})
+VK_NAMES.update({0x70 + i: f"f{i + 1}" for i in range(24)})
+
+Chord = Tuple[int, str]
+Hotkey_Binding = Dict[str, Any]
+
+
+class Hotkey_Error(Exception):
+    pass
+
+
+def _default_hotkeys_path() -> str:
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'SonusMixer', 'state', 'hotkeys.json')
+
+
+def normalize_key(key: str) -> str:
+    key = key.strip().lower().replace(' ', '_')
+    return KEY_ALIASES.get(key, key)
+
+
+def parse_chord(keys: str) -> Chord:
+    modifiers = 0
+    trigger = None
+    for part in keys.split('+'):
+        key = normalize_key(part)
+        if not key:
+            raise Hotkey_Error(f"Atalho inválido: '{keys}'")
+        if key in MODIFIER_BITS:
+            modifiers |= MODIFIER_BITS[key]
+        elif trigger is None:
+            trigger = key
+        else:
+            raise Hotkey_Error(f"Atalho com mais de uma tecla principal: '{keys}'")
+    if trigger is None:
+        raise Hotkey_Error(f"Atalho sem tecla principal: '{keys}'")
+    return modifiers, trigger
+
+
+def format_chord(chord: Chord) -> str:
+    modifiers, trigger = chord
+    return '+'.join([name for bit, name in MODIFIER_NAMES if modifiers & bit] + [trigger])
+
+
+def compile_bindings(bindings: Iterable[Hotkey_Binding]) -> Dict[Chord, Hotkey_Binding]:
+    table: Dict[Chord, Hotkey_Binding] = {}
+    for binding in bindings:
+        chord = parse_chord(str(binding.get('keys', '')))
+        action = binding.get('action')
+        target = binding.get('target')
+
+        if action not in HOTKEY_ACTIONS:
+            raise Hotkey_Error(f"Ação de atalho inválida: {action}")
+        if action == 'switch_profile':
+            if not binding.get('id'):
+                raise Hotkey_Error(f"Atalho '{binding['keys']}' sem perfil")
+        elif target not in BATCH_TARGETS:
+            raise Hotkey_Error(f"Alvo de atalho inválido: {target}")
+        elif action == 'toggle_solo' and target not in ('app', 'channel'):
+            raise Hotkey_Error(f"Solo não suportado para '{target}'")
+        if chord in table:
+            raise Hotkey_Error(f"Atalho duplicado: '{format_chord(chord)}'")
+
+        table[chord] = dict(binding, keys=format_chord(chord))
+    return table
+
+
+class Chord_Matcher:
+    def __init__(self, bindings: Iterable[Hotkey_Binding] = ()) -> None:
+        self.table = compile_bindings(bindings)
+        self._modifiers: Dict[str, int] = {}
+        self._mask = 0
+        self._held: Dict[str, Optional[Hotkey_Binding]] = {}
+
+    def load(self, bindings: Iterable[Hotkey_Binding]) -> int:
+        self.table = compile_bindings(bindings)
+        self._held.clear()
+        return len(self.table)
+
+    def feed(self, key: str, pressed: bool) -> Tuple[Optional[Hotkey_Binding], bool]:
+        bit = MODIFIER_BITS.get(key)
+        if bit is not None:
+            if pressed:
+                self._modifiers[key] = bit
+            else:
+                self._modifiers.pop(key, None)
+            mask = 0
+            for value in self._modifiers.values():
+                mask |= value
+            self._mask = mask
+            return None, False
+
+        if pressed:
+            if key in self._held:
+                return None, self._held[key] is not None
+            binding = self.table.get((self._mask, key))
+            self._held[key] = binding
+            return binding, binding is not None
+
+        binding = self._held.pop(key, None)
+        if binding is None:
+            return None, False
+        return (binding if binding['action'] == 'push_to_talk' else None), True
+
+
+class Mixer_Hotkey_Actions:
+    def __init__(self, batch_service: Any, profiles: Any = None, event_bus: Any = None, volume_scheduler: Any = None) -> None:
+        self.batch_service = batch_service
+        self.profiles = profiles
+        self.event_bus = event_bus
+        self.volume_scheduler = volume_scheduler
+
+    def run(self, binding: Hotkey_Binding, pressed: bool) -> Any:
+        action = binding['action']
+        target_id = str(binding.get('id', ''))
+
+        if action == 'switch_profile':
+            if self.profiles is None:
+                raise Hotkey_Error("Perfis indisponíveis")
+            if self.volume_scheduler is not None:
+                self.volume_scheduler.flush()
+            self.profiles.switch(target_id)
+            if self.event_bus is not None:
+                self.event_bus.publish('profile_switched', None, {'profile': target_id})
+            return target_id
+
+        target = binding['target']
+        device_type = binding.get('device_type', '')
+        capture_id = self._capture_endpoint(target, target_id) if action in ('toggle_mute', 'push_to_talk') else None
+        if action == 'push_to_talk':
+            field, value = 'mute', not pressed
+        elif action == 'nudge_volume':
+            field = 'volume'
+            value = self.batch_service.read(target, target_id, field, device_type) + float(binding.get('value', 5))
+        elif capture_id is not None:
+            field = 'mute'
+            value = not self.batch_service.read('device', capture_id, field, 'input')
+        else:
+            field = 'mute' if action == 'toggle_mute' else 'solo'
+            value = not self.batch_service.read(target, target_id, field, device_type)
+
+        ops = [{'target': target, 'id': target_id, 'device_type': device_type, 'action': field, 'value': value}]
+        if capture_id is not None:
+            ops.insert(0, {'target': 'device', 'id': capture_id, 'device_type': 'input', 'action': 'mute', 'value': value})
+        report = self.batch_service.apply(ops)
+        for result in report['results']:
+            if not result['ok']:
+                raise Hotkey_Error(result['error'])
+
+        if self.event_bus is not None:
+            self.event_bus.publish('hotkey_triggered', binding['keys'], {'action': action, 'target': target, 'id': target_id, 'value': value})
+        return value
+
+    def _capture_endpoint(self, target: str, target_id: str) -> Optional[str]:
+        if target != 'channel':
+            return None
+        channel = self.batch_service.channel_manager.get_channel(target_id)
+        if channel is None or channel.type != 'input':
+            return None
+        inventory = self.batch_service.inventory or Endpoint_Inventory.shared()
+        device_id = channel.input_device_id
+        if device_id and device_id != 'default':
+            endpoint = inventory.get(device_id, 'input')
+        else:
+            endpoint = inventory.get_default('input')
+        if endpoint is None:
+            raise Hotkey_Error(f"Nenhum dispositivo de captura para o canal '{target_id}'")
+        return endpoint.id
+
+
+class Hotkey_Store:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path if path is not None else _default_hotkeys_path()
+        self._lock = threading.Lock()
+
+    def load(self) -> List[Hotkey_Binding]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(state, dict) or state.get('version') != HOTKEY_FORMAT_VERSION:
+            return []
+        return [binding for binding in state.get('bindings', []) if isinstance(binding, dict)]
+
+    def save(self, bindings: List[Hotkey_Binding]) -> None:
+        data = json.dumps({'version': HOTKEY_FORMAT_VERSION, 'bindings': bindings}, ensure_ascii=False, separators=(',', ':'))
+        directory = os.path.dirname(self.path) or '.'
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+
+
+class Hotkey_Dispatcher:
+    def __init__(self, actions: Any, bindings: Iterable[Hotkey_Binding] = (), metrics: Optional[Metrics_Registry] = None,
+                 thread_initializer: Optional[Callable[[], None]] = init_com_thread) -> None:
+        self.actions = actions
+        self.metrics = metrics or Metrics_Registry.shared()
+        self.thread_initializer = thread_initializer
+        self.matcher = Chord_Matcher(bindings)
+        self.latency = Latency_Histogram()
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._source: Optional[Any] = None
+        self.stats = {
+            'events': 0,
+            'matched': 0,
+            'dispatched': 0,
+            'failed': 0,
+        }
+
+    def set_bindings(self, bindings: Iterable[Hotkey_Binding]) -> int:
+        with self._lock:
+            return self.matcher.load(bindings)
+
+    def get_bindings(self) -> List[Hotkey_Binding]:
+        with self._lock:
+            return list(self.matcher.table.values())
+
+    def feed(self, key: str, pressed: bool, timestamp: Optional[float] = None) -> bool:
+        with self._lock:
+            self.stats['events'] += 1
+            binding, consumed = self.matcher.feed(key, pressed)
+            if binding is not None:
+                self.stats['matched'] += 1
+                self._queue.put((binding, pressed, timestamp if timestamp is not None else time.perf_counter()))
+        return consumed
+
+    def start(self, source: Optional[Any] = None) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="HotkeyDispatcher", daemon=True)
+            self._thread.start()
+        if source is not None and self._source is None:
+            self._source = source
+            source.start(self.feed)
+
+    def stop(self) -> None:
+        if self._source is not None:
+            self._source.stop()
+            self._source = None
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(
+                self.stats,
+                bindings=len(self.matcher.table),
+                running=self._thread is not None,
+                latency=self.latency.to_dict()
+            )
+
+    def _run(self) -> None:
+        if self.thread_initializer:
+            self.thread_initializer()
+        log = Activity_Log.shared()
+
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            binding, pressed, timestamp = item
+            failed = False
+            try:
+                self.actions.run(binding, pressed)
+            except Exception as e:
+                failed = True
+                log.error('hotkeys', f"Erro ao executar atalho '{binding['keys']}' ({binding['action']}): {e}")
+
+            elapsed = time.perf_counter() - timestamp
+            self.metrics.record(f"hotkey.{binding['action']}", elapsed, failed)
+            with self._lock:
+                self.latency.add(elapsed, failed)
+                self.stats['failed' if failed else 'dispatched'] += 1
+
+
+class Windows_Keyboard_Hook:
+    def __init__(self, swallow: bool = False) -> None:
+        self.swallow = swallow
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id = 0
+        self._started = threading.Event()
+
+    def start(self, feed: Callable[[str, bool, Optional[float]], bool]) -> None:
+        if self._thread is not None:
+            return
+        self._started.clear()
+        self._thread = threading.Thread(target=self._run, args=(feed,), name="HotkeyHook", daemon=True)
+        self._thread.start()
+        self._started.wait(2.0)
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        import ctypes
+        ctypes.windll.user32.PostThreadMessageW(self._thread_id, 0x0012, 0, 0)
+        self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def _run(self, feed: Callable[[str, bool, Optional[float]], bool]) -> None:
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL('user32', use_last_error=True)
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+        class KBDLLHOOKSTRUCT(ctypes.Structure):
+            _fields_ = [
+                ('vkCode', wintypes.DWORD),
+                ('scanCode', wintypes.DWORD),
+                ('flags', wintypes.DWORD),
+                ('time', wintypes.DWORD),
+                ('dwExtraInfo', ctypes.c_size_t),
+            ]
+
+        LRESULT = ctypes.c_ssize_t
+        HOOKPROC = ctypes.WINFUNCTYPE(LRESULT, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+        user32.SetWindowsHookExW.argtypes = (ctypes.c_int, HOOKPROC, wintypes.HINSTANCE, wintypes.DWORD)
+        user32.SetWindowsHookExW.restype = wintypes.HHOOK
+        user32.CallNextHookEx.argtypes = (wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+        user32.CallNextHookEx.restype = LRESULT
+        user32.UnhookWindowsHookEx.argtypes = (wintypes.HHOOK,)
+        user32.GetMessageW.argtypes = (ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT)
+        kernel32.GetModuleHandleW.argtypes = (wintypes.LPCWSTR,)
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+        swallow = self.swallow
+        perf_counter = time.perf_counter
+
+        @HOOKPROC
+        def hook(code: int, wparam: int, lparam: int) -> int:
+            if code == 0:
+                try:
+                    event = ctypes.cast(lparam, ctypes.POINTER(KBDLLHOOKSTRUCT)).contents
+                    name = VK_NAMES.get(event.vkCode)
+                    if name is not None and feed(name, wparam in (0x0100, 0x0104), perf_counter()) and swallow:
+                        return 1
+                except Exception:
+                    pass
+            return user32.CallNextHookEx(None, code, wparam, lparam)
+
+        self._thread_id = kernel32.GetCurrentThreadId()
+        handle = user32.SetWindowsHookExW(13, hook, kernel32.GetModuleHandleW(None), 0)
+        self._started.set()
+        if not handle:
+            Activity_Log.shared().error('hotkeys', f"Erro ao instalar hook de teclado: {ctypes.get_last_error()}")
+            return
+
+        try:
+            message = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(message), None, 0, 0) > 0:
+                pass
+        finally:
+            user32.UnhookWindowsHookEx(handle)
+
+
+class Fake_Key_Source:
+    def __init__(self) -> None:
+        self._feed: Optional[Callable[[str, bool, Optional[float]], bool]] = None
+
+    def start(self, feed: Callable[[str, bool, Optional[float]], bool]) -> None:
+        self._feed = feed
+
+    def stop(self) -> None:
+        self._feed = None
+
+    def press(self, key: str) -> bool:
+        return self._feed(normalize_key(key), True, time.perf_counter()) if self._feed else False
+
+    def release(self, key: str) -> bool:
+        return self._feed(normalize_key(key), False, time.perf_counter()) if self._feed else False
+
+    def tap(self, keys: str, hold: float = 0.0) -> bool:
+        parts = [normalize_key(part) for part in keys.split('+')]
+        consumed = False
+        for key in parts:
+            consumed = self.press(key) or consumed
+        if hold:
+            time.sleep(hold)
+        for key in reversed(parts):
+            self.release(key)
+        return consumed
+
+
+def main():
+    from audio_channel import ChannelManager
+    from src.core.Batch_Controller import Fake_Master_Controller, Mixer_Batch_Service
+    from src.core.Endpoint_Inventory import Fake_Endpoint_Source
+    from src.core.Session_Registry import Fake_Session_Source, Session_Registry
+
+    print("=== Benchmark dos Atalhos Globais ===\n")
+
+    bindings = [
+        {'keys': 'ctrl+shift+m', 'action': 'toggle_mute', 'target': 'master'},
+        {'keys': 'f13', 'action': 'push_to_talk', 'target': 'channel', 'id': 'main_input'},
+        {'keys': 'ctrl+alt+up', 'action': 'nudge_volume', 'target': 'master', 'value': 5},
+        {'keys': 'ctrl+alt+s', 'action': 'toggle_solo', 'target': 'app', 'id': 'app1000'},
+    ]
+    bindings += [{'keys': f"ctrl+shift+alt+f{i + 1}", 'action': 'toggle_mute', 'target': 'app', 'id': f"app{1000 + i}"} for i in range(24)]
+
+    calls = 200000
+    matcher = Chord_Matcher(bindings)
+    events = [('lctrl', True), ('lshift', True), ('m', True), ('m', False), ('lshift', False), ('lctrl', False), ('x', True), ('x', False)]
+    start = time.perf_counter()
+    for i in range(calls // len(events)):
+        for key, pressed in events:
+            matcher.feed(key, pressed)
+    per_event = (time.perf_counter() - start) / (calls // len(events) * len(events))
+    print(f"{len(matcher.table)} atalhos compilados, casamento: {per_event * 1e6:.2f} µs por evento de tecla")
+
+    registry = Session_Registry(Fake_Session_Source(40, latency=0.00005), max_age=60.0)
+    channels = ChannelManager()
+    master = Fake_Master_Controller()
+    inventory = Endpoint_Inventory(Fake_Endpoint_Source())
+    microphone = inventory.get_default('input')
+    batch = Mixer_Batch_Service(channels, master, registry=registry, inventory=inventory)
+    metrics = Metrics_Registry()
+    dispatcher = Hotkey_Dispatcher(Mixer_Hotkey_Actions(batch), bindings, metrics=metrics, thread_initializer=None)
+    source = Fake_Key_Source()
+    dispatcher.start(source)
+
+    for _ in range(50):
+        source.tap('ctrl+shift+m')
+        time.sleep(0.002)
+        source.tap('f13', hold=0.001)
+        time.sleep(0.002)
+        source.tap('ctrl+alt+s')
+        time.sleep(0.002)
+        source.tap('ctrl+alt+up')
+        time.sleep(0.002)
+    source.tap('shift+m')
+    time.sleep(0.05)
+    source.press('f13')
+    time.sleep(0.02)
+    muted_while_held = microphone.get_mute()
+    source.release('f13')
+    time.sleep(0.02)
+    muted_after_release = microphone.get_mute()
+    stats = dispatcher.get_stats()
+    dispatcher.stop()
+
+    print(f"\nEventos: {stats['events']}, casados: {stats['matched']}, executados: {stats['dispatched']}, falhas: {stats['failed']}")
+    print(f"Tecla -> ação: p50 {stats['latency']['p50_ms']:.3f} ms, p95 {stats['latency']['p95_ms']:.3f} ms, max {stats['latency']['max_ms']:.3f} ms")
+    for name, series in metrics.snapshot()['series'].items():
+        print(f"   {name:<24} {series['count']:4d}x  p50 {series['p50_ms']:7.3f} ms   p95 {series['p95_ms']:7.3f} ms")
+    print(f"\nMaster: volume {master.volume}%, mute {master.is_muted}")
+    print(f"Push-to-talk em main_input -> endpoint '{microphone.name}': segurando {muted_while_held}, solto {muted_after_release}"
+          f" ({'ok' if (muted_while_held, muted_after_release) == (False, True) else 'FALHOU'})")
+
+
+if __name__ == "__main__":
+    main()
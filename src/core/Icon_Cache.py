@@ -0,0 +1,251 @@
+import base64
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from src.core.Activity_Log import Activity_Log
+
+ICON_ID_LENGTH = 16
+ICON_ID_PATTERN = re.compile(f"[0-9a-f]{{{ICON_ID_LENGTH}}}")
+
+
+def _default_cache_dir() -> str:
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'SonusMixer', 'icons')
+
+
+class Win32_Icon_Renderer:
+    def render(self, exe_path: str) -> Optional[bytes]:
+        import win32api
+        import win32con
+        import win32gui
+        import win32ui
+        from PIL import Image
+
+        large, small = win32gui.ExtractIconEx(exe_path, 0)
+        hicon = large[0] if large else small[0] if small else None
+        for handle in list(large) + list(small):
+            if handle != hicon:
+                win32gui.DestroyIcon(handle)
+
+        if hicon is None:
+            return None
+
+        try:
+            ico_x = win32api.GetSystemMetrics(win32con.SM_CXICON)
+            ico_y = win32api.GetSystemMetrics(win32con.SM_CYICON)
+
+            hdc = win32ui.CreateDCFromHandle(win32gui.GetDC(0))
+            hbmp = win32ui.CreateBitmap()
+            hbmp.CreateCompatibleBitmap(hdc, ico_x, ico_y)
+            hdc = hdc.CreateCompatibleDC()
+            hdc.SelectObject(hbmp)
+            hdc.DrawIcon((0, 0), hicon)
+
+            bmp_info = hbmp.GetInfo()
+            bmp_str = hbmp.GetBitmapBits(True)
+            img = Image.frombuffer(
+                'RGBA',
+                (bmp_info['bmWidth'], bmp_info['bmHeight']),
+                bmp_str, 'raw', 'BGRA', 0, 1
+            )
+
+            with io.BytesIO() as output:
+                img.save(output, format="PNG")
+                return output.getvalue()
+        finally:
+            win32gui.DestroyIcon(hicon)
+
+
+class Icon_Cache:
+    _shared: Optional['Icon_Cache'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, renderer: Optional[Any] = None, cache_dir: Optional[str] = None, max_entries: int = 256) -> None:
+        if renderer is None:
+            from src.core.Audio_Backend import Audio_Backend
+            renderer = Audio_Backend.shared()
+        self.renderer = renderer
+        self.cache_dir = cache_dir if cache_dir is not None else _default_cache_dir()
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._ids: Dict[Tuple[str, int, int], Optional[str]] = {}
+        self._pngs: 'OrderedDict[str, bytes]' = OrderedDict()
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'render_failures': 0,
+        }
+
+    @classmethod
+    def shared(cls) -> 'Icon_Cache':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def set_shared(cls, cache: Optional['Icon_Cache']) -> None:
+        with cls._shared_lock:
+            cls._shared = cache
+
+    @staticmethod
+    def make_icon_id(exe_path: str, mtime_ns: int, size: int) -> str:
+        fingerprint = f"{os.path.normcase(exe_path)}|{mtime_ns}|{size}"
+        return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:ICON_ID_LENGTH]
+
+    @staticmethod
+    def is_valid_icon_id(icon_id: Any) -> bool:
+        return isinstance(icon_id, str) and ICON_ID_PATTERN.fullmatch(icon_id) is not None
+
+    def get_icon_id(self, exe_path: Optional[str]) -> Optional[str]:
+        if not exe_path:
+            return None
+
+        try:
+            stat = os.stat(exe_path)
+        except OSError:
+            return None
+
+        key = (exe_path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if key in self._ids:
+                self.stats['memory_hits'] += 1
+                return self._ids[key]
+
+            icon_id = self.make_icon_id(*key)
+            if icon_id in self._pngs or os.path.exists(self._disk_path(icon_id)):
+                self.stats['disk_hits'] += 1
+                self._ids[key] = icon_id
+                return icon_id
+
+            self.stats['misses'] += 1
+
+        png = self._render(exe_path)
+
+        with self._lock:
+            if png is None:
+                self.stats['render_failures'] += 1
+                self._ids[key] = None
+                return None
+            self._remember(icon_id, png)
+            self._write_to_disk(icon_id, png)
+            self._ids[key] = icon_id
+            return icon_id
+
+    def get_png(self, icon_id: str) -> Optional[bytes]:
+        if not self.is_valid_icon_id(icon_id):
+            return None
+
+        with self._lock:
+            png = self._pngs.get(icon_id)
+            if png is not None:
+                self._pngs.move_to_end(icon_id)
+                return png
+
+            try:
+                with open(self._disk_path(icon_id), 'rb') as f:
+                    png = f.read()
+            except OSError:
+                return None
+
+            self._remember(icon_id, png)
+            return png
+
+    def get_data_uri(self, icon_id: str) -> Optional[str]:
+        png = self.get_png(icon_id)
+        if png is None:
+            return None
+        encoded_string = base64.b64encode(png).decode('utf-8')
+        return f"data:image/png;base64,{encoded_string}"
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats, memory_entries=len(self._pngs), known_executables=len(self._ids))
+
+    def _render(self, exe_path: str) -> Optional[bytes]:
+        try:
+            return self.renderer.render(exe_path)
+        except Exception as e:
+            Activity_Log.shared().error('icons', f"Erro ao renderizar ícone de '{exe_path}': {e}")
+            return None
+
+    def _remember(self, icon_id: str, png: bytes) -> None:
+        self._pngs[icon_id] = png
+        self._pngs.move_to_end(icon_id)
+        while len(self._pngs) > self.max_entries:
+            self._pngs.popitem(last=False)
+
+    def _disk_path(self, icon_id: str) -> str:
+        return os.path.join(self.cache_dir, f"{icon_id}.png")
+
+    def _write_to_disk(self, icon_id: str, png: bytes) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(png)
+            os.replace(tmp_path, self._disk_path(icon_id))
+        except OSError as e:
+            Activity_Log.shared().error('icons', f"Erro ao gravar ícone em cache '{icon_id}': {e}")
+
+
+class Fake_Icon_Renderer:
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.calls = 0
+
+    def render(self, exe_path: str) -> Optional[bytes]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return b'\x89PNG\r\n\x1a\n' + hashlib.sha1(exe_path.encode('utf-8')).digest() * 64
+
+
+def main():
+    print("=== Benchmark do Icon Cache ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        exe_paths = []
+        for i in range(40):
+            path = os.path.join(tmp_dir, f"app{i}.exe")
+            with open(path, 'wb') as f:
+                f.write(b'MZ' + bytes(i))
+            exe_paths.append(path)
+
+        renderer = Fake_Icon_Renderer(latency=0.005)
+        cache = Icon_Cache(renderer, cache_dir=os.path.join(tmp_dir, 'icons'))
+
+        for refresh in range(5):
+            start = time.perf_counter()
+            ids = [cache.get_icon_id(path) for path in exe_paths]
+            elapsed = time.perf_counter() - start
+            print(f"Refresh {refresh + 1}: {elapsed * 1000:.2f} ms ({len(set(ids))} ícones)")
+
+        restarted = Icon_Cache(renderer, cache_dir=os.path.join(tmp_dir, 'icons'))
+        start = time.perf_counter()
+        for path in exe_paths:
+            restarted.get_icon_id(path)
+        print(f"Após reinício (cache em disco): {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        print(f"\nRenderizações: {renderer.calls}")
+        print(f"Estatísticas: {cache.get_stats()}")
+        print(f"Estatísticas após reinício: {restarted.get_stats()}")
+
+        with open(os.path.join(tmp_dir, 'segredo.png'), 'wb') as f:
+            f.write(b'nao deveria vazar')
+        hostile = ['../segredo', '..\\segredo', os.path.join(tmp_dir, 'segredo'), 'ABCDEF0123456789', ids[0] + '0', None]
+        rejected = sum(1 for icon_id in hostile if cache.get_png(icon_id) is None)
+        print(f"IDs inválidos rejeitados: {rejected}/{len(hostile)}, ID válido servido: {cache.get_png(ids[0]) is not None}")
+
+
+if __name__ == "__main__":
+    main()
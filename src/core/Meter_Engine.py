@@ -0,0 +1,437 @@
+import itertools
+import math
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+import numpy as np
+from src.core.Activity_Log import Activity_Log
+from src.core.Com_Worker import init_com_thread
+
+Meter_Frame = Dict[str, Any]
+
+
+class Meter_Ballistics:
+    def __init__(self, attack_ms: float = 5.0, release_db_per_s: float = 24.0, hold_ms: float = 1500.0, clip_threshold: float = 0.999) -> None:
+        self.attack_ms = attack_ms
+        self.release_db_per_s = release_db_per_s
+        self.hold_ms = hold_ms
+        self.clip_threshold = clip_threshold
+
+    def coefficients(self, dt: float) -> Tuple[float, float]:
+        attack = 1.0 if self.attack_ms <= 0 else 1.0 - math.exp(-dt * 1000.0 / self.attack_ms)
+        release = 10.0 ** (-self.release_db_per_s * dt / 20.0)
+        return attack, release
+
+    def process(self, peaks: np.ndarray, level: np.ndarray, hold: np.ndarray, hold_age: np.ndarray, clip: np.ndarray, dt: float) -> None:
+        attack, release = self.coefficients(dt)
+
+        rising = peaks > level
+        np.multiply(level, release, out=level, where=~rising)
+        np.add(level, (peaks - level) * attack, out=level, where=rising)
+        np.clip(level, 0.0, 1.0, out=level)
+
+        hold_age += dt * 1000.0
+        expired = hold_age > self.hold_ms
+        np.multiply(hold, release, out=hold, where=expired)
+        refreshed = level >= hold
+        hold[refreshed] = level[refreshed]
+        hold_age[refreshed] = 0.0
+
+        clip |= peaks >= self.clip_threshold
+
+
+class Meter_History:
+    def __init__(self, length: int = 128, capacity: int = 64) -> None:
+        self.length = length
+        self.buffer = np.zeros((length, capacity), dtype=np.float32)
+        self.index = 0
+        self.filled = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.buffer.shape[1]
+
+    def ensure_capacity(self, size: int) -> None:
+        if size <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < size:
+            capacity *= 2
+        grown = np.zeros((self.length, capacity), dtype=np.float32)
+        grown[:, :self.capacity] = self.buffer
+        self.buffer = grown
+
+    def reset(self) -> None:
+        self.buffer.fill(0.0)
+        self.index = 0
+        self.filled = 0
+
+    def push(self, values: np.ndarray) -> None:
+        row = self.buffer[self.index]
+        row[:len(values)] = values
+        row[len(values):] = 0.0
+        self.index = (self.index + 1) % self.length
+        self.filled = min(self.filled + 1, self.length)
+
+    def latest(self, count: Optional[int] = None) -> np.ndarray:
+        count = self.filled if count is None else min(count, self.filled)
+        rows = (self.index - count + np.arange(count)) % self.length
+        return self.buffer[rows]
+
+
+class Meter_Engine:
+    def __init__(self, publish: Optional[Callable[[Meter_Frame], None]] = None, backend: Optional[Any] = None, registry: Optional[Any] = None, inventory: Optional[Any] = None, channel_manager: Optional[Any] = None, rate_hz: float = 30.0, ballistics: Optional[Meter_Ballistics] = None, history: int = 128, layout_interval: float = 1.0) -> None:
+        self.publish = publish
+        self.backend = backend
+        self.registry = registry
+        self.inventory = inventory
+        self.channel_manager = channel_manager
+        self.rate_hz = rate_hz
+        self.layout_interval = layout_interval
+        self.ballistics = ballistics or Meter_Ballistics()
+        self.history = Meter_History(history)
+        self.listeners: List[Callable[[List[str], np.ndarray, float], None]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._seq = itertools.count(1)
+        self._last_tick: Optional[float] = None
+
+        self.layout_version = 0
+        self._signature: Optional[Tuple] = None
+        self._layout_marker: Optional[Tuple] = None
+        self._layout_checked_at: Optional[float] = None
+        self.keys: List[str] = []
+        self._readers: List[Any] = []
+        self._meters: Dict[Hashable, Any] = {}
+        self._order = np.zeros(0, dtype=np.intp)
+        self._offsets = np.zeros(0, dtype=np.intp)
+        self._allocate(64, 64)
+
+        self.stats = {
+            'ticks': 0,
+            'read_errors': 0,
+            'layouts': 0,
+            'layout_checks': 0,
+            'tick_ms_total': 0.0,
+        }
+
+    def start(self) -> None:
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="MeterEngine", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._running = False
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def reset_clips(self) -> None:
+        with self._lock:
+            self.clip.fill(False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            ticks = self.stats['ticks']
+            return dict(
+                self.stats,
+                meters=len(self.keys),
+                sources=len(self._readers),
+                tick_ms_avg=self.stats['tick_ms_total'] / ticks if ticks else 0.0
+            )
+
+    def tick(self, now: Optional[float] = None) -> Meter_Frame:
+        now = time.monotonic() if now is None else now
+        started = time.perf_counter()
+
+        with self._lock:
+            dt = 1.0 / self.rate_hz if self._last_tick is None else max(now - self._last_tick, 0.0)
+            self._last_tick = now
+
+            layout_changed = False
+            if self._layout_due(now):
+                layout_changed = self._update_layout()
+                self._layout_marker = self._current_marker()
+                self._layout_checked_at = now
+            sources = len(self._readers)
+            self._read_peaks(sources)
+
+            count = len(self.keys)
+            if count:
+                self._peaks[:count] = np.maximum.reduceat(self._raw[self._order], self._offsets)
+            self.ballistics.process(
+                self._peaks[:count], self.level[:count], self.hold[:count], self.hold_age[:count], self.clip[:count], dt
+            )
+            self.history.push(self.level[:count])
+
+            frame = self._build_frame(count, layout_changed)
+            keys, peaks = self.keys, self._peaks[:count].copy()
+            self.stats['ticks'] += 1
+            self.stats['tick_ms_total'] += (time.perf_counter() - started) * 1000.0
+
+        for listener in self.listeners:
+            try:
+                listener(keys, peaks, dt)
+            except Exception as e:
+                Activity_Log.shared().error('meters', f"Erro ao notificar ouvinte dos medidores: {e}")
+        if self.publish:
+            self.publish(frame)
+        return frame
+
+    def get_history(self, key: str, count: Optional[int] = None) -> List[float]:
+        with self._lock:
+            if key not in self.keys:
+                return []
+            index = self.keys.index(key)
+            return self.history.latest(count)[:, index].round(4).tolist()
+
+    def invalidate_layout(self) -> None:
+        with self._lock:
+            self._layout_marker = None
+
+    def collect_sources(self) -> Tuple[List[Tuple[Hashable, Any]], Dict[str, List[Hashable]]]:
+        backend, registry, inventory = self._resolve_sources()
+
+        sources: List[Tuple[Hashable, Any]] = []
+        outputs: Dict[str, List[Hashable]] = {}
+        apps_by_name: Dict[str, List[Hashable]] = {}
+
+        for entry in registry.get_sessions():
+            source_key = ('session', entry.key)
+            sources.append((source_key, lambda entry=entry: backend.get_session_meter(entry.session)))
+            outputs.setdefault(f"app:{entry.app_name}", []).append(source_key)
+            apps_by_name.setdefault(entry.normalized_name, []).append(source_key)
+
+        defaults: Dict[str, Hashable] = {}
+        for endpoint in inventory.get_endpoints():
+            source_key = ('device', endpoint.flow, endpoint.id)
+            sources.append((source_key, lambda endpoint=endpoint: backend.get_endpoint_meter(endpoint)))
+            outputs[f"device:{endpoint.id}"] = [source_key]
+            if endpoint.is_default:
+                defaults[endpoint.flow] = source_key
+
+        if 'output' in defaults:
+            outputs['master'] = [defaults['output']]
+
+        if self.channel_manager is not None:
+            for channel in self.channel_manager.channels.values():
+                members = []
+                for app_name in channel.apps:
+                    members.extend(apps_by_name.get(app_name.lower().replace('.exe', ''), []))
+                if not members and channel.is_main and channel.type in defaults:
+                    members = [defaults[channel.type]]
+                outputs[f"channel:{channel.id}"] = members
+
+        return sources, outputs
+
+    def _resolve_sources(self) -> Tuple[Any, Any, Any]:
+        if self.backend is None:
+            from src.core.Audio_Backend import Audio_Backend
+            self.backend = Audio_Backend.shared()
+        if self.registry is None:
+            from src.core.Session_Registry import Session_Registry
+            self.registry = Session_Registry.shared()
+        if self.inventory is None:
+            from src.core.Endpoint_Inventory import Endpoint_Inventory
+            self.inventory = Endpoint_Inventory.shared()
+        return self.backend, self.registry, self.inventory
+
+    def _current_marker(self) -> Tuple:
+        _, registry, inventory = self._resolve_sources()
+        return registry.version, inventory.version, getattr(self.channel_manager, 'version', None)
+
+    def _layout_due(self, now: float) -> bool:
+        if self._layout_checked_at is not None and now - self._layout_checked_at < self.layout_interval:
+            if self._current_marker() == self._layout_marker:
+                return False
+        self.stats['layout_checks'] += 1
+        return True
+
+    def _update_layout(self) -> bool:
+        sources, outputs = self.collect_sources()
+        signature = (tuple(key for key, _ in sources), tuple((key, tuple(members)) for key, members in outputs.items()))
+        if signature == self._signature:
+            return False
+
+        previous = dict(zip(self.keys, zip(self.level.tolist(), self.hold.tolist(), self.hold_age.tolist(), self.clip.tolist())))
+        readers = []
+        meters = {}
+        positions = {}
+        for position, (source_key, factory) in enumerate(sources, start=1):
+            meter = self._meters.get(source_key)
+            if meter is None:
+                try:
+                    meter = factory()
+                except Exception as e:
+                    Activity_Log.shared().error('meters', f"Erro ao ativar medidor de {source_key}: {e}")
+                    meter = None
+            meters[source_key] = meter
+            readers.append(meter)
+            positions[source_key] = position
+
+        keys = list(outputs.keys())
+        order, offsets = [], []
+        for key in keys:
+            offsets.append(len(order))
+            members = [positions[member] for member in outputs[key] if member in positions]
+            order.extend(members or [0])
+
+        self._allocate(len(keys), len(readers) + 1)
+        self.keys = keys
+        self._readers = readers
+        self._meters = meters
+        self._order = np.asarray(order, dtype=np.intp)
+        self._offsets = np.asarray(offsets, dtype=np.intp)
+        self._signature = signature
+
+        self.level[:] = 0.0
+        self.hold[:] = 0.0
+        self.hold_age[:] = 0.0
+        self.clip[:] = False
+        for index, key in enumerate(keys):
+            if key in previous:
+                self.level[index], self.hold[index], self.hold_age[index], self.clip[index] = previous[key]
+
+        self.history.reset()
+        self.layout_version += 1
+        self.stats['layouts'] += 1
+        return True
+
+    def _allocate(self, outputs: int, sources: int) -> None:
+        if getattr(self, '_raw', None) is None or len(self._raw) < sources:
+            capacity = max(64, 1 << (sources - 1).bit_length())
+            self._raw = np.zeros(capacity, dtype=np.float32)
+        if getattr(self, 'level', None) is None or len(self.level) < outputs:
+            capacity = max(64, 1 << (outputs - 1).bit_length())
+            self._peaks = np.zeros(capacity, dtype=np.float32)
+            self.level = np.zeros(capacity, dtype=np.float32)
+            self.hold = np.zeros(capacity, dtype=np.float32)
+            self.hold_age = np.zeros(capacity, dtype=np.float32)
+            self.clip = np.zeros(capacity, dtype=bool)
+        self.history.ensure_capacity(outputs)
+
+    def _read_peaks(self, sources: int) -> None:
+        raw = self._raw
+        raw[0] = 0.0
+        for index, meter in enumerate(self._readers, start=1):
+            if meter is None:
+                raw[index] = 0.0
+                continue
+            try:
+                raw[index] = meter.GetPeakValue()
+            except Exception:
+                raw[index] = 0.0
+                self.stats['read_errors'] += 1
+
+    def _build_frame(self, count: int, layout_changed: bool) -> Meter_Frame:
+        frame = {
+            'seq': next(self._seq),
+            'layout': self.layout_version,
+            'levels': np.rint(self.level[:count] * 100).astype(np.uint8).tolist(),
+            'holds': np.rint(self.hold[:count] * 100).astype(np.uint8).tolist(),
+            'clips': np.flatnonzero(self.clip[:count]).tolist(),
+        }
+        if layout_changed:
+            frame['keys'] = list(self.keys)
+        return frame
+
+    def _run(self) -> None:
+        init_com_thread()
+
+        interval = 1.0 / self.rate_hz
+        while True:
+            with self._lock:
+                if not self._running:
+                    return
+
+            started = time.monotonic()
+            try:
+                self.tick(started)
+            except Exception as e:
+                Activity_Log.shared().error('meters', f"Erro no ciclo dos medidores: {e}")
+            remaining = interval - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+
+class Event_Bus_Meter_Sink:
+    def __init__(self, event_bus: Any, topic: str = 'meters') -> None:
+        self.event_bus = event_bus
+        self.topic = topic
+
+    def __call__(self, frame: Meter_Frame) -> None:
+        self.event_bus.publish(self.topic, None, frame)
+
+
+class Fake_Audio_Meter:
+    def __init__(self, peaks: Optional[Iterable[float]] = None, seed: Optional[int] = None, latency: float = 0.0) -> None:
+        self.latency = latency
+        self._peaks = iter(peaks) if peaks is not None else None
+        self._random = random.Random(seed)
+        self._phase = self._random.uniform(0, math.tau)
+        self._rate = self._random.uniform(0.5, 3.0)
+        self._level = self._random.uniform(0.2, 0.9)
+        self.reads = 0
+
+    def GetPeakValue(self) -> float:
+        self.reads += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if self._peaks is not None:
+            return next(self._peaks, 0.0)
+        self._phase += self._rate / 30.0
+        return max(0.0, min(1.0, self._level * abs(math.sin(self._phase)) + self._random.uniform(0.0, 0.05)))
+
+
+def main():
+    print("=== Benchmark do Meter Engine ===\n")
+
+    from src.core.Endpoint_Inventory import Endpoint_Inventory
+    from src.core.Session_Registry import Session_Registry
+    from src.core.Simulated_Backend import Simulated_Backend
+
+    ballistics = Meter_Ballistics(attack_ms=0.0, release_db_per_s=20.0, hold_ms=100.0)
+    level, hold, age, clip = np.zeros(1, np.float32), np.zeros(1, np.float32), np.zeros(1, np.float32), np.zeros(1, bool)
+    stream = [1.0] + [0.0] * 10
+    trace = []
+    for peak in stream:
+        ballistics.process(np.array([peak], np.float32), level, hold, age, clip, 0.05)
+        trace.append((round(float(level[0]), 3), round(float(hold[0]), 3)))
+    print(f"Impulso (nível, hold) a 20 Hz: {trace[:4]} ... {trace[-1]}; clip={bool(clip[0])}")
+
+    for sessions in (10, 100, 500):
+        backend = Simulated_Backend(sessions=sessions, outputs=8, inputs=4, seed=sessions)
+        frames = []
+        engine = Meter_Engine(
+            publish=frames.append,
+            backend=backend,
+            registry=Session_Registry(backend, max_age=60.0),
+            inventory=Endpoint_Inventory(backend)
+        )
+        engine.tick(0.0)
+
+        ticks = 300
+        start = time.perf_counter()
+        for i in range(1, ticks + 1):
+            engine.tick(i / 30.0)
+        elapsed = (time.perf_counter() - start) / ticks
+        reads = elapsed * 1000 / max(len(engine._readers), 1)
+
+        print(f"{sessions} sessões ({len(engine.keys)} medidores): {elapsed * 1000:.3f} ms por tick, "
+              f"{reads * 1000:.2f} µs por medidor, {len(frames)} frames, {engine.stats['layout_checks']} coletas de fontes")
+
+    meters_before = len(engine.keys)
+    entry = engine.registry.notify_session_created(backend.add_session('Nova Sessão'))
+    frame = engine.tick((ticks + 1) / 30.0)
+    print(f"\nNova sessão refletida no tick seguinte: {f'app:{entry.app_name}' in frame.get('keys', ())} "
+          f"({meters_before} -> {len(engine.keys)} medidores)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+import functools
+import threading
+import time
+import types
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from src.core.Activity_Log import Activity_Log
+
+HISTOGRAM_BUCKETS = 128
+
+
+def _bucket_upper(index: int) -> int:
+    if index < 4:
+        return index + 1
+    bits, sub = index >> 2, index & 3
+    return (5 + sub) << (bits - 3)
+
+
+def public_methods(obj: Any) -> List[str]:
+    names = {
+        name for klass in type(obj).__mro__ for name, value in vars(klass).items()
+        if isinstance(value, types.FunctionType) and not name.startswith('_')
+    }
+    return sorted(names)
+
+
+class Latency_Histogram:
+    __slots__ = ('counts', 'count', 'errors', 'total', 'max')
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.counts = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float, error: bool = False) -> None:
+        micros = int(seconds * 1e6)
+        bits = micros.bit_length()
+        self.counts[micros if bits <= 2 else min(HISTOGRAM_BUCKETS - 1, (bits << 2) + ((micros >> (bits - 3)) & 3))] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if error:
+            self.errors += 1
+
+    def percentile(self, fraction: float) -> float:
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if bucket_count and seen >= target:
+                return min(_bucket_upper(index) / 1e6, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_ms': round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(0.50) * 1000, 3),
+            'p95_ms': round(self.percentile(0.95) * 1000, 3),
+            'p99_ms': round(self.percentile(0.99) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+        }
+
+
+class _Timer:
+    __slots__ = ('registry', 'name', 'start')
+
+    def __init__(self, registry: 'Metrics_Registry', name: str) -> None:
+        self.registry = registry
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> '_Timer':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.registry.record(self.name, time.perf_counter() - self.start, exc_type is not None)
+
+
+class _Null_Timer:
+    __slots__ = ()
+
+    def __enter__(self) -> '_Null_Timer':
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        pass
+
+
+_NULL_TIMER = _Null_Timer()
+
+
+class Metrics_Registry:
+    _shared: Optional['Metrics_Registry'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Latency_Histogram] = {}
+        self._started = time.time()
+        self._dump_thread: Optional[threading.Thread] = None
+        self._dump_stop = threading.Event()
+
+    @classmethod
+    def shared(cls) -> 'Metrics_Registry':
+        registry = cls._shared
+        if registry is not None:
+            return registry
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def set_shared(cls, registry: Optional['Metrics_Registry']) -> None:
+        with cls._shared_lock:
+            cls._shared = registry
+
+    def histogram(self, name: str) -> Latency_Histogram:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Latency_Histogram()
+            return histogram
+
+    def record(self, name: str, seconds: float, error: bool = False) -> None:
+        if not self.enabled:
+            return
+        histogram = self._histograms.get(name) or self.histogram(name)
+        with self._lock:
+            histogram.add(seconds, error)
+
+    def timer(self, name: str) -> Any:
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        registry = self
+        histogram = self.histogram(name)
+        lock = self._lock
+        perf_counter = time.perf_counter
+
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            failed = True
+            try:
+                result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                elapsed = perf_counter() - start
+                with lock:
+                    histogram.add(elapsed, failed)
+
+        return timed
+
+    def instrument(self, obj: Any, prefix: str, names: Optional[Iterable[str]] = None) -> List[str]:
+        if names is None:
+            names = public_methods(obj)
+        instrumented = []
+        for name in names:
+            method = getattr(obj, name, None)
+            if callable(method) and not hasattr(method, '__wrapped__'):
+                setattr(obj, name, self.wrap(f"{prefix}.{name}", method))
+                instrumented.append(name)
+        return instrumented
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            series = {name: histogram.to_dict() for name, histogram in sorted(self._histograms.items()) if histogram.count}
+            since = self._started
+            if reset:
+                for histogram in self._histograms.values():
+                    histogram.clear()
+                self._started = time.time()
+        return {'enabled': self.enabled, 'since': since, 'series': series}
+
+    def reset(self) -> None:
+        self.snapshot(reset=True)
+
+    def start_dump(self, interval: float, sink: Optional[Callable[[Dict[str, Any]], None]] = None) -> None:
+        if self._dump_thread is not None:
+            return
+        if sink is None:
+            from src.core.Activity_Log import Activity_Log
+
+            def sink(snapshot: Dict[str, Any]) -> None:
+                slowest = sorted(snapshot['series'].items(), key=lambda item: item[1]['p95_ms'], reverse=True)[:5]
+                summary = ', '.join(f"{name} p95 {stats['p95_ms']:.1f} ms" for name, stats in slowest)
+                Activity_Log.shared().info('metrics', f"Métricas: {summary or 'sem chamadas'}", snapshot)
+
+        self._dump_stop.clear()
+        self._dump_thread = threading.Thread(target=self._dump_loop, args=(interval, sink), name="MetricsDump", daemon=True)
+        self._dump_thread.start()
+
+    def stop_dump(self) -> None:
+        self._dump_stop.set()
+        if self._dump_thread is not None:
+            self._dump_thread.join(timeout=2.0)
+            self._dump_thread = None
+
+    def _dump_loop(self, interval: float, sink: Callable[[Dict[str, Any]], None]) -> None:
+        while not self._dump_stop.wait(interval):
+            try:
+                sink(self.snapshot())
+            except Exception as e:
+                Activity_Log.shared().error('metrics', f"Erro ao exportar métricas: {e}")
+
+
+def main():
+    print("=== Benchmark das Métricas ===\n")
+
+    calls = 200000
+
+    def noop(value: int) -> int:
+        return value
+
+    registry = Metrics_Registry()
+    timed = registry.wrap('bench.noop', noop)
+
+    start = time.perf_counter()
+    for i in range(calls):
+        noop(i)
+    baseline = (time.perf_counter() - start) / calls
+
+    start = time.perf_counter()
+    for i in range(calls):
+        timed(i)
+    enabled = (time.perf_counter() - start) / calls
+
+    registry.enabled = False
+    start = time.perf_counter()
+    for i in range(calls):
+        timed(i)
+    disabled = (time.perf_counter() - start) / calls
+    registry.enabled = True
+
+    start = time.perf_counter()
+    for i in range(calls):
+        with registry.timer('bench.block'):
+            pass
+    block = (time.perf_counter() - start) / calls
+
+    print(f"chamada direta: {baseline * 1e6:.2f} µs")
+    print(f"instrumentada: {enabled * 1e6:.2f} µs (+{(enabled - baseline) * 1e6:.2f} µs)")
+    print(f"desligada (kill switch): {disabled * 1e6:.2f} µs (+{(disabled - baseline) * 1e6:.2f} µs)")
+    print(f"bloco com timer(): {block * 1e6:.2f} µs")
+
+    for i in range(1000):
+        registry.record('bench.sleep', (i % 100 + 1) / 1000.0)
+    stats = registry.snapshot()['series']['bench.sleep']
+    print(f"\nHistograma sintético 1–100 ms: p50 {stats['p50_ms']:.1f} ms, p95 {stats['p95_ms']:.1f} ms, "
+          f"p99 {stats['p99_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
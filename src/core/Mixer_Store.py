@@ -0,0 +1,330 @@
+import copy
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+from src.core.Activity_Log import Activity_Log
+
+Mutation = Dict[str, Any]
+Mixer_State = Dict[str, Any]
+
+MIXER_STATE_VERSION = 1
+
+CHANNEL_FIELDS = ('name', 'volume', 'is_muted', 'color', 'output_device_id', 'input_device_id')
+
+
+def _default_state_dir() -> str:
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'SonusMixer', 'state')
+
+
+def empty_state() -> Mixer_State:
+    return {'version': MIXER_STATE_VERSION, 'seq': 0, 'channels': {}, 'solo': {}, 'apps': {}}
+
+
+def apply_mutation(state: Mixer_State, mutation: Mutation) -> None:
+    op = mutation.get('op')
+    channels = state['channels']
+
+    if op == 'channel_create':
+        channels[mutation['id']] = {
+            'name': mutation.get('name', mutation['id']),
+            'type': mutation.get('type', 'output'),
+            'is_main': bool(mutation.get('is_main', False)),
+            'volume': mutation.get('volume', 80),
+            'is_muted': bool(mutation.get('is_muted', False)),
+            'color': mutation.get('color'),
+            'output_device_id': mutation.get('output_device_id'),
+            'input_device_id': mutation.get('input_device_id'),
+            'apps': list(mutation.get('apps', [])),
+        }
+    elif op == 'channel_remove':
+        channel = channels.pop(mutation['id'], None)
+        if channel and state['solo'].get(channel['type']) == mutation['id']:
+            del state['solo'][channel['type']]
+    elif op == 'channel_set':
+        channel = channels.get(mutation['id'])
+        if channel is not None and mutation.get('field') in CHANNEL_FIELDS:
+            channel[mutation['field']] = mutation.get('value')
+    elif op == 'member_add':
+        channel = channels.get(mutation['id'])
+        if channel is not None and mutation['app'] not in channel['apps']:
+            channel['apps'].append(mutation['app'])
+    elif op == 'member_remove':
+        channel = channels.get(mutation['id'])
+        if channel is not None and mutation['app'] in channel['apps']:
+            channel['apps'].remove(mutation['app'])
+    elif op == 'solo':
+        if mutation.get('id'):
+            state['solo'][mutation['type']] = mutation['id']
+        else:
+            state['solo'].pop(mutation['type'], None)
+    elif op == 'app_state':
+        state['apps'][mutation['app']] = {'volume': mutation.get('volume'), 'is_muted': bool(mutation.get('is_muted', False))}
+    elif op == 'app_forget':
+        state['apps'].pop(mutation['app'], None)
+
+
+def coalesce_key(mutation: Mutation, fallback: int) -> Hashable:
+    op = mutation.get('op')
+    if op == 'channel_set':
+        return (op, mutation.get('id'), mutation.get('field'))
+    if op == 'app_state':
+        return (op, mutation.get('app'))
+    if op == 'solo':
+        return (op, mutation.get('type'))
+    return ('seq', fallback)
+
+
+class Mixer_State_Store:
+    def __init__(self, directory: Optional[str] = None, debounce: float = 0.25, compact_every: int = 2000, fsync: bool = True) -> None:
+        self.directory = directory if directory is not None else _default_state_dir()
+        self.debounce = debounce
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.state = empty_state()
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending: 'OrderedDict[Hashable, Mutation]' = OrderedDict()
+        self._first_pending: Optional[float] = None
+        self._unique = itertools.count()
+        self._journal_records = 0
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.stats = {
+            'recorded': 0,
+            'coalesced': 0,
+            'written': 0,
+            'batches': 0,
+            'compactions': 0,
+            'replayed': 0,
+            'load_ms': 0.0,
+            'errors': 0,
+        }
+
+    @property
+    def snapshot_path(self) -> str:
+        return os.path.join(self.directory, 'mixer_state.json')
+
+    @property
+    def journal_path(self) -> str:
+        return os.path.join(self.directory, 'mixer_state.journal')
+
+    def load(self) -> Mixer_State:
+        started = time.perf_counter()
+        state = empty_state()
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if isinstance(snapshot, dict) and snapshot.get('version') == MIXER_STATE_VERSION:
+                state = snapshot
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            Activity_Log.shared().error('mixer', f"Erro ao ler snapshot do mixer, usando estado padrão: {e}")
+
+        replayed = 0
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        mutation = json.loads(line)
+                    except ValueError:
+                        break
+                    if mutation.get('seq', 0) <= state['seq']:
+                        continue
+                    apply_mutation(state, mutation)
+                    state['seq'] = mutation['seq']
+                    replayed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            Activity_Log.shared().error('mixer', f"Erro ao ler journal do mixer: {e}")
+
+        with self._write_lock:
+            self.state = state
+            self._journal_records = replayed
+        self.stats['replayed'] = replayed
+        self.stats['load_ms'] = (time.perf_counter() - started) * 1000.0
+        return copy.deepcopy(state)
+
+    def record(self, mutation: Mutation) -> None:
+        with self._cond:
+            self.stats['recorded'] += 1
+            key = coalesce_key(mutation, next(self._unique))
+            if key in self._pending:
+                self.stats['coalesced'] += 1
+                del self._pending[key]
+            self._pending[key] = mutation
+            if self._first_pending is None:
+                self._first_pending = time.monotonic()
+            self._cond.notify()
+
+    def flush(self) -> int:
+        with self._cond:
+            batch = list(self._pending.values())
+            self._pending.clear()
+            self._first_pending = None
+        return self._write(batch)
+
+    def compact(self) -> None:
+        with self._write_lock:
+            self._compact()
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="MixerStateStore", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return dict(self.stats, pending=len(self._pending), journal_records=self._journal_records)
+
+    def _write(self, batch: List[Mutation]) -> int:
+        if not batch:
+            return 0
+        with self._write_lock:
+            lines = []
+            for mutation in batch:
+                self.state['seq'] += 1
+                record = dict(mutation, seq=self.state['seq'])
+                apply_mutation(self.state, record)
+                lines.append(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(self.journal_path, 'a', encoding='utf-8') as f:
+                    f.write('\n'.join(lines) + '\n')
+                    f.flush()
+                    if self.fsync:
+                        os.fsync(f.fileno())
+                self._journal_records += len(lines)
+                self.stats['written'] += len(lines)
+                self.stats['batches'] += 1
+            except OSError as e:
+                self.stats['errors'] += 1
+                Activity_Log.shared().error('mixer', f"Erro ao gravar journal do mixer: {e}")
+                return 0
+
+            if self._journal_records >= self.compact_every:
+                self._compact()
+            return len(lines)
+
+    def _compact(self) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False, separators=(',', ':'))
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            os.close(fd)
+            os.replace(tmp_path, self.journal_path)
+            self._journal_records = 0
+            self.stats['compactions'] += 1
+        except OSError as e:
+            self.stats['errors'] += 1
+            Activity_Log.shared().error('mixer', f"Erro ao compactar estado do mixer: {e}")
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                remaining = self._first_pending + self.debounce - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    if self._running:
+                        continue
+            try:
+                self.flush()
+            except Exception as e:
+                Activity_Log.shared().error('mixer', f"Erro ao persistir estado do mixer: {e}")
+
+
+def restore_channels(channel_manager: Any, state: Mixer_State) -> int:
+    restored = 0
+    for channel_id, saved in state.get('channels', {}).items():
+        channel = channel_manager.get_channel(channel_id)
+        if channel is None:
+            if saved.get('is_main'):
+                continue
+            channel = channel_manager.create_channel(saved['name'], saved['type'], channel_id=channel_id)
+        for field in CHANNEL_FIELDS:
+            if saved.get(field) is not None:
+                setattr(channel, field, saved[field])
+        for app_name in saved.get('apps', []):
+            channel_manager.add_app(channel_id, app_name)
+        restored += 1
+
+    for channel_id in state.get('solo', {}).values():
+        channel_manager.set_solo(channel_id, True)
+    return restored
+
+
+def main():
+    print("=== Benchmark do Mixer State Store ===\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        channels = 200
+        writer = Mixer_State_Store(directory, compact_every=10 ** 9, fsync=False)
+        for i in range(channels):
+            writer.record({'op': 'channel_create', 'id': f"channel_{i}", 'name': f"Canal {i}", 'type': 'output'})
+            for j in range(10):
+                writer.record({'op': 'member_add', 'id': f"channel_{i}", 'app': f"app_{i}_{j}"})
+        writer.flush()
+        for i in range(200000):
+            writer.record({'op': 'channel_set', 'id': f"channel_{i % channels}", 'field': 'volume', 'value': i % 101})
+            if i % channels == channels - 1:
+                writer.flush()
+        writer.flush()
+
+        size = os.path.getsize(writer.journal_path)
+        reader = Mixer_State_Store(directory)
+        state = reader.load()
+        print(f"Journal com {reader.stats['replayed']} registros ({size / 1024:.0f} KiB): "
+              f"carga + replay em {reader.stats['load_ms']:.1f} ms, {len(state['channels'])} canais")
+
+        reader.compact()
+        compacted = Mixer_State_Store(directory)
+        compacted.load()
+        print(f"Após compactação: snapshot de {os.path.getsize(reader.snapshot_path) / 1024:.0f} KiB, "
+              f"carga em {compacted.stats['load_ms']:.2f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = Mixer_State_Store(directory, debounce=0.25)
+        store.start()
+        start = time.perf_counter()
+        while time.perf_counter() - start < 1.0:
+            store.record({'op': 'channel_set', 'id': 'main_output', 'field': 'volume', 'value': int((time.perf_counter() - start) * 100)})
+            time.sleep(0.002)
+        store.stop()
+        stats = store.get_stats()
+        print(f"\nArraste de 1 s: {stats['recorded']} eventos -> {stats['written']} registros em {stats['batches']} fsyncs "
+              f"({stats['coalesced']} coalescidos)")
+
+
+if __name__ == "__main__":
+    main()
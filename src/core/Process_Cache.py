@@ -0,0 +1,191 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+Process_Key = Tuple[int, float]
+
+
+def normalize_app_name(process_name: str) -> str:
+    return process_name.lower().replace('.exe', '')
+
+
+def open_process(pid: int) -> Any:
+    import psutil
+    return psutil.Process(pid)
+
+
+class Process_Info:
+    __slots__ = ('pid', 'create_time', 'name', 'app_name', 'normalized_name', 'last_seen', '_process', '_exe_path')
+
+    def __init__(self, pid: int, create_time: Optional[float], name: str, process: Any = None) -> None:
+        self.pid = pid
+        self.create_time = create_time
+        self.name = name
+        self.app_name = name.replace('.exe', '')
+        self.normalized_name = normalize_app_name(name)
+        self.last_seen = time.monotonic()
+        self._process = process
+        self._exe_path: Optional[str] = None
+
+    @property
+    def key(self) -> Optional[Process_Key]:
+        return None if self.create_time is None else (self.pid, self.create_time)
+
+    @property
+    def exe_path(self) -> Optional[str]:
+        if self._exe_path is None:
+            self._exe_path = ''
+            if self._process is not None:
+                try:
+                    self._exe_path = self._process.exe() or ''
+                except Exception:
+                    pass
+            self._process = None
+        return self._exe_path or None
+
+    def __repr__(self) -> str:
+        return f"Process_Info({self.name!r}, pid={self.pid})"
+
+
+class Process_Metadata_Cache:
+    _shared: Optional['Process_Metadata_Cache'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, idle_ttl: float = 30.0, opener: Callable[[int], Any] = open_process) -> None:
+        self.idle_ttl = idle_ttl
+        self.opener = opener
+        self._lock = threading.Lock()
+        self._by_pid: Dict[int, Process_Info] = {}
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'reused': 0,
+            'evicted': 0,
+            'errors': 0,
+        }
+
+    @classmethod
+    def shared(cls) -> 'Process_Metadata_Cache':
+        cache = cls._shared
+        if cache is not None:
+            return cache
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def set_shared(cls, cache: Optional['Process_Metadata_Cache']) -> None:
+        with cls._shared_lock:
+            cls._shared = cache
+
+    def resolve(self, pid: int, process: Any = None) -> Optional[Process_Info]:
+        try:
+            if process is None:
+                process = self.opener(pid)
+            create_time = process.create_time()
+        except Exception:
+            create_time = None
+
+        with self._lock:
+            info = self._by_pid.get(pid)
+            if info is not None and create_time is not None:
+                if info.create_time == create_time:
+                    self.stats['hits'] += 1
+                    info.last_seen = time.monotonic()
+                    return info
+                del self._by_pid[pid]
+                self.stats['reused'] += 1
+            self.stats['misses'] += 1
+
+        if process is None:
+            return None
+        try:
+            name = process.name()
+        except Exception:
+            with self._lock:
+                self.stats['errors'] += 1
+            raise
+        if not name:
+            return None
+
+        info = Process_Info(pid, create_time, name, process)
+        if create_time is not None:
+            with self._lock:
+                self._by_pid[pid] = info
+        return info
+
+    def get_exe_path(self, pid: int) -> Optional[str]:
+        info = self.resolve(pid)
+        return info.exe_path if info is not None else None
+
+    def forget(self, pid: int) -> bool:
+        with self._lock:
+            if self._by_pid.pop(pid, None) is None:
+                return False
+            self.stats['evicted'] += 1
+            return True
+
+    def prune(self, live_pids: Iterable[int]) -> int:
+        now = time.monotonic()
+        with self._lock:
+            for pid in live_pids:
+                info = self._by_pid.get(pid)
+                if info is not None:
+                    info.last_seen = now
+            expired = [pid for pid, info in self._by_pid.items() if now - info.last_seen >= self.idle_ttl]
+            for pid in expired:
+                del self._by_pid[pid]
+            self.stats['evicted'] += len(expired)
+            return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_pid.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return dict(
+                self.stats,
+                entries=len(self._by_pid),
+                hit_rate=round(self.stats['hits'] / lookups, 4) if lookups else 0.0
+            )
+
+
+def main():
+    print("=== Benchmark do Process Cache ===\n")
+
+    from src.core.Session_Registry import Fake_Process
+
+    processes = [Fake_Process(1000 + i, f"app{i}.exe", latency=0.0002) for i in range(200)]
+    by_pid = {process.pid: process for process in processes}
+    cache = Process_Metadata_Cache(idle_ttl=0.0, opener=lambda pid: by_pid[pid])
+
+    start = time.perf_counter()
+    for process in processes:
+        cache.resolve(process.pid, process).exe_path
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for process in processes:
+        cache.resolve(process.pid, process).exe_path
+    warm = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for process in processes:
+        cache.get_exe_path(process.pid)
+    by_pid_only = time.perf_counter() - start
+
+    reused = Fake_Process(1000, "outro.exe", create_time=processes[0].create_time() + 1.0)
+    by_pid[1000] = reused
+    info = cache.resolve(1000)
+
+    print(f"200 processos, frio: {cold * 1000:.2f} ms, quente: {warm * 1000:.2f} ms, só PID: {by_pid_only * 1000:.2f} ms")
+    print(f"PID reutilizado 1000 -> {info.name} (entrada antiga rejeitada)")
+    print(f"Despejo sem sessões: {cache.prune([])} entradas")
+    print(f"   {cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from src.core.Activity_Log import Activity_Log
+from src.core.Endpoint_Inventory import Endpoint_Inventory
+from src.core.Session_Registry import Session_Registry
+
+PROFILE_FORMAT_VERSION = 1
+
+DEFAULT_PROFILE_NAMES = ('Streaming', 'Jogos', 'Trabalho')
+
+Profile_State = Dict[str, Any]
+
+
+def _default_profiles_dir() -> str:
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'SonusMixer', 'profiles')
+
+
+def _profile_file_name(name: str) -> str:
+    return re.sub(r'[^\w\-]+', '_', name.strip(), flags=re.UNICODE) + '.json'
+
+
+class Profile_Store:
+    def __init__(self, directory: Optional[str] = None) -> None:
+        self.directory = directory if directory is not None else _default_profiles_dir()
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Profile_State] = {}
+
+    def list(self) -> List[str]:
+        with self._lock:
+            names = set(self._cache)
+            try:
+                for file_name in os.listdir(self.directory):
+                    if file_name.endswith('.json'):
+                        state = self._read(os.path.join(self.directory, file_name))
+                        if state and state.get('name'):
+                            names.add(state['name'])
+            except OSError:
+                pass
+            return sorted(names)
+
+    def load(self, name: str) -> Optional[Profile_State]:
+        with self._lock:
+            state = self._cache.get(name)
+            if state is None:
+                state = self._read(os.path.join(self.directory, _profile_file_name(name)))
+                if state is not None:
+                    self._cache[name] = state
+            return state
+
+    def save(self, name: str, state: Profile_State) -> None:
+        state = dict(state, name=name)
+        data = json.dumps(state, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, os.path.join(self.directory, _profile_file_name(name)))
+            self._cache[name] = state
+
+    def delete(self, name: str) -> bool:
+        with self._lock:
+            self._cache.pop(name, None)
+            try:
+                os.remove(os.path.join(self.directory, _profile_file_name(name)))
+                return True
+            except OSError:
+                return False
+
+    @staticmethod
+    def _read(path: str) -> Optional[Profile_State]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get('version') != PROFILE_FORMAT_VERSION:
+            return None
+        return state
+
+
+def diff_profile(live: Profile_State, target: Profile_State) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    structure = {'create': [], 'remove': [], 'add_apps': [], 'remove_apps': []}
+    ops: List[Dict[str, Any]] = []
+
+    def compare(target_name: str, target_id: str, current: Optional[Dict[str, Any]], wanted: Dict[str, Any], fields: Tuple[str, ...], **extra: Any) -> None:
+        for field in fields:
+            if field not in wanted:
+                continue
+            if current is not None and current.get(field) == wanted[field]:
+                continue
+            action = 'volume' if field == 'volume' else ('mute' if field == 'is_muted' else 'solo')
+            ops.append(dict({'target': target_name, 'id': target_id, 'action': action, 'value': wanted[field]}, **extra))
+
+    live_channels = live.get('channels', {})
+    target_channels = target.get('channels', {})
+    for channel_id, wanted in target_channels.items():
+        current = live_channels.get(channel_id)
+        if current is None:
+            structure['create'].append({'id': channel_id, 'name': wanted.get('name', channel_id), 'type': wanted.get('type', 'output')})
+            current_apps: List[str] = []
+        else:
+            current_apps = current.get('apps', [])
+        wanted_apps = wanted.get('apps', [])
+        current_set = set(current_apps)
+        wanted_set = set(wanted_apps)
+        structure['add_apps'].extend((channel_id, app) for app in wanted_apps if app not in current_set)
+        structure['remove_apps'].extend((channel_id, app) for app in current_apps if app not in wanted_set)
+        compare('channel', channel_id, current, wanted, ('volume', 'is_muted'))
+    for channel_id, current in live_channels.items():
+        if channel_id not in target_channels and not current.get('is_main'):
+            structure['remove'].append(channel_id)
+
+    for channel_id, wanted in target_channels.items():
+        current = live_channels.get(channel_id)
+        if wanted.get('is_solo') and not (current or {}).get('is_solo'):
+            ops.append({'target': 'channel', 'id': channel_id, 'action': 'solo', 'value': True})
+    for channel_id, current in live_channels.items():
+        wanted = target_channels.get(channel_id)
+        if current.get('is_solo') and wanted is not None and not wanted.get('is_solo'):
+            soloed_type = any(other.get('is_solo') and other.get('type') == current.get('type') for other in target_channels.values())
+            if not soloed_type:
+                ops.append({'target': 'channel', 'id': channel_id, 'action': 'solo', 'value': False})
+
+    live_apps = live.get('apps', {})
+    for app_name, wanted in target.get('apps', {}).items():
+        if app_name in live_apps:
+            compare('app', app_name, live_apps[app_name], wanted, ('volume', 'is_muted'))
+
+    live_devices = live.get('devices', {})
+    for device_key, wanted in target.get('devices', {}).items():
+        if device_key in live_devices:
+            device_type, device_id = device_key.split(':', 1)
+            compare('device', device_id, live_devices[device_key], wanted, ('volume', 'is_muted'), device_type=device_type)
+
+    if 'master' in target and 'master' in live:
+        compare('master', '', live['master'], target['master'], ('volume', 'is_muted'))
+
+    for flow in ('output', 'input'):
+        wanted_default = target.get('defaults', {}).get(flow)
+        if wanted_default and wanted_default != live.get('defaults', {}).get(flow) and f"{flow}:{wanted_default}" in live_devices:
+            structure.setdefault('defaults', {})[flow] = wanted_default
+
+    return structure, ops
+
+
+class Profile_Service:
+    def __init__(self, channel_manager: Any, batch_service: Any, gain_engine: Any = None, master_controller: Any = None, store: Optional[Profile_Store] = None, registry: Optional[Session_Registry] = None, inventory: Optional[Endpoint_Inventory] = None, backend: Any = None) -> None:
+        self.channel_manager = channel_manager
+        self.batch_service = batch_service
+        self.gain_engine = gain_engine
+        self.master_controller = master_controller
+        self.store = store or Profile_Store()
+        self.registry = registry
+        self.inventory = inventory
+        self.backend = backend
+        self.active: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def capture(self) -> Profile_State:
+        registry = self.registry or Session_Registry.shared()
+        inventory = self.inventory or Endpoint_Inventory.shared()
+
+        apps: Dict[str, Dict[str, Any]] = {}
+        for entry in registry.get_sessions():
+            if entry.app_name in apps or "svchost" in entry.app_name:
+                continue
+            state = self.gain_engine.get_app_state(entry.app_name) if self.gain_engine else None
+            if state is None:
+                try:
+                    interface = entry.interface
+                    state = {'volume': round(interface.GetMasterVolume() * 100), 'is_muted': bool(interface.GetMute())}
+                except Exception as e:
+                    Activity_Log.shared().error('profiles', f"Erro ao capturar estado de '{entry.app_name}': {e}")
+                    continue
+            apps[entry.app_name] = state
+
+        devices: Dict[str, Dict[str, Any]] = {}
+        defaults: Dict[str, str] = {}
+        for endpoint in inventory.get_endpoints():
+            devices[f"{endpoint.flow}:{endpoint.id}"] = {'volume': endpoint.get_volume(), 'is_muted': endpoint.get_mute()}
+            if endpoint.is_default:
+                defaults[endpoint.flow] = endpoint.id
+
+        channels = {}
+        for channel in self.channel_manager.channels.values():
+            channels[channel.id] = {
+                'name': channel.name,
+                'type': channel.type,
+                'volume': round(channel.volume),
+                'is_muted': channel.is_muted,
+                'is_solo': channel.is_solo,
+                'is_main': channel.is_main,
+                'apps': channel.connected_apps,
+            }
+
+        state: Profile_State = {
+            'version': PROFILE_FORMAT_VERSION,
+            'apps': apps,
+            'devices': devices,
+            'defaults': defaults,
+            'channels': channels,
+        }
+        if self.master_controller is not None:
+            master = self.master_controller.get_state()
+            state['master'] = {'volume': master['volume'], 'is_muted': bool(master['is_muted'])}
+        return state
+
+    def save(self, name: str) -> Profile_State:
+        state = self.capture()
+        self.store.save(name, state)
+        with self._lock:
+            self.active = name
+        return state
+
+    def switch(self, name: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        target = self.store.load(name)
+        if target is None:
+            raise KeyError(f"Perfil '{name}' não encontrado")
+        loaded = time.perf_counter()
+
+        live = self.capture()
+        captured = time.perf_counter()
+
+        structure, ops = diff_profile(live, target)
+        diffed = time.perf_counter()
+
+        self._apply_structure(structure, target)
+        report = self.batch_service.apply(ops) if ops else {'results': [], 'applied': 0, 'skipped': 0}
+        applied = time.perf_counter()
+
+        with self._lock:
+            self.active = name
+
+        errors = [result['error'] for result in report['results'] if not result['ok']]
+        return {
+            'profile': name,
+            'ops': len(ops),
+            'structure': sum(len(value) for value in structure.values()),
+            'applied': report['applied'],
+            'skipped': report['skipped'],
+            'errors': errors,
+            'load_ms': round((loaded - started) * 1000, 3),
+            'capture_ms': round((captured - loaded) * 1000, 3),
+            'diff_ms': round((diffed - captured) * 1000, 3),
+            'apply_ms': round((applied - diffed) * 1000, 3),
+            'total_ms': round((applied - started) * 1000, 3),
+        }
+
+    def _apply_structure(self, structure: Dict[str, Any], target: Profile_State) -> None:
+        manager = self.channel_manager
+        for channel_id in structure['remove']:
+            if manager.remove_channel(channel_id) and self.gain_engine:
+                self.gain_engine.remove_channel(channel_id)
+
+        for spec in structure['create']:
+            channel = manager.create_channel(spec['name'], spec['type'], channel_id=spec['id'])
+            wanted = target['channels'][spec['id']]
+            channel.volume = wanted.get('volume', channel.volume)
+            channel.is_muted = wanted.get('is_muted', False)
+            if self.gain_engine:
+                self.gain_engine.update_channel(channel)
+
+        for channel_id, app_name in structure['remove_apps']:
+            if manager.remove_app(channel_id, app_name) and self.gain_engine:
+                self.gain_engine.remove_member(channel_id, app_name)
+        for channel_id, app_name in structure['add_apps']:
+            if manager.add_app(channel_id, app_name) and self.gain_engine:
+                self.gain_engine.add_member(channel_id, app_name)
+
+        for flow, device_id in structure.get('defaults', {}).items():
+            try:
+                from src.core.Audio_Backend import Audio_Backend
+                (self.backend or Audio_Backend.shared()).set_default_device(device_id, flow)
+                (self.inventory or Endpoint_Inventory.shared()).invalidate()
+            except Exception as e:
+                Activity_Log.shared().error('profiles', f"Erro ao trocar dispositivo padrão ({flow}) do perfil: {e}")
+
+
+def main():
+    print("=== Benchmark de Perfis ===\n")
+
+    from audio_channel import ChannelManager
+    from src.core.Batch_Controller import Fake_Master_Controller, Mixer_Batch_Service
+    from src.core.Gain_Engine import Gain_Engine, Session_Gain_Sink
+    from src.core.Simulated_Backend import Simulated_Backend
+
+    backend = Simulated_Backend(sessions=60, outputs=6, inputs=3, latency=0.0001, seed=7)
+    registry = Session_Registry(backend, max_age=60.0)
+    inventory = Endpoint_Inventory(backend)
+    manager = ChannelManager()
+    master = Fake_Master_Controller()
+    engine = Gain_Engine(Session_Gain_Sink(registry))
+    batch = Mixer_Batch_Service(manager, master, registry, inventory, gain_engine=engine)
+
+    with tempfile.TemporaryDirectory() as directory:
+        service = Profile_Service(manager, batch, engine, master, Profile_Store(directory), registry, inventory, backend)
+        app_names = sorted({entry.app_name for entry in registry.get_sessions()})
+
+        service.save('Trabalho')
+
+        games = manager.create_channel('Jogos', 'output')
+        for app_name in app_names[:10]:
+            manager.add_app(games.id, app_name)
+            engine.add_member(games.id, app_name)
+        batch.apply(
+            [{'target': 'app', 'id': name, 'action': 'volume', 'value': 30 + i % 60} for i, name in enumerate(app_names[10:])]
+            + [{'target': 'channel', 'id': games.id, 'action': 'volume', 'value': 65},
+               {'target': 'master', 'id': '', 'action': 'volume', 'value': 35}]
+        )
+        service.save('Jogos')
+
+        for name in ('Trabalho', 'Jogos', 'Jogos', 'Trabalho'):
+            report = service.switch(name)
+            print(f"-> {name}: {report['ops']} ops ({report['applied']} aplicadas, {report['skipped']} ignoradas, "
+                  f"{report['structure']} estruturais) | carga {report['load_ms']:.2f} ms, captura {report['capture_ms']:.2f} ms, "
+                  f"diff {report['diff_ms']:.2f} ms, aplicação {report['apply_ms']:.2f} ms, total {report['total_ms']:.2f} ms")
+
+        full = [
+            {'target': 'app', 'id': name, 'action': action, 'value': state[field]}
+            for name, state in service.store.load('Jogos')['apps'].items()
+            for action, field in (('volume', 'volume'), ('mute', 'is_muted'))
+        ]
+        start = time.perf_counter()
+        for op in full:
+            batch.apply([op])
+        replay = time.perf_counter() - start
+        print(f"\nReaplicar todas as configurações uma a uma: {len(full)} chamadas em {replay * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,623 @@
+import asyncio
+import base64
+import functools
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlsplit
+from src.core.Activity_Log import Activity_Log
+
+REMOTE_DEFAULT_PORT = 8765
+REMOTE_METHODS = (
+    'get_audio_apps', 'get_audio_apps_delta', 'set_app_volume', 'toggle_app_mute', 'toggle_app_solo',
+    'get_audio_master', 'get_master_state', 'set_master_volume', 'toggle_master_mute',
+    'get_inputs_devices', 'get_output_devices', 'set_output_device', 'set_input_device', 'set_device_volume', 'toggle_device_mute',
+    'get_audio_channels', 'create_channel', 'remove_channel', 'set_channel_volume', 'toggle_channel_mute', 'toggle_channel_solo',
+    'add_app_to_channel', 'remove_app_from_channel',
+    'get_virtual_cables', 'route_app_to_device', 'route_apps_to_device', 'route_channel_to_device',
+    'get_app_routing', 'get_app_routes', 'reset_app_routing',
+    'apply_batch', 'get_profiles', 'switch_profile', 'flush_volume_updates',
+)
+LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '::1')
+STREAM_TOPICS = ('meters', 'spectrum')
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+HTTP_REASONS = {
+    200: 'OK', 400: 'Bad Request', 401: 'Unauthorized', 403: 'Forbidden', 404: 'Not Found',
+    405: 'Method Not Allowed', 413: 'Payload Too Large', 415: 'Unsupported Media Type', 500: 'Internal Server Error'
+}
+
+
+def _mask(payload: bytes, key: bytes) -> bytes:
+    if not payload:
+        return payload
+    length = len(payload)
+    mask = int.from_bytes((key * (length // 4 + 1))[:length], 'big')
+    return (int.from_bytes(payload, 'big') ^ mask).to_bytes(length, 'big')
+
+
+def encode_frame(opcode: int, payload: bytes, mask: bool = False) -> bytes:
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 65536:
+        header.append(mask_bit | 126)
+        header += struct.pack('!H', length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack('!Q', length)
+    if mask:
+        key = os.urandom(4)
+        header += key
+        payload = _mask(payload, key)
+    return bytes(header) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader, max_size: int = 1 << 20) -> Tuple[bool, int, bytes]:
+    head = await reader.readexactly(2)
+    length = head[1] & 0x7F
+    if length == 126:
+        length = struct.unpack('!H', await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', await reader.readexactly(8))[0]
+    if length > max_size:
+        raise ValueError(f"Frame WebSocket muito grande: {length} bytes")
+    key = await reader.readexactly(4) if head[1] & 0x80 else None
+    payload = await reader.readexactly(length)
+    return bool(head[0] & 0x80), head[0] & 0x0F, _mask(payload, key) if key else payload
+
+
+def _json_frame(message: Any) -> bytes:
+    return encode_frame(OP_TEXT, json.dumps(message, default=str, separators=(',', ':')).encode('utf-8'))
+
+
+RESYNC_FRAME = _json_frame({'type': 'resync'})
+
+
+class _Client:
+    __slots__ = ('writer', 'meters', 'frames', 'state', 'state_limit', 'resync', 'replies', 'wake', 'sent', 'dropped', 'peer')
+
+    def __init__(self, writer: asyncio.StreamWriter, meters: bool, queue_size: int, state_queue_size: int) -> None:
+        self.writer = writer
+        self.meters = meters
+        self.frames: Deque[bytes] = deque(maxlen=queue_size)
+        self.state: Deque[bytes] = deque()
+        self.state_limit = state_queue_size
+        self.resync = False
+        self.replies: Deque[bytes] = deque()
+        self.wake = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+        self.peer = writer.get_extra_info('peername')
+
+    def push(self, frame: bytes) -> None:
+        if len(self.frames) == self.frames.maxlen:
+            self.dropped += 1
+        self.frames.append(frame)
+        self.wake.set()
+
+    def push_state(self, frame: bytes) -> None:
+        if len(self.state) >= self.state_limit:
+            self.dropped += len(self.state)
+            self.state.clear()
+            self.resync = True
+        self.state.append(frame)
+        self.wake.set()
+
+    def take(self) -> List[bytes]:
+        frames = list(self.replies)
+        if self.resync:
+            frames.append(RESYNC_FRAME)
+        frames += self.state
+        frames += self.frames
+        self.replies.clear()
+        self.state.clear()
+        self.frames.clear()
+        self.resync = False
+        return frames
+
+    def reply(self, frame: bytes) -> None:
+        self.replies.append(frame)
+        self.wake.set()
+
+
+class Remote_Server:
+    def __init__(self, api: Any, host: str = '127.0.0.1', port: int = REMOTE_DEFAULT_PORT, token: Optional[str] = None,
+                 methods: Iterable[str] = REMOTE_METHODS, queue_size: int = 32, state_queue_size: int = 1024, workers: int = 4,
+                 write_buffer: int = 256 * 1024, slow_client_timeout: float = 5.0, max_body: int = 1 << 20) -> None:
+        self.api = api
+        self.host = host
+        self.port = port
+        self.token = token or secrets.token_urlsafe(16)
+        self.methods = {name for name in methods if callable(getattr(api, name, None))}
+        self.queue_size = queue_size
+        self.state_queue_size = state_queue_size
+        self.write_buffer = write_buffer
+        self.slow_client_timeout = slow_client_timeout
+        self.max_body = max_body
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="RemoteApi")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._clients: Set[_Client] = set()
+        self._meter_keys: List[str] = []
+        self.address: Optional[Tuple[str, int]] = None
+        self.stats = {
+            'connections': 0,
+            'http_requests': 0,
+            'rpc_calls': 0,
+            'errors': 0,
+            'broadcasts': 0,
+            'frames_sent': 0,
+            'bytes_sent': 0,
+            'frames_dropped': 0,
+            'slow_disconnects': 0,
+        }
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._started.clear()
+        self._thread = threading.Thread(target=self._run, name="RemoteServer", daemon=True)
+        self._thread.start()
+        self._started.wait(5.0)
+        if self.address is None:
+            raise OSError(f"Não foi possível iniciar o servidor remoto em {self.host}:{self.port}")
+        Activity_Log.shared().info('remote', f"Controle remoto em http://{self.address[0]}:{self.address[1]}/api (WebSocket em /ws), token: {self.token}")
+
+    def stop(self) -> None:
+        loop = self._loop
+        if loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=5.0)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5.0)
+        self._thread = None
+        self._executor.shutdown(wait=False)
+
+    def broadcast(self, batch: List[Dict[str, Any]]) -> None:
+        for event in batch:
+            if event['topic'] == 'meters' and isinstance(event['data'], dict) and 'keys' in event['data']:
+                self._meter_keys = event['data']['keys']
+        loop = self._loop
+        if loop is None or not self._clients:
+            return
+        meters = [event for event in batch if event['topic'] in STREAM_TOPICS]
+        state = [event for event in batch if event['topic'] not in STREAM_TOPICS]
+        state_frame = _json_frame({'type': 'events', 'events': state}) if state else None
+        meter_frame = _json_frame({'type': 'events', 'events': meters}) if meters else None
+        loop.call_soon_threadsafe(self._fan_out, state_frame, meter_frame)
+
+    def get_stats(self) -> Dict[str, Any]:
+        clients = list(self._clients)
+        return dict(
+            self.stats,
+            clients=len(clients),
+            queued=sum(len(client.frames) + len(client.state) for client in clients),
+            frames_dropped=self.stats['frames_dropped'] + sum(client.dropped for client in clients)
+        )
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            self._server = loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port, limit=64 * 1024))
+            self.address = self._server.sockets[0].getsockname()[:2]
+        except OSError as e:
+            Activity_Log.shared().error('remote', f"Erro ao abrir servidor remoto: {e}")
+            self._started.set()
+            loop.close()
+            self._loop = None
+            return
+        self._started.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+            self._loop = None
+
+    async def _shutdown(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for client in list(self._clients):
+            client.writer.close()
+        self._clients.clear()
+
+    def _fan_out(self, state_frame: Optional[bytes], meter_frame: Optional[bytes]) -> None:
+        self.stats['broadcasts'] += 1
+        for client in self._clients:
+            if state_frame is not None:
+                client.push_state(state_frame)
+            if meter_frame is not None and client.meters:
+                client.push(meter_frame)
+
+    def _authorized(self, path: str, headers: Dict[str, str], query: Dict[str, str]) -> Tuple[int, str]:
+        if self.host in LOOPBACK_HOSTS:
+            host = headers.get('host', '')
+            hostname = host[1:host.find(']')] if host.startswith('[') else host.rsplit(':', 1)[0]
+            if hostname not in LOOPBACK_HOSTS:
+                return 403, "Host não permitido"
+        supplied = headers.get('authorization', '')
+        supplied = supplied[7:] if supplied.startswith('Bearer ') else ''
+        if not supplied and path == '/ws':
+            supplied = query.get('token', '')
+        if not hmac.compare_digest(supplied.encode(), self.token.encode()):
+            return 401, "Token inválido"
+        return 200, ''
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats['connections'] += 1
+        writer.transport.set_write_buffer_limits(high=self.write_buffer)
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.write_buffer)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    return
+                method, path, query, headers, body = request
+                keep_alive = headers.get('connection', '').lower() != 'close'
+
+                status, reason = self._authorized(path, headers, query)
+                if status != 200:
+                    await self._respond(writer, status, {'error': reason}, False)
+                    return
+                if path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                    await self._websocket(reader, writer, headers, query)
+                    return
+
+                status, payload = await self._route(method, path, query, headers, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], Dict[str, str], bytes]]:
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError:
+            return None
+        lines = head.decode('latin-1').split('\r\n')
+        method, target, _ = lines[0].split(' ', 2)
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length') or 0)
+        if length > self.max_body:
+            raise ValueError(f"Corpo muito grande: {length} bytes")
+        body = await reader.readexactly(length) if length else b''
+        url = urlsplit(target)
+        return method.upper(), url.path.rstrip('/') or '/', dict(parse_qsl(url.query)), headers, body
+
+    async def _route(self, method: str, path: str, query: Dict[str, str], headers: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        self.stats['http_requests'] += 1
+        if path == '/api':
+            return 200, {'methods': sorted(self.methods)}
+        if path == '/api/stats':
+            return 200, self.get_stats()
+        if not path.startswith('/api/') or method not in ('GET', 'POST'):
+            return 404, {'error': f"Rota não encontrada: {path}"}
+
+        name = path[5:]
+        if method == 'GET' and not name.startswith('get_'):
+            return 405, {'error': f"'{name}' altera o mixer e exige POST"}
+        if method == 'POST' and headers.get('content-type', '').split(';', 1)[0].strip().lower() != 'application/json':
+            return 415, {'error': "POST exige Content-Type: application/json"}
+
+        params: Any = dict(query)
+        if body:
+            try:
+                params = json.loads(body)
+            except ValueError:
+                return 400, {'error': "JSON inválido"}
+        return await self._call(name, params)
+
+    async def _call(self, name: str, params: Any) -> Tuple[int, Any]:
+        if name not in self.methods:
+            return 404, {'error': f"Método desconhecido: {name}"}
+        args, kwargs = (params, {}) if isinstance(params, list) else ([], params or {})
+        if not isinstance(kwargs, dict):
+            return 400, {'error': "Parâmetros devem ser uma lista ou um objeto"}
+        try:
+            call = functools.partial(getattr(self.api, name), *args, **kwargs)
+            return 200, {'result': await asyncio.get_running_loop().run_in_executor(self._executor, call)}
+        except TypeError as e:
+            return 400, {'error': str(e)}
+        except Exception as e:
+            self.stats['errors'] += 1
+            Activity_Log.shared().error('remote', f"Erro ao executar '{name}' remotamente: {e}")
+            return 500, {'error': str(e)}
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        body = json.dumps(payload, default=str, separators=(',', ':')).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def _websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, headers: Dict[str, str], query: Dict[str, str]) -> None:
+        key = headers.get('sec-websocket-key')
+        if not key:
+            await self._respond(writer, 400, {'error': "Sec-WebSocket-Key ausente"}, False)
+            return
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode('latin-1')).digest()).decode('ascii')
+        writer.write(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            + f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode('latin-1')
+        )
+
+        client = _Client(writer, query.get('meters', '1') != '0', self.queue_size, self.state_queue_size)
+        client.reply(_json_frame({'type': 'hello', 'methods': sorted(self.methods), 'meter_keys': self._meter_keys}))
+        self._clients.add(client)
+        sender = asyncio.ensure_future(self._send_loop(client))
+        calls: Set[asyncio.Future] = set()
+        try:
+            message = b''
+            while True:
+                fin, opcode, payload = await read_frame(reader, self.max_body)
+                if opcode == OP_CLOSE:
+                    client.reply(encode_frame(OP_CLOSE, payload[:2]))
+                    break
+                if opcode == OP_PING:
+                    client.reply(encode_frame(OP_PONG, payload))
+                    continue
+                if opcode in (OP_TEXT, OP_BINARY, OP_CONTINUATION):
+                    message += payload
+                    if fin:
+                        call = asyncio.ensure_future(self._rpc(client, message))
+                        calls.add(call)
+                        call.add_done_callback(calls.discard)
+                        message = b''
+        finally:
+            self._clients.discard(client)
+            self.stats['frames_dropped'] += client.dropped
+            for call in calls:
+                call.cancel()
+            await asyncio.sleep(0)
+            sender.cancel()
+
+    async def _rpc(self, client: _Client, message: bytes) -> None:
+        self.stats['rpc_calls'] += 1
+        try:
+            request = json.loads(message)
+            request_id = request.get('id')
+            status, payload = await self._call(str(request.get('method', '')), request.get('args', request.get('kwargs')))
+        except (ValueError, AttributeError):
+            request_id, status, payload = None, 400, {'error': "Mensagem JSON-RPC inválida"}
+        client.reply(_json_frame(dict(payload, type='reply', id=request_id, status=status)))
+
+    async def _send_loop(self, client: _Client) -> None:
+        writer = client.writer
+        try:
+            while True:
+                await client.wake.wait()
+                client.wake.clear()
+                frames = client.take()
+                if not frames:
+                    continue
+                data = b''.join(frames)
+                writer.write(data)
+                try:
+                    await asyncio.wait_for(writer.drain(), self.slow_client_timeout)
+                except asyncio.TimeoutError:
+                    self.stats['slow_disconnects'] += 1
+                    Activity_Log.shared().warning('remote', f"Cliente remoto {client.peer} desconectado por lentidão")
+                    writer.transport.abort()
+                    return
+                client.sent += len(frames)
+                self.stats['frames_sent'] += len(frames)
+                self.stats['bytes_sent'] += len(data)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+
+class Fake_Remote_Api:
+    def __init__(self, apps: int = 20) -> None:
+        self.master = {'volume': 50, 'is_muted': False}
+        self.apps = {f"app{i}": {'name': f"app{i}", 'volume': 50, 'is_muted': False} for i in range(apps)}
+
+    def get_master_state(self) -> Dict[str, Any]:
+        return dict(self.master)
+
+    def set_master_volume(self, volume_level: float) -> int:
+        self.master['volume'] = int(max(0, min(100, volume_level)))
+        return self.master['volume']
+
+    def get_audio_apps(self) -> List[Dict[str, Any]]:
+        return [dict(app) for app in self.apps.values()]
+
+    def toggle_app_mute(self, app_name: str) -> Optional[bool]:
+        app = self.apps.get(app_name)
+        if app is None:
+            return None
+        app['is_muted'] = not app['is_muted']
+        return app['is_muted']
+
+
+async def _open_websocket(host: str, port: int, token: str, rcvbuf: Optional[int] = None) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if rcvbuf:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, (host, port))
+    reader, writer = await asyncio.open_connection(sock=sock, limit=1 << 20)
+    key = base64.b64encode(os.urandom(16)).decode('ascii')
+    writer.write(f"GET /ws?token={token} HTTP/1.1\r\nHost: {host}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode())
+    await reader.readuntil(b'\r\n\r\n')
+    return reader, writer
+
+
+def main():
+    print("=== Teste de carga do Servidor Remoto ===\n")
+
+    api = Fake_Remote_Api()
+    server = Remote_Server(api, port=0, queue_size=16, write_buffer=16 * 1024, slow_client_timeout=2.0)
+    server.start()
+    host, port = server.address
+
+    async def http_client(requests: int, latencies: List[float]) -> None:
+        reader, writer = await asyncio.open_connection(host, port)
+        body = b'[]'
+        request = (f"POST /api/get_master_state HTTP/1.1\r\nHost: {host}\r\nAuthorization: Bearer {server.token}\r\n"
+                   f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode()
+        for _ in range(requests):
+            start = time.perf_counter()
+            writer.write(request + body)
+            head = await reader.readuntil(b'\r\n\r\n')
+            length = int(head.lower().split(b'content-length:')[1].split(b'\r\n')[0])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+        writer.close()
+
+    async def http_load(clients: int, requests: int) -> Tuple[float, List[float]]:
+        latencies: List[float] = []
+        start = time.perf_counter()
+        await asyncio.gather(*(http_client(requests, latencies) for _ in range(clients)))
+        return time.perf_counter() - start, sorted(latencies)
+
+    async def probe(request: str) -> int:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(request.encode())
+        status = int((await reader.readuntil(b'\r\n')).split()[1])
+        writer.close()
+        return status
+
+    auth = f"Authorization: Bearer {server.token}\r\n"
+    probes = {
+        'GET mutável (toggle_app_mute)': f"GET /api/toggle_app_mute?app_name=app1 HTTP/1.1\r\nHost: {host}\r\n{auth}\r\n",
+        'POST sem JSON': f"POST /api/toggle_app_mute HTTP/1.1\r\nHost: {host}\r\n{auth}Content-Length: 0\r\n\r\n",
+        'sem token': f"GET /api/get_master_state HTTP/1.1\r\nHost: {host}\r\n\r\n",
+        'Host externo': f"GET /api/get_master_state HTTP/1.1\r\nHost: evil.example\r\n{auth}\r\n",
+    }
+    for label, request in probes.items():
+        print(f"Rejeitado: {label} -> HTTP {asyncio.run(probe(request))}")
+    print(f"   app1 continua sem mudo: {not api.apps['app1']['is_muted']}\n")
+
+    async def state_under_pressure(meter_frames: int, state_events: int) -> Dict[str, Any]:
+        server.broadcast([{'topic': 'meters', 'key': None, 'data': {'keys': ['master', 'app1'], 'levels': []}}])
+        await asyncio.sleep(0.05)
+        reader, writer = await _open_websocket(host, port, server.token, rcvbuf=4096)
+        _, _, payload = await read_frame(reader)
+        hello = json.loads(payload)
+        writer.transport.pause_reading()
+        levels = [[i, -20.0] for i in range(64)]
+        for i in range(meter_frames):
+            server.broadcast([{'topic': 'meters', 'key': None, 'data': {'levels': levels}}])
+            if i % (meter_frames // state_events) == 0:
+                server.broadcast([{'topic': 'app_changed', 'key': 'app1', 'data': {'volume': i}}])
+            await asyncio.sleep(0.001)
+        writer.transport.resume_reading()
+        counts = {'state': 0, 'meters': 0, 'resync': 0}
+        try:
+            while True:
+                _, _, payload = await asyncio.wait_for(read_frame(reader), 0.5)
+                message = json.loads(payload)
+                if message['type'] == 'resync':
+                    counts['resync'] += 1
+                elif message['type'] == 'events':
+                    counts['meters' if message['events'][0]['topic'] == 'meters' else 'state'] += 1
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+        return dict(counts, meter_keys=hello.get('meter_keys'))
+
+    result = asyncio.run(state_under_pressure(600, 30))
+    print(f"Cliente lento: hello com chaves {result['meter_keys']}, {result['state']}/30 eventos de estado entregues, "
+          f"{result['meters']}/600 frames de medidores, {result['resync']} resync\n")
+
+    elapsed, latencies = asyncio.run(http_load(50, 100))
+    print(f"HTTP: 50 clientes x 100 requisições em {elapsed:.2f} s ({len(latencies) / elapsed:,.0f} req/s), "
+          f"p50 {latencies[len(latencies) // 2] * 1000:.2f} ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+
+    async def fan_out(clients: int, slow: int, seconds: float, rate_hz: float) -> Dict[str, Any]:
+        fast = [await _open_websocket(host, port, server.token) for _ in range(clients)]
+        stalled = [await _open_websocket(host, port, server.token, rcvbuf=4096) for _ in range(slow)]
+        for _, writer in stalled:
+            writer.transport.pause_reading()
+        await asyncio.sleep(0.2)
+        latencies: List[float] = []
+        received = [0]
+        done = asyncio.Event()
+
+        async def consume(reader: asyncio.StreamReader) -> None:
+            try:
+                while not done.is_set():
+                    _, _, payload = await read_frame(reader)
+                    message = json.loads(payload)
+                    if message.get('type') == 'events':
+                        now = time.perf_counter()
+                        received[0] += 1
+                        latencies.extend(now - event['data']['sent_at'] for event in message['events'])
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+
+        consumers = [asyncio.ensure_future(consume(reader)) for reader, _ in fast]
+        levels = [[i, -20.0 - i % 40] for i in range(64)]
+        sent = [0]
+
+        def produce() -> None:
+            end = time.perf_counter() + seconds
+            while time.perf_counter() < end:
+                server.broadcast([{'topic': 'meters', 'key': None, 'data': {'levels': levels, 'sent_at': time.perf_counter()}}])
+                sent[0] += 1
+                time.sleep(1.0 / rate_hz)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while producer.is_alive():
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.3)
+        done.set()
+        for _, writer in fast + stalled:
+            writer.close()
+        for consumer in consumers:
+            consumer.cancel()
+        latencies.sort()
+        return {'latencies': latencies, 'received': received[0], 'broadcasts': sent[0]}
+
+    for clients, slow in ((50, 0), (200, 0), (200, 10)):
+        result = asyncio.run(fan_out(clients, slow, seconds=3.0, rate_hz=60))
+        time.sleep(0.3)
+        stats = server.get_stats()
+        latencies = result['latencies']
+        print(f"\nWebSocket: {clients} clientes + {slow} lentos, 60 lotes/s de medidores por 3 s")
+        print(f"   entregues: {result['received']} frames ({result['received'] / (clients * result['broadcasts']) * 100:.0f}% de {result['broadcasts']} lotes por cliente)")
+        if latencies:
+            print(f"   latência de fan-out p50 {latencies[len(latencies) // 2] * 1000:.2f} ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+        print(f"   descartados (backpressure): {stats['frames_dropped']}, desconectados por lentidão: {stats['slow_disconnects']}")
+
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from src.core.Activity_Log import Activity_Log
+from src.core.Metrics import Metrics_Registry
+from src.core.Process_Cache import Process_Info, Process_Metadata_Cache, normalize_app_name
+
+
+class Session_Entry:
+    def __init__(self, key: Hashable, session: Any, pid: int, process_name: str, info: Optional[Process_Info] = None) -> None:
+        self.key = key
+        self.session = session
+        self.pid = pid
+        self.process_name = process_name
+        self.info = info
+        self.app_name = info.app_name if info is not None else process_name.replace('.exe', '')
+        self.normalized_name = info.normalized_name if info is not None else normalize_app_name(process_name)
+        self._interface = None
+        self._exe_path: Optional[str] = None
+
+    @property
+    def interface(self) -> Any:
+        if self._interface is None:
+            self._interface = self.session.SimpleAudioVolume
+        return self._interface
+
+    @property
+    def exe_path(self) -> Optional[str]:
+        if self.info is not None:
+            return self.info.exe_path
+        if self._exe_path is None:
+            try:
+                self._exe_path = self.session.Process.exe() or ''
+            except Exception:
+                self._exe_path = ''
+        return self._exe_path or None
+
+    def __repr__(self) -> str:
+        return f"Session_Entry({self.process_name!r}, pid={self.pid})"
+
+
+class Pycaw_Session_Source:
+    def get_sessions(self) -> Iterable[Any]:
+        from pycaw.pycaw import AudioUtilities
+        with Metrics_Registry.shared().timer('com.GetAllSessions'):
+            return AudioUtilities.GetAllSessions()
+
+    def get_session_key(self, session: Any) -> Hashable:
+        try:
+            return (session.ProcessId, session.InstanceIdentifier)
+        except Exception:
+            return (session.ProcessId, id(session))
+
+
+class Session_Registry:
+    _shared: Optional['Session_Registry'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, source: Optional[Any] = None, max_age: float = 1.0, miss_refresh_interval: float = 0.25,
+                 processes: Optional[Process_Metadata_Cache] = None) -> None:
+        if source is None:
+            from src.core.Audio_Backend import Audio_Backend
+            source = Audio_Backend.shared()
+        self.source = source
+        self.processes = processes or Process_Metadata_Cache.shared()
+        self.max_age = max_age
+        self.miss_refresh_interval = miss_refresh_interval
+        self._lock = threading.RLock()
+        self._entries: Dict[Hashable, Session_Entry] = {}
+        self._by_process: Dict[str, List[Session_Entry]] = {}
+        self._by_app: Dict[str, List[Session_Entry]] = {}
+        self._by_pid: Dict[int, List[Session_Entry]] = {}
+        self._last_refresh = 0.0
+        self._stale = True
+        self.version = 0
+        self.listeners: List[Callable[[Session_Entry], None]] = []
+        self.stats = {
+            'enumerations': 0,
+            'lookups': 0,
+            'misses': 0,
+            'sessions_added': 0,
+            'sessions_removed': 0,
+        }
+
+    @classmethod
+    def shared(cls) -> 'Session_Registry':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def set_shared(cls, registry: Optional['Session_Registry']) -> None:
+        with cls._shared_lock:
+            cls._shared = registry
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._stale = True
+            self.version += 1
+
+    def refresh(self, force: bool = False) -> Tuple[List[Session_Entry], List[Session_Entry]]:
+        with self._lock:
+            now = time.monotonic()
+            if not force and not self._stale and now - self._last_refresh < self.max_age:
+                return [], []
+
+            sessions = self.source.get_sessions()
+            self.stats['enumerations'] += 1
+
+            entries: Dict[Hashable, Session_Entry] = {}
+            added = []
+            for session in sessions:
+                try:
+                    key = self.source.get_session_key(session)
+                    entry = self._entries.get(key)
+                    if entry is None:
+                        entry = self._create_entry(key, session)
+                        if entry is None:
+                            continue
+                        added.append(entry)
+                    entries[key] = entry
+                except Exception as e:
+                    Activity_Log.shared().error('sessions', f"Erro ao indexar sessão de áudio: {e}")
+
+            removed = [entry for key, entry in self._entries.items() if key not in entries]
+
+            self._entries = entries
+            self._rebuild_indexes()
+            self.processes.prune(self._by_pid)
+            self._last_refresh = now
+            self._stale = False
+            self.stats['sessions_added'] += len(added)
+            self.stats['sessions_removed'] += len(removed)
+            if added or removed:
+                self.version += 1
+        self._notify_added(added)
+        return added, removed
+
+    def notify_session_created(self, session: Any) -> Optional[Session_Entry]:
+        with self._lock:
+            try:
+                key = self.source.get_session_key(session)
+                if key in self._entries:
+                    return self._entries[key]
+                entry = self._create_entry(key, session)
+                if entry is None:
+                    return None
+                self._entries[key] = entry
+                self._index_entry(entry)
+                self.stats['sessions_added'] += 1
+                self.version += 1
+            except Exception as e:
+                Activity_Log.shared().error('sessions', f"Erro ao registrar nova sessão de áudio: {e}")
+                return None
+        self._notify_added([entry])
+        return entry
+
+    def notify_session_expired(self, key: Hashable) -> Optional[Session_Entry]:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._rebuild_indexes()
+                self.stats['sessions_removed'] += 1
+                self.version += 1
+            return entry
+
+    def get_sessions(self) -> List[Session_Entry]:
+        self.refresh()
+        with self._lock:
+            return list(self._entries.values())
+
+    def find(self, process_name: str) -> Optional[Session_Entry]:
+        return self._lookup(self._by_process, process_name)
+
+    def find_all(self, process_name: str) -> List[Session_Entry]:
+        self.find(process_name)
+        with self._lock:
+            return list(self._by_process.get(process_name, []))
+
+    def find_by_app(self, app_name: str) -> Optional[Session_Entry]:
+        return self._lookup(self._by_app, normalize_app_name(app_name))
+
+    def find_all_by_app(self, app_name: str) -> List[Session_Entry]:
+        self.find_by_app(app_name)
+        with self._lock:
+            return list(self._by_app.get(normalize_app_name(app_name), []))
+
+    def find_by_pid(self, pid: int) -> Optional[Session_Entry]:
+        return self._lookup(self._by_pid, pid)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats, sessions=len(self._entries))
+
+    def _lookup(self, index: Dict[Any, List[Session_Entry]], key: Any) -> Optional[Session_Entry]:
+        # refresh() notifica os listeners (que podem fazer I/O de COM), então nunca é chamado com o lock retido
+        self.refresh()
+        with self._lock:
+            self.stats['lookups'] += 1
+            entries = index.get(key)
+            if entries:
+                return entries[0]
+            self.stats['misses'] += 1
+            retry = time.monotonic() - self._last_refresh >= self.miss_refresh_interval
+        if not retry:
+            return None
+
+        self.refresh(force=True)
+        with self._lock:
+            entries = index.get(key)
+            return entries[0] if entries else None
+
+    def _notify_added(self, entries: List[Session_Entry]) -> None:
+        for listener in self.listeners:
+            for entry in entries:
+                try:
+                    listener(entry)
+                except Exception as e:
+                    Activity_Log.shared().error('sessions', f"Erro ao notificar nova sessão de '{entry.app_name}': {e}")
+
+    def _create_entry(self, key: Hashable, session: Any) -> Optional[Session_Entry]:
+        process = session.Process
+        if not process:
+            return None
+        info = self.processes.resolve(process.pid, process)
+        if info is None:
+            return None
+        return Session_Entry(key, session, info.pid, info.name, info)
+
+    def _rebuild_indexes(self) -> None:
+        self._by_process.clear()
+        self._by_app.clear()
+        self._by_pid.clear()
+        for entry in self._entries.values():
+            self._index_entry(entry)
+
+    def _index_entry(self, entry: Session_Entry) -> None:
+        self._by_process.setdefault(entry.process_name, []).append(entry)
+        self._by_app.setdefault(entry.normalized_name, []).append(entry)
+        self._by_pid.setdefault(entry.pid, []).append(entry)
+
+
+class Fake_Process:
+    def __init__(self, pid: int, name: str, create_time: Optional[float] = None, latency: float = 0.0) -> None:
+        self.pid = pid
+        self._name = name
+        self._create_time = create_time if create_time is not None else time.time()
+        self.latency = latency
+
+    def create_time(self) -> float:
+        return self._create_time
+
+    def name(self) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._name
+
+    def exe(self) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        return f"C:\\Program Files\\{self._name.replace('.exe', '')}\\{self._name}"
+
+
+class Fake_Simple_Audio_Volume:
+    def __init__(self, volume: float = 1.0, muted: bool = False, latency: float = 0.0) -> None:
+        self._volume = volume
+        self._muted = muted
+        self.latency = latency
+
+    def GetMasterVolume(self) -> float:
+        self._wait()
+        return self._volume
+
+    def SetMasterVolume(self, level: float, context: Any) -> None:
+        self._wait()
+        self._volume = level
+
+    def GetMute(self) -> bool:
+        self._wait()
+        return self._muted
+
+    def SetMute(self, muted: bool, context: Any) -> None:
+        self._wait()
+        self._muted = bool(muted)
+
+    def _wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+
+class Fake_Session:
+    def __init__(self, pid: int, name: str, instance_id: str) -> None:
+        self.ProcessId = pid
+        self.InstanceIdentifier = instance_id
+        self.Process = Fake_Process(pid, name)
+        self.SimpleAudioVolume = Fake_Simple_Audio_Volume()
+
+
+class Fake_Session_Source(Pycaw_Session_Source):
+    def __init__(self, count: int = 0, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.sessions: List[Fake_Session] = []
+        self._next_pid = 1000
+        for _ in range(count):
+            self.add_session()
+
+    def add_session(self, name: Optional[str] = None) -> Fake_Session:
+        pid = self._next_pid
+        self._next_pid += 1
+        session = Fake_Session(pid, name or f"app{pid}.exe", f"session-{pid}")
+        self.sessions.append(session)
+        return session
+
+    def remove_session(self, session: Fake_Session) -> None:
+        self.sessions.remove(session)
+
+    def get_sessions(self) -> Iterable[Any]:
+        if self.latency:
+            time.sleep(self.latency * len(self.sessions))
+        return list(self.sessions)
+
+
+def main():
+    print("=== Benchmark do Session Registry ===\n")
+
+    for count in (40, 200):
+        source = Fake_Session_Source(count, latency=0.00005)
+        names = [session.Process.name() for session in source.sessions]
+
+        start = time.perf_counter()
+        for name in names:
+            next(s for s in source.get_sessions() if s.Process.name() == name).SimpleAudioVolume.SetMute(True, None)
+        naive = time.perf_counter() - start
+
+        registry = Session_Registry(source)
+        start = time.perf_counter()
+        for name in names:
+            registry.find(name).interface.SetMute(True, None)
+        indexed = time.perf_counter() - start
+
+        print(f"{count} sessões: varredura linear {naive * 1000:.2f} ms, registro {indexed * 1000:.2f} ms")
+        print(f"   {registry.get_stats()}")
+
+    source = Fake_Session_Source(200)
+    for session in source.sessions:
+        session.Process.latency = 0.0002
+
+    for label, idle_ttl in (("sem cache de processos", 0.0), ("com cache de processos", 30.0)):
+        processes = Process_Metadata_Cache(idle_ttl=idle_ttl)
+        registry = Session_Registry(source, max_age=0.0, processes=processes)
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            for entry in registry.get_sessions():
+                entry.exe_path
+            timings.append(time.perf_counter() - start)
+            for session in source.sessions:
+                session.InstanceIdentifier += '-novo'
+
+        print(f"\n200 sessões, {label}:")
+        print(f"   refresh + caminhos de exe: frio {timings[0] * 1000:.2f} ms, com sessões recriadas {timings[1] * 1000:.2f} ms")
+        print(f"   {processes.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import hashlib
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+from src.core.Audio_Backend import Audio_Backend
+from src.core.Endpoint_Inventory import Endpoint_Info, Fake_Endpoint_Volume
+from src.core.Meter_Engine import Fake_Audio_Meter
+from src.core.Session_Registry import Fake_Session, Fake_Simple_Audio_Volume
+from src.core.Spectrum_Analyzer import Tone_Block_Source
+
+SIMULATED_APP_NAMES = [
+    'Spotify', 'Discord', 'chrome', 'firefox', 'msedge', 'obs64', 'steam', 'vlc',
+    'Teams', 'Zoom', 'slack', 'foobar2000', 'EpicGamesLauncher', 'RiotClientServices',
+    'VALORANT', 'cs2', 'GTA5', 'minecraft', 'audacity', 'reaper'
+]
+
+
+class Simulated_Backend(Audio_Backend):
+    name = 'simulated'
+    supports_notifications = False
+
+    def __init__(self, sessions: int = 20, outputs: int = 4, inputs: int = 2, virtual_cables: int = 1, churn_rate: float = 0.0, latency: float = 0.0, seed: Optional[int] = 0) -> None:
+        self.latency = latency
+        self.churn_rate = churn_rate
+        self.calls: Counter = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._sessions: List[Fake_Session] = []
+        self._next_pid = 1000
+        self._target_sessions = sessions
+        self._last_churn = time.monotonic()
+        self._churn_debt = 0.0
+        self.app_endpoints: Dict[Tuple[int, str], str] = {}
+
+        for _ in range(sessions):
+            self._add_session()
+
+        self._endpoints: List[Dict[str, Any]] = []
+        for i in range(outputs):
+            name = f"CABLE Input {i} (VB-Audio Virtual Cable)" if i < virtual_cables else f"Alto-falantes {i} (Simulado)"
+            self._add_endpoint(f"{{0.0.0.00000000}}.{{sim-out-{i}}}", name, 'output')
+        for i in range(inputs):
+            name = f"CABLE Output {i} (VB-Audio Virtual Cable)" if i < virtual_cables else f"Microfone {i} (Simulado)"
+            self._add_endpoint(f"{{0.0.1.00000000}}.{{sim-in-{i}}}", name, 'input')
+
+        for flow in ('output', 'input'):
+            physical = [e for e in self._endpoints if e['flow'] == flow and 'CABLE' not in e['name']]
+            candidates = physical or [e for e in self._endpoints if e['flow'] == flow]
+            if candidates:
+                candidates[0]['is_default'] = True
+
+    def get_sessions(self) -> Iterable[Any]:
+        self._call('get_sessions')
+        with self._lock:
+            self._apply_churn()
+            return list(self._sessions)
+
+    def get_session_key(self, session: Any) -> Hashable:
+        return (session.ProcessId, session.InstanceIdentifier)
+
+    def get_endpoints(self) -> List[Endpoint_Info]:
+        self._call('get_endpoints')
+        with self._lock:
+            return [
+                Endpoint_Info(e['id'], e['name'], e['flow'], e['is_default'], None, e['volume'])
+                for e in self._endpoints
+            ]
+
+    def get_master_volume(self) -> Any:
+        self._call('get_master_volume')
+        with self._lock:
+            default = next((e for e in self._endpoints if e['flow'] == 'output' and e['is_default']), None)
+            return default['volume'] if default else Fake_Endpoint_Volume(latency=self.latency)
+
+    def get_session_meter(self, session: Any) -> Any:
+        self._call('get_session_meter')
+        return Fake_Audio_Meter(seed=session.ProcessId, latency=self.latency)
+
+    def get_endpoint_meter(self, endpoint: Endpoint_Info) -> Any:
+        self._call('get_endpoint_meter')
+        return Fake_Audio_Meter(seed=endpoint.id, latency=self.latency)
+
+    def open_capture(self, flow: str, sample_rate: int = 48000, block_size: int = 1024) -> Any:
+        self._call('open_capture')
+        frequencies = (110.0, 440.0, 2500.0) if flow == 'output' else (180.0, 900.0)
+        return Tone_Block_Source(frequencies, sample_rate, block_size, noise=0.02, realtime=True)
+
+    def render(self, exe_path: str) -> Optional[bytes]:
+        self._call('render')
+        return b'\x89PNG\r\n\x1a\n' + hashlib.sha1(exe_path.encode('utf-8')).digest()
+
+    def set_default_device(self, device_id: str, flow: str) -> bool:
+        self._call('set_default_device')
+        with self._lock:
+            if not any(e['id'] == device_id and e['flow'] == flow for e in self._endpoints):
+                raise ValueError(f"Dispositivo simulado {device_id} não existe")
+            for endpoint in self._endpoints:
+                if endpoint['flow'] == flow:
+                    endpoint['is_default'] = endpoint['id'] == device_id
+        return True
+
+    def set_app_endpoint(self, pid: int, device_id: Optional[str], flow: str) -> bool:
+        self._call('set_app_endpoint')
+        with self._lock:
+            if device_id is None:
+                self.app_endpoints.pop((pid, flow), None)
+                return True
+            if not any(e['id'] == device_id and e['flow'] == flow for e in self._endpoints):
+                raise ValueError(f"Dispositivo simulado {device_id} não existe")
+            self.app_endpoints[(pid, flow)] = device_id
+        return True
+
+    def get_app_endpoint(self, pid: int, flow: str) -> Optional[str]:
+        self._call('get_app_endpoint')
+        with self._lock:
+            return self.app_endpoints.get((pid, flow))
+
+    def add_session(self, name: Optional[str] = None) -> Fake_Session:
+        with self._lock:
+            return self._add_session(name)
+
+    def remove_session(self, session: Fake_Session) -> None:
+        with self._lock:
+            if session in self._sessions:
+                self._sessions.remove(session)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'endpoints': len(self._endpoints),
+                'calls': dict(self.calls)
+            }
+
+    def _call(self, name: str) -> None:
+        self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _add_session(self, name: Optional[str] = None) -> Fake_Session:
+        pid = self._next_pid
+        self._next_pid += 1
+        if name is None:
+            base = SIMULATED_APP_NAMES[pid % len(SIMULATED_APP_NAMES)]
+            suffix = '' if pid - 1000 < len(SIMULATED_APP_NAMES) else str(pid)
+            name = f"{base}{suffix}.exe"
+        session = Fake_Session(pid, name, f"sim-session-{pid}")
+        session.SimpleAudioVolume = Fake_Simple_Audio_Volume(
+            volume=self._random.uniform(0.2, 1.0), latency=self.latency
+        )
+        self._sessions.append(session)
+        return session
+
+    def _add_endpoint(self, device_id: str, name: str, flow: str) -> None:
+        self._endpoints.append({
+            'id': device_id,
+            'name': name,
+            'flow': flow,
+            'is_default': False,
+            'volume': Fake_Endpoint_Volume(volume=self._random.uniform(0.3, 1.0), latency=self.latency)
+        })
+
+    def _apply_churn(self) -> None:
+        if not self.churn_rate:
+            return
+
+        now = time.monotonic()
+        self._churn_debt += (now - self._last_churn) * self.churn_rate
+        self._last_churn = now
+
+        while self._churn_debt >= 1.0:
+            self._churn_debt -= 1.0
+            if self._sessions and (len(self._sessions) >= self._target_sessions or self._random.random() < 0.5):
+                self._sessions.pop(self._random.randrange(len(self._sessions)))
+            else:
+                self._add_session()
+
+
+def main():
+    print("=== Teste do Backend Simulado ===\n")
+
+    from src.core.Endpoint_Inventory import Endpoint_Inventory
+    from src.core.Session_Registry import Session_Registry
+
+    backend = Simulated_Backend(sessions=500, outputs=50, inputs=10, virtual_cables=4, churn_rate=200.0, seed=1)
+    registry = Session_Registry(backend, max_age=0.0)
+    inventory = Endpoint_Inventory(backend)
+
+    start = time.perf_counter()
+    for _ in range(50):
+        registry.refresh(force=True)
+    refresh_time = (time.perf_counter() - start) / 50
+
+    start = time.perf_counter()
+    for endpoint in inventory.get_endpoints():
+        endpoint.to_dict()
+    inventory_time = time.perf_counter() - start
+
+    print(f"Refresh com {len(registry.get_sessions())} sessões e churn: {refresh_time * 1000:.2f} ms")
+    print(f"Listagem de {len(inventory.get_endpoints())} dispositivos: {inventory_time * 1000:.2f} ms")
+    print(f"Estatísticas: {backend.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
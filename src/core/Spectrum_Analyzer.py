@@ -0,0 +1,363 @@
+import itertools
+import math
+import sys
+import threading
+import time
+import wave
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+import numpy as np
+from src.core.Activity_Log import Activity_Log
+from src.core.Com_Worker import init_com_thread
+
+Spectrum_Frame = Dict[str, Any]
+
+SPECTRUM_CHANNEL_FLOWS = {'main_output': 'output', 'main_input': 'input'}
+
+
+class Tone_Block_Source:
+    def __init__(self, frequencies: Sequence[float] = (440.0,), sample_rate: int = 48000, block_size: int = 1024, blocks: Optional[int] = None, noise: float = 0.0, seed: Optional[int] = 0, realtime: bool = False) -> None:
+        self.frequencies = list(frequencies)
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.blocks = blocks
+        self.noise = noise
+        self.realtime = realtime
+        self._random = np.random.default_rng(seed)
+        self._steps = np.array([2 * math.pi * f / sample_rate for f in self.frequencies], dtype=np.float64)
+        self._ramp = np.arange(block_size, dtype=np.float64)
+        self._phase = np.zeros(len(self.frequencies), dtype=np.float64)
+        self._block = np.zeros(block_size, dtype=np.float32)
+        self._closed = False
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        produced = itertools.count()
+        interval = self.block_size / self.sample_rate
+        deadline = time.monotonic()
+        while not self._closed and (self.blocks is None or next(produced) < self.blocks):
+            if self.realtime:
+                deadline += interval
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+            yield self.read()
+
+    def read(self) -> np.ndarray:
+        block = self._block
+        block.fill(0.0)
+        for i, step in enumerate(self._steps):
+            block += np.sin(self._phase[i] + step * self._ramp).astype(np.float32)
+            self._phase[i] = (self._phase[i] + step * self.block_size) % (2 * math.pi)
+        if self.frequencies:
+            block /= len(self.frequencies)
+        if self.noise:
+            block += self._random.normal(0.0, self.noise, self.block_size).astype(np.float32)
+        return block
+
+    def close(self) -> None:
+        self._closed = True
+
+
+class Wav_Block_Source:
+    def __init__(self, path: str, block_size: int = 1024, loop: bool = False) -> None:
+        self.path = path
+        self.block_size = block_size
+        self.loop = loop
+        self._closed = False
+        with wave.open(path, 'rb') as wav:
+            self.sample_rate = wav.getframerate()
+            channels = wav.getnchannels()
+            width = wav.getsampwidth()
+            frames = wav.readframes(wav.getnframes())
+
+        dtypes = {1: np.uint8, 2: np.int16, 4: np.int32}
+        if width not in dtypes:
+            raise ValueError(f"Formato WAV não suportado: {width * 8} bits")
+        samples = np.frombuffer(frames, dtype=dtypes[width]).astype(np.float32)
+        if width == 1:
+            samples = (samples - 128.0) / 128.0
+        else:
+            samples /= float(2 ** (width * 8 - 1))
+        self.samples = samples.reshape(-1, channels).mean(axis=1).astype(np.float32)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        while not self._closed:
+            for start in range(0, len(self.samples) - self.block_size + 1, self.block_size):
+                if self._closed:
+                    return
+                yield self.samples[start:start + self.block_size]
+            if not self.loop:
+                return
+
+    def close(self) -> None:
+        self._closed = True
+
+
+class Soundcard_Block_Source:
+    def __init__(self, flow: str, sample_rate: int = 48000, block_size: int = 1024) -> None:
+        self.flow = flow
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self._closed = False
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        import soundcard
+
+        if self.flow == 'output':
+            speaker = soundcard.default_speaker()
+            microphone = soundcard.get_microphone(speaker.id, include_loopback=True)
+        else:
+            microphone = soundcard.default_microphone()
+
+        with microphone.recorder(samplerate=self.sample_rate, blocksize=self.block_size) as recorder:
+            while not self._closed:
+                data = recorder.record(numframes=self.block_size)
+                yield data.mean(axis=1).astype(np.float32) if data.ndim > 1 else data.astype(np.float32)
+
+    def close(self) -> None:
+        self._closed = True
+
+
+class Spectrum_Analyzer:
+    def __init__(self, sample_rate: int = 48000, fft_size: int = 2048, bands: int = 32, f_min: float = 20.0, f_max: float = 20000.0, smoothing: float = 0.6, floor_db: float = -90.0) -> None:
+        self.sample_rate = sample_rate
+        self.fft_size = fft_size
+        self.bands = bands
+        self.smoothing = smoothing
+        self.floor_db = floor_db
+
+        self._window = np.hanning(fft_size).astype(np.float32)
+        self._scale = 2.0 / float(self._window.sum())
+        self._samples = np.zeros(fft_size, dtype=np.float32)
+        self._windowed = np.zeros(fft_size, dtype=np.float32)
+        self._power = np.zeros(fft_size // 2 + 1, dtype=np.float32)
+        self._band_power = np.zeros(bands, dtype=np.float32)
+        self._band_db = np.zeros(bands, dtype=np.float32)
+        self.levels = np.zeros(bands, dtype=np.float32)
+
+        bin_hz = sample_rate / fft_size
+        f_max = min(f_max, sample_rate / 2)
+        edges = np.geomspace(f_min, f_max, bands + 1)
+        starts = np.clip(np.floor(edges[:-1] / bin_hz).astype(np.intp), 1, len(self._power) - 1)
+        for i in range(1, bands):
+            starts[i] = max(starts[i], starts[i - 1] + 1)
+        starts = np.minimum(starts, len(self._power) - 1)
+        ends = np.append(starts[1:], min(int(math.ceil(f_max / bin_hz)) + 1, len(self._power)))
+        self._band_starts = starts
+        self._band_end = int(ends[-1])
+        self._band_widths = np.maximum(ends - starts, 1).astype(np.float32)
+        self.frequencies = edges
+
+    def reset(self) -> None:
+        self._samples.fill(0.0)
+        self.levels.fill(0.0)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        block = np.asarray(block, dtype=np.float32)
+        size = len(block)
+        if size >= self.fft_size:
+            self._samples[:] = block[-self.fft_size:]
+        else:
+            self._samples[:-size] = self._samples[size:]
+            self._samples[-size:] = block
+
+        np.multiply(self._samples, self._window, out=self._windowed)
+        spectrum = np.fft.rfft(self._windowed)
+        np.square(np.abs(spectrum), out=self._power, casting='unsafe')
+        self._power *= self._scale * self._scale
+
+        np.add.reduceat(self._power[:self._band_end], self._band_starts, out=self._band_power)
+        self._band_power /= self._band_widths
+        np.maximum(self._band_power, 1e-12, out=self._band_power)
+        np.log10(self._band_power, out=self._band_db)
+        self._band_db *= 10.0
+        self._band_db -= self.floor_db
+        self._band_db /= -self.floor_db
+        np.clip(self._band_db, 0.0, 1.0, out=self._band_db)
+
+        self.levels *= self.smoothing
+        self.levels += (1.0 - self.smoothing) * self._band_db
+        return self.levels
+
+
+class Spectrum_Pipeline:
+    def __init__(self, channel_id: str, source: Any, analyzer: Optional[Spectrum_Analyzer] = None, publish: Optional[Callable[[str, Spectrum_Frame], None]] = None, max_fps: float = 30.0) -> None:
+        self.channel_id = channel_id
+        self.source = source
+        self.analyzer = analyzer or Spectrum_Analyzer(getattr(source, 'sample_rate', 48000))
+        self.publish = publish
+        self.max_fps = max_fps
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._seq = itertools.count(1)
+        self._last_publish = 0.0
+        self.stats = {
+            'blocks': 0,
+            'frames': 0,
+            'errors': 0,
+        }
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=f"Spectrum-{self.channel_id}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        self.source.close()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def feed(self, block: np.ndarray, now: Optional[float] = None) -> Optional[Spectrum_Frame]:
+        levels = self.analyzer.process(block)
+        self.stats['blocks'] += 1
+
+        now = time.monotonic() if now is None else now
+        if now - self._last_publish < 1.0 / self.max_fps:
+            return None
+        self._last_publish = now
+
+        frame = {
+            'seq': next(self._seq),
+            'bands': np.rint(levels * 100).astype(np.uint8).tolist(),
+        }
+        self.stats['frames'] += 1
+        if self.publish:
+            self.publish(self.channel_id, frame)
+        return frame
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats, running=self._running)
+
+    def _run(self) -> None:
+        init_com_thread()
+        try:
+            for block in self.source:
+                if not self._running:
+                    break
+                self.feed(block)
+        except Exception as e:
+            self.stats['errors'] += 1
+            Activity_Log.shared().error('spectrum', f"Erro na captura do espectro de '{self.channel_id}': {e}")
+        finally:
+            self._running = False
+
+
+class Spectrum_Service:
+    def __init__(self, publish: Optional[Callable[[str, Spectrum_Frame], None]] = None, backend: Optional[Any] = None, max_fps: float = 30.0, bands: int = 32) -> None:
+        self.publish = publish
+        self.backend = backend
+        self.max_fps = max_fps
+        self.bands = bands
+        self._lock = threading.Lock()
+        self.pipelines: Dict[str, Spectrum_Pipeline] = {}
+
+    def start(self, channel_id: str) -> bool:
+        flow = SPECTRUM_CHANNEL_FLOWS.get(channel_id)
+        if flow is None:
+            Activity_Log.shared().warning('spectrum', f"Canal '{channel_id}' não suporta análise de espectro")
+            return False
+
+        with self._lock:
+            pipeline = self.pipelines.get(channel_id)
+            if pipeline and pipeline._running:
+                return True
+
+            from src.core.Audio_Backend import Audio_Backend
+            backend = self.backend or Audio_Backend.shared()
+            try:
+                source = backend.open_capture(flow)
+            except Exception as e:
+                Activity_Log.shared().error('spectrum', f"Erro ao abrir captura para '{channel_id}': {e}")
+                return False
+
+            analyzer = Spectrum_Analyzer(source.sample_rate, bands=self.bands)
+            pipeline = Spectrum_Pipeline(channel_id, source, analyzer, self.publish, self.max_fps)
+            self.pipelines[channel_id] = pipeline
+            pipeline.start()
+            return True
+
+    def stop(self, channel_id: Optional[str] = None) -> None:
+        with self._lock:
+            channel_ids = [channel_id] if channel_id else list(self.pipelines)
+            pipelines = [self.pipelines.pop(cid) for cid in channel_ids if cid in self.pipelines]
+        for pipeline in pipelines:
+            pipeline.stop()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {channel_id: pipeline.get_stats() for channel_id, pipeline in self.pipelines.items()}
+
+
+class Event_Bus_Spectrum_Sink:
+    def __init__(self, event_bus: Any, topic: str = 'spectrum') -> None:
+        self.event_bus = event_bus
+        self.topic = topic
+
+    def __call__(self, channel_id: str, frame: Spectrum_Frame) -> None:
+        self.event_bus.publish(self.topic, channel_id, frame)
+
+
+def write_tone_wav(path: str, frequencies: Sequence[float], seconds: float = 2.0, sample_rate: int = 48000) -> None:
+    source = Tone_Block_Source(frequencies, sample_rate, block_size=int(sample_rate * seconds), blocks=1)
+    samples = np.clip(source.read() * 32767, -32768, 32767).astype('<i2')
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.tobytes())
+
+
+def main():
+    print("=== Benchmark do Analisador de Espectro ===\n")
+
+    import os
+    import tempfile
+
+    for block_size, fft_size in ((256, 1024), (1024, 2048), (2048, 4096)):
+        source = Tone_Block_Source((110.0, 1000.0, 8000.0), block_size=block_size, blocks=2000, noise=0.01)
+        pipeline = Spectrum_Pipeline('main_output', source, Spectrum_Analyzer(fft_size=fft_size))
+
+        start = time.perf_counter()
+        for i, block in enumerate(source):
+            pipeline.feed(block, now=i * block_size / source.sample_rate)
+        elapsed = time.perf_counter() - start
+
+        stats = pipeline.get_stats()
+        realtime = stats['blocks'] * block_size / source.sample_rate / elapsed
+        print(f"bloco {block_size:>4} / FFT {fft_size:>4}: {stats['blocks'] / elapsed:9.0f} blocos/s "
+              f"({realtime:.0f}x tempo real), {stats['frames']} frames publicados")
+
+    analyzer = Spectrum_Analyzer(bands=16)
+    peaks = []
+    for frequency in (100.0, 1000.0, 10000.0):
+        analyzer.reset()
+        tone = Tone_Block_Source((frequency,), block_size=2048, blocks=8)
+        for block in tone:
+            levels = analyzer.process(block)
+        band = int(np.argmax(levels))
+        peaks.append(f"{frequency:.0f} Hz -> banda {band} ({analyzer.frequencies[band]:.0f}-{analyzer.frequencies[band + 1]:.0f} Hz)")
+    print("\n" + "\n".join(peaks))
+
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    temporary = path is None
+    if temporary:
+        fd, path = tempfile.mkstemp(suffix='.wav')
+        os.close(fd)
+        write_tone_wav(path, (220.0, 3000.0), seconds=10.0)
+    try:
+        source = Wav_Block_Source(path, block_size=1024)
+        analyzer = Spectrum_Analyzer(source.sample_rate)
+        start = time.perf_counter()
+        blocks = sum(1 for block in source if analyzer.process(block) is not None)
+        elapsed = time.perf_counter() - start
+        print(f"\nWAV {os.path.basename(path)}: {blocks} blocos em {elapsed * 1000:.1f} ms ({blocks / elapsed:.0f} blocos/s)")
+    finally:
+        if temporary:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
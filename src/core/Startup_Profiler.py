@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+STARTUP_BUDGETS_MS = {
+    'imports': 250.0,
+    'api': 50.0,
+    'window': 300.0,
+    'com_init': 20.0,
+    'master_volume': 100.0,
+    'channels': 50.0,
+    'services': 150.0,
+    'first_enumeration': 500.0,
+    'first_paint': 1500.0,
+    'first_data': 2500.0,
+}
+
+
+class _Phase:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'Startup_Profiler', name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> '_Phase':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.profiler.record(self.name, self.start, time.perf_counter())
+
+
+class Startup_Profiler:
+    def __init__(self, origin: Optional[float] = None, budgets: Optional[Dict[str, float]] = None) -> None:
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.budgets = dict(STARTUP_BUDGETS_MS if budgets is None else budgets)
+        self._lock = threading.Lock()
+        self._phases: List[Dict[str, Any]] = []
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def record(self, name: str, start: float, end: float) -> None:
+        with self._lock:
+            self._phases.append({
+                'name': name,
+                'start_ms': round((start - self.origin) * 1000, 2),
+                'duration_ms': round((end - start) * 1000, 2),
+                'thread': threading.current_thread().name
+            })
+
+    def mark(self, name: str) -> float:
+        now = time.perf_counter()
+        self.record(name, self.origin, now)
+        return (now - self.origin) * 1000
+
+    def get_report(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = sorted(self._phases, key=lambda phase: phase['start_ms'] + phase['duration_ms'])
+        over_budget = [
+            phase['name'] for phase in phases
+            if phase['name'] in self.budgets and phase['duration_ms'] > self.budgets[phase['name']]
+        ]
+        total = max((phase['start_ms'] + phase['duration_ms'] for phase in phases), default=0.0)
+        return {'phases': phases, 'total_ms': round(total, 2), 'over_budget': over_budget}
+
+    def format_report(self) -> str:
+        report = self.get_report()
+        lines = [f"Inicialização: {report['total_ms']:.1f} ms"]
+        for phase in report['phases']:
+            budget = self.budgets.get(phase['name'])
+            flag = ' (acima do orçamento)' if phase['name'] in report['over_budget'] else ''
+            budget_text = f" / {budget:.0f}" if budget is not None else ''
+            lines.append(f"   {phase['name']:<20} +{phase['start_ms']:8.1f} ms  {phase['duration_ms']:8.1f}{budget_text} ms  [{phase['thread']}]{flag}")
+        return '\n'.join(lines)
@@ -1,150 +1,30 @@
-from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-from comtypes import CLSCTX_ALL
-import subprocess
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
+from src.core.Activity_Log import Activity_Log
+from src.core.Endpoint_Inventory import Endpoint_Inventory, is_virtual_cable_name
 
 class Virtual_Cable_Service:
     @staticmethod
-    def get_virtual_cables() -> List[Dict[str, Any]]:
+    def get_virtual_cables() -> Dict[str, List[Dict[str, Any]]]:
         try:
-            output_devices = []
-            input_devices = []
-
-            devices_enum = AudioUtilities.GetDeviceEnumerator()
-
-            output_endpoints = devices_enum.EnumAudioEndpoints(0, 1)
-            for i in range(output_endpoints.GetCount()):
-                device = output_endpoints.Item(i)
-                if device:
-                    device_id = device.GetId()
-                    created_device = AudioUtilities.CreateDevice(device)
-
-                    if created_device and hasattr(created_device, 'FriendlyName'):
-                        friendly_name = created_device.FriendlyName
-
-                        if Virtual_Cable_Service._is_virtual_cable(friendly_name):
-                            output_devices.append({
-                                'id': device_id,
-                                'name': friendly_name,
-                                'type': 'output',
-                                'is_virtual': True
-                            })
-
-            input_endpoints = devices_enum.EnumAudioEndpoints(1, 1)
-            for i in range(input_endpoints.GetCount()):
-                device = input_endpoints.Item(i)
-                if device:
-                    device_id = device.GetId()
-                    created_device = AudioUtilities.CreateDevice(device)
-
-                    if created_device and hasattr(created_device, 'FriendlyName'):
-                        friendly_name = created_device.FriendlyName
-
-                        if Virtual_Cable_Service._is_virtual_cable(friendly_name):
-                            input_devices.append({
-                                'id': device_id,
-                                'name': friendly_name,
-                                'type': 'input',
-                                'is_virtual': True
-                            })
-
-            return {
-                'output': output_devices,
-                'input': input_devices
-            }
+            cables = {'output': [], 'input': []}
+
+            for endpoint in Endpoint_Inventory.shared().get_endpoints():
+                if endpoint.is_virtual:
+                    cables[endpoint.flow].append({
+                        'id': endpoint.id,
+                        'name': endpoint.name,
+                        'type': endpoint.flow,
+                        'is_virtual': True
+                    })
+
+            return cables
         except Exception as e:
-            print(f"Erro ao obter cabos virtuais: {e}")
+            Activity_Log.shared().error('devices', f"Erro ao obter cabos virtuais: {e}")
             return {'output': [], 'input': []}
 
     @staticmethod
     def _is_virtual_cable(device_name: str) -> bool:
-        virtual_keywords = [
-            'CABLE',
-            'VB-Audio',
-            'Virtual',
-            'Voicemeeter',
-            'VAC',
-            'Virtual Audio Cable'
-        ]
-        return any(keyword.lower() in device_name.lower() for keyword in virtual_keywords)
-
-    @staticmethod
-    def route_app_to_device(app_name: str, device_id: str) -> bool:
-        try:
-            script = f'''
-            Add-Type -TypeDefinition @"
-            using System;
-            using System.Runtime.InteropServices;
-
-            public class AudioRouter {{
-                [DllImport("ole32.dll")]
-                public static extern int CoInitialize(IntPtr pvReserved);
-
-                [DllImport("ole32.dll")]
-                public static extern void CoUninitialize();
-            }}
-"@
-
-            [AudioRouter]::CoInitialize([IntPtr]::Zero)
-
-            $appName = "{app_name}"
-            $deviceId = "{device_id}"
-
-            Write-Host "Tentando rotear $appName para dispositivo $deviceId"
-
-            [AudioRouter]::CoUninitialize()
-            '''
-
-            result = subprocess.run(
-                ['powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', script],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0:
-                print(f"App '{app_name}' roteado para dispositivo '{device_id}'")
-                return True
-            else:
-                print(f"Erro ao rotear app: {result.stderr}")
-                return False
-
-        except subprocess.TimeoutExpired:
-            print(f"Timeout ao rotear app '{app_name}'")
-            return False
-        except Exception as e:
-            print(f"Erro ao rotear app '{app_name}' para dispositivo '{device_id}': {e}")
-            return False
-
-    @staticmethod
-    def get_app_routing(app_name: str) -> Optional[Dict[str, Any]]:
-        try:
-            sessions = AudioUtilities.GetAllSessions()
-
-            for session in sessions:
-                if session.Process and session.Process.name():
-                    process_name = session.Process.name()
-
-                    if process_name.lower().replace('.exe', '') == app_name.lower().replace('.exe', ''):
-                        return {
-                            'app_name': process_name,
-                            'device_id': 'default',
-                            'device_name': 'Dispositivo Padrão'
-                        }
-
-            return None
-        except Exception as e:
-            print(f"Erro ao obter roteamento do app '{app_name}': {e}")
-            return None
-
-    @staticmethod
-    def reset_app_routing(app_name: str) -> bool:
-        try:
-            print(f"Resetando roteamento do app '{app_name}' para dispositivo padrão")
-            return True
-        except Exception as e:
-            print(f"Erro ao resetar roteamento do app '{app_name}': {e}")
-            return False
+        return is_virtual_cable_name(device_name)
 
 def main():
     print("=== Testando Virtual Cable Service ===\n")
@@ -1,25 +1,23 @@
-from ctypes import cast, POINTER
-from comtypes import CLSCTX_ALL
-from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 from typing import Optional, Dict, Any
+from src.core.Activity_Log import Activity_Log
+from src.core.Audio_Backend import Audio_Backend
+from src.core.Session_Registry import Session_Registry
 
 class Apps_Volume_Controller:
-    def __init__(self, process_name: str) -> None:
+    def __init__(self, process_name: str, registry: Optional[Session_Registry] = None) -> None:
         self.process_name = process_name
+        self.registry = registry or Session_Registry.shared()
         self.session = self._get_session()
         if self.session:
-            self.volume = self.session.SimpleAudioVolume.GetMasterVolume()
-            self.interface = self.session.SimpleAudioVolume
+            self.interface = self.entry.interface
+            self.volume = self.interface.GetMasterVolume()
         else:
             self.volume = None
-            print(f"Processo '{self.process_name}' não encontrado.")
+            Activity_Log.shared().warning('apps', f"Processo '{self.process_name}' não encontrado.")
 
     def _get_session(self) -> Optional[Any]:
-        sessions = AudioUtilities.GetAllSessions()
-        for session in sessions:
-            if session.Process and session.Process.name() == self.process_name:
-                return session
-        return None
+        self.entry = self.registry.find(self.process_name)
+        return self.entry.session if self.entry else None
 
     def toggle_mute(self) -> Optional[bool]:
         if self.session:
@@ -27,41 +25,39 @@ class Apps_Volume_Controller:
 
             is_muted = self.interface.GetMute()
             status = "mutado" if is_muted else "desmutado"
-            print(f"'{self.process_name}' foi {status}.")
+            Activity_Log.shared().info('apps', f"'{self.process_name}' foi {status}.")
             return is_muted
         else:
-            print(f"Não foi possível alternar o mudo. Processo '{self.process_name}' não encontrado.")
+            Activity_Log.shared().warning('apps', f"Não foi possível alternar o mudo. Processo '{self.process_name}' não encontrado.")
             return None
 
     def set_mute(self, mute_state: bool) -> None:
         if self.session:
             self.interface.SetMute(mute_state, None)
         else:
-            print(f"Não foi possível definir mute. Processo '{self.process_name}' não encontrado.")
+            Activity_Log.shared().warning('apps', f"Não foi possível definir mute. Processo '{self.process_name}' não encontrado.")
 
     def set_volume(self, level: float) -> None:
         if not (0 <= level <= 100):
-            print(f"Volume deve estar entre 0 e 100, recebido: {level}")
+            Activity_Log.shared().warning('apps', f"Volume deve estar entre 0 e 100, recebido: {level}")
 
         if not self.session:
-            print(f"Sessão de áudio não encontrada para processo '{self.process_name}'")
+            Activity_Log.shared().warning('apps', f"Sessão de áudio não encontrada para processo '{self.process_name}'")
 
         try:
             volume = max(0.0, min(1.0, level / 100.0))
             self.interface.SetMasterVolume(volume, None)
-            self.volume = self.session.SimpleAudioVolume.GetMasterVolume()
+            self.volume = self.interface.GetMasterVolume()
             volume = int(self.volume * 100)
-            print(f"Volume de '{self.process_name}' definido para {volume}%.")
+            Activity_Log.shared().info('apps', f"Volume de '{self.process_name}' definido para {volume}%.")
         except Exception as e:
-            print(f"Erro ao definir volume: {e}")
+            Activity_Log.shared().error('apps', f"Erro ao definir volume: {e}")
             raise
 
 
 class Master_Volume_Controller:
-    def __init__(self) -> None:
-        devices = AudioUtilities.GetSpeakers()
-        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        self.controller = cast(interface, POINTER(IAudioEndpointVolume))
+    def __init__(self, backend: Optional[Audio_Backend] = None) -> None:
+        self.controller = (backend or Audio_Backend.shared()).get_master_volume()
         self.volume = self._get_volume()
 
     def get_state(self) -> Dict[str, Any]:
@@ -80,14 +76,17 @@ class Master_Volume_Controller:
 
         new_mute_state = self.controller.GetMute()
         status = "Mutado" if new_mute_state else "Desmutado"
-        print(f"Volume master {status}.")
+        Activity_Log.shared().info('master', f"Volume master {status}.")
         return new_mute_state
 
+    def set_mute(self, mute_state: bool) -> None:
+        self.controller.SetMute(mute_state, None)
+
     def set_volume(self, level: float) -> None:
         volume = max(0.0, min(1.0, level / 100.0))
         self.controller.SetMasterVolumeLevelScalar(volume, None)
         self.volume = self._get_volume()
-        print(f"Volume master definido para {self.volume}%.")
+        Activity_Log.shared().info('master', f"Volume master definido para {self.volume}%.")
 
 
 def main():
@@ -0,0 +1,133 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+from src.core.Activity_Log import Activity_Log
+
+
+class Write_Behind_Scheduler:
+    def __init__(self, sink: Callable[[Hashable, Any], None], rate_hz: float = 60.0, thread_initializer: Optional[Callable[[], None]] = None) -> None:
+        self.sink = sink
+        self.rate_hz = rate_hz
+        self.thread_initializer = thread_initializer
+        self._cond = threading.Condition()
+        self._apply_lock = threading.Lock()
+        self._pending: Dict[Hashable, Any] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.stats = {
+            'submitted': 0,
+            'coalesced': 0,
+            'applied': 0,
+            'errors': 0,
+            'flushes': 0,
+        }
+
+    def submit(self, key: Hashable, value: Any) -> None:
+        with self._cond:
+            self.stats['submitted'] += 1
+            if key in self._pending:
+                self.stats['coalesced'] += 1
+            self._pending[key] = value
+            self._cond.notify()
+
+    def flush(self) -> int:
+        with self._cond:
+            self.stats['flushes'] += 1
+        return self._apply_pending()
+
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="VolumeScheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._apply_pending()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._cond:
+            return dict(self.stats, pending=len(self._pending))
+
+    def _apply_pending(self) -> int:
+        with self._apply_lock:
+            with self._cond:
+                batch = self._pending
+                self._pending = {}
+
+            for key, value in batch.items():
+                try:
+                    self.sink(key, value)
+                    applied = True
+                except Exception as e:
+                    applied = False
+                    Activity_Log.shared().error('mixer', f"Erro ao aplicar volume de {key}: {e}")
+                with self._cond:
+                    self.stats['applied' if applied else 'errors'] += 1
+            return len(batch)
+
+    def _run(self) -> None:
+        if self.thread_initializer:
+            self.thread_initializer()
+
+        interval = 1.0 / self.rate_hz
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+            started = time.monotonic()
+            self._apply_pending()
+            remaining = interval - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+
+class Fake_Volume_Sink:
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.values: Dict[Hashable, Any] = {}
+        self.writes = 0
+
+    def __call__(self, key: Hashable, value: Any) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        self.values[key] = value
+        self.writes += 1
+
+
+def main():
+    print("=== Teste do Write-Behind Scheduler ===\n")
+
+    sink = Fake_Volume_Sink(latency=0.002)
+    scheduler = Write_Behind_Scheduler(sink, rate_hz=60)
+    scheduler.start()
+
+    start = time.perf_counter()
+    for step in range(600):
+        scheduler.submit(('app', 'spotify'), step % 101)
+        scheduler.submit(('master', None), 100 - step % 101)
+        time.sleep(0.001)
+    submit_time = time.perf_counter() - start
+
+    scheduler.submit(('app', 'spotify'), 42)
+    scheduler.flush()
+    scheduler.stop()
+
+    stats = scheduler.get_stats()
+    print(f"Eventos de slider: {stats['submitted']} em {submit_time * 1000:.1f} ms")
+    print(f"Escritas coalescidas: {stats['coalesced']}, aplicadas: {stats['applied']}, erros: {stats['errors']}")
+    print(f"Valor final aplicado: {sink.values[('app', 'spotify')]} (esperado 42)")
+
+
+if __name__ == "__main__":
+    main()
@@ -65,8 +65,22 @@ class SoundMixerApp {
             // Configurar perfil
             this.setupProfile();
 
+            // Medir o primeiro quadro do shell, antes de qualquer dado do backend
+            requestAnimationFrame(() => this.apiClient.markStartup('first_paint'));
+
+            // Receber eventos enviados pelo backend (lotes coalescidos)
+            window.onMixerEvents = (events) => this.handleMixerEvents(events);
+
+            // Fim do arraste de qualquer slider: garantir que o último valor seja aplicado
+            document.addEventListener('change', (e) => {
+                if (e.target.type === 'range') {
+                    this.apiClient.flushVolumeUpdates();
+                }
+            });
+
             // Iniciar na tela de apps
             await this.showScreen('apps');
+            this.apiClient.markStartup('first_data');
 
             this.initialized = true;
             console.log('✅ SoundMixer inicializado com sucesso');
@@ -76,6 +90,143 @@ class SoundMixerApp {
         }
     }
 
+    handleMixerEvents(events) {
+        let reloadScreen = false;
+
+        events.forEach(event => {
+            switch (event.topic) {
+                case 'app_added':
+                case 'app_removed':
+                    reloadScreen = reloadScreen || this.currentScreen === 'apps' || this.currentScreen === 'routing';
+                    break;
+                case 'devices_changed':
+                    reloadScreen = reloadScreen || this.currentScreen === 'devices';
+                    break;
+                case 'routing_changed':
+                    reloadScreen = reloadScreen || this.currentScreen === 'routing';
+                    break;
+                case 'profile_switched':
+                case 'hotkey_triggered':
+                case 'backend_ready':
+                    reloadScreen = true;
+                    break;
+                case 'app_changed':
+                    this.updateAppCard(event.key, event.data);
+                    break;
+                case 'master_changed':
+                    this.updateMasterControls(event.data);
+                    break;
+                case 'meters':
+                    this.updateMeters(event.data);
+                    break;
+                case 'spectrum':
+                    this.updateSpectrum(event.key, event.data);
+                    break;
+            }
+        });
+
+        if (reloadScreen) {
+            this.showScreen(this.currentScreen);
+        }
+    }
+
+    updateAppCard(appName, data) {
+        const card = document.querySelector(`.audio-card[data-app-name="${appName}"]`);
+        if (!card) return;
+
+        const slider = card.querySelector('.form-range');
+        if (slider && data.volume !== undefined && document.activeElement !== slider) {
+            slider.value = data.volume;
+            card.querySelector('.volume-percentage').textContent = `${data.volume}%`;
+            this.updateSliderGradient(slider, data.volume);
+        }
+
+        if (data.is_muted !== undefined) {
+            const icon = card.querySelector('.mute-btn i');
+            icon.classList.toggle('fa-volume-mute', data.is_muted);
+            icon.classList.toggle('fa-volume-up', !data.is_muted);
+            if (slider) slider.disabled = data.is_muted;
+        }
+    }
+
+    updateMeters(frame) {
+        if (frame.keys) {
+            this.meterKeys = frame.keys;
+            this.meterLayout = frame.layout;
+        }
+        if (!this.meterKeys || frame.layout !== this.meterLayout) return;
+
+        const clips = new Set(frame.clips);
+        this.meterKeys.forEach((key, index) => {
+            const meter = this.getMeterElement(key);
+            if (!meter) return;
+
+            meter.style.setProperty('--vu-level', frame.levels[index] / 100);
+            meter.style.setProperty('--vu-hold', `${frame.holds[index]}%`);
+            meter.classList.toggle('vu-clip', clips.has(index));
+        });
+    }
+
+    updateSpectrum(channelId, frame) {
+        const card = document.querySelector(`.channel-card[data-channel-id="${CSS.escape(channelId)}"]`);
+        if (!card) return;
+
+        let canvas = card.querySelector('.spectrum-canvas');
+        if (!canvas) {
+            card.insertAdjacentHTML('beforeend', '<canvas class="spectrum-canvas" width="320" height="48"></canvas>');
+            canvas = card.querySelector('.spectrum-canvas');
+        }
+
+        const ctx = canvas.getContext('2d');
+        const bands = frame.bands;
+        const barWidth = canvas.width / bands.length;
+        ctx.clearRect(0, 0, canvas.width, canvas.height);
+        ctx.fillStyle = getComputedStyle(card.querySelector('.channel-icon') || card).backgroundColor;
+        bands.forEach((value, index) => {
+            const height = (value / 100) * canvas.height;
+            ctx.fillRect(index * barWidth + 1, canvas.height - height, barWidth - 2, height);
+        });
+    }
+
+    getMeterElement(key) {
+        const separator = key.indexOf(':');
+        const kind = separator === -1 ? key : key.slice(0, separator);
+        const id = separator === -1 ? '' : CSS.escape(key.slice(separator + 1));
+
+        let container = null;
+        if (kind === 'app') container = document.querySelector(`.audio-card[data-app-name="${id}"] .volume-control`);
+        else if (kind === 'channel') container = document.querySelector(`.channel-card[data-channel-id="${id}"]`);
+        else if (kind === 'device') container = document.querySelector(`.device-card[data-device-id="${id}"]`);
+        else if (kind === 'master') container = document.querySelector('#master-volume-container .volume-control');
+        if (!container) return null;
+
+        let meter = container.querySelector(':scope > .vu-meter');
+        if (!meter) {
+            container.insertAdjacentHTML('beforeend', '<div class="vu-meter" title="Clique para limpar o clip"><div class="vu-level"></div><div class="vu-hold"></div></div>');
+            meter = container.lastElementChild;
+            meter.addEventListener('click', () => this.apiClient.resetMeterClips());
+        }
+        return meter;
+    }
+
+    updateMasterControls(data) {
+        const slider = document.getElementById('master-volume-slider');
+        if (!slider) return;
+
+        if (data.volume !== undefined && document.activeElement !== slider) {
+            slider.value = data.volume;
+            document.getElementById('master-volume-percentage').textContent = `${data.volume}%`;
+            this.updateSliderGradient(slider, data.volume);
+        }
+
+        if (data.is_muted !== undefined) {
+            const icon = document.querySelector('#master-mute-btn i');
+            icon.classList.toggle('fa-volume-mute', data.is_muted);
+            icon.classList.toggle('fa-volume-up', !data.is_muted);
+            slider.disabled = data.is_muted;
+        }
+    }
+
     setupNavigation() {
         const menuLinks = document.querySelectorAll('.nav-link');
 
@@ -259,6 +410,7 @@ class SoundMixerApp {
     async showScreen(screenName) {
         try {
             this.currentScreen = screenName;
+            this.apiClient.setSpectrumEnabled(screenName === 'channels');
 
             // Limpar event listeners antigos para evitar conflitos
             this.clearEventListeners();
@@ -3,6 +3,7 @@
 class PythonAPIClient {
     constructor(stateManager) {
         this.state = stateManager;
+        this.iconCache = new Map();
         this.mockData = {
             channels: {
                 output: [
@@ -46,14 +47,15 @@ class PythonAPIClient {
                 console.log('📱 Apps obtidos do Python:', apps);
 
                 // Mapear para formato esperado pela interface
-                return apps.map(app => ({
+                return Promise.all(apps.map(async app => ({
                     name: app.name,
                     volume: app.volume || 50,
                     is_muted: app.is_muted || false,
                     is_solo: app.is_solo || false,
-                    icon: app.icon || null,
+                    icon_id: app.icon_id || null,
+                    icon: await this.getAppIcon(app.icon_id),
                     pid: app.pid
-                }));
+                })));
             } else {
                 // Fallback para dados mock
                 console.log('🔧 Usando dados mock para apps');
@@ -71,10 +73,175 @@ class PythonAPIClient {
         }
     }
 
-    async setAppVolume(appName, volume) {
+    async getAppIcon(iconId) {
+        if (!iconId) return null;
+
+        // Cada ícone é buscado uma única vez e reutilizado nos próximos polls
+        if (!this.iconCache.has(iconId)) {
+            const request = window.pywebview.api.get_app_icon(iconId).catch(error => {
+                console.error(`❌ Erro ao obter ícone ${iconId}:`, error);
+                this.iconCache.delete(iconId);
+                return null;
+            });
+            this.iconCache.set(iconId, request);
+        }
+        return this.iconCache.get(iconId);
+    }
+
+    async getActivityLog(afterId = 0, limit = 100, level = null) {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.get_activity_log) {
+                return await window.pywebview.api.get_activity_log(afterId, limit, level);
+            }
+        } catch (error) {
+            console.error('❌ Erro ao obter log de atividades:', error);
+        }
+        return { entries: [], last_id: afterId, truncated: false };
+    }
+
+    async markStartup(phase) {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.mark_startup) {
+                await window.pywebview.api.mark_startup(phase);
+            }
+        } catch (error) {
+            console.error('❌ Erro ao registrar fase de inicialização:', error);
+        }
+    }
+
+    async getMetrics(reset = false) {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.get_metrics) {
+                return await window.pywebview.api.get_metrics(reset);
+            }
+        } catch (error) {
+            console.error('❌ Erro ao obter métricas:', error);
+        }
+        return { enabled: false, since: 0, series: {} };
+    }
+
+    async getHotkeys() {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.get_hotkeys) {
+                return await window.pywebview.api.get_hotkeys();
+            }
+        } catch (error) {
+            console.error('❌ Erro ao obter atalhos globais:', error);
+        }
+        return [];
+    }
+
+    async setHotkeys(bindings) {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.set_hotkeys) {
+                return await window.pywebview.api.set_hotkeys(bindings);
+            }
+        } catch (error) {
+            console.error('❌ Erro ao salvar atalhos globais:', error);
+        }
+        return { ok: false, count: 0, error: 'API indisponível' };
+    }
+
+    async getDuckingRules() {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.get_ducking_rules) {
+                return await window.pywebview.api.get_ducking_rules();
+            }
+        } catch (error) {
+            console.error('❌ Erro ao obter regras de ducking:', error);
+        }
+        return [];
+    }
+
+    async setDuckingRules(rules) {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.set_ducking_rules) {
+                return await window.pywebview.api.set_ducking_rules(rules);
+            }
+        } catch (error) {
+            console.error('❌ Erro ao salvar regras de ducking:', error);
+        }
+        return { ok: false, count: 0, error: 'API indisponível' };
+    }
+
+    async getDuckingState() {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.get_ducking_state) {
+                return await window.pywebview.api.get_ducking_state();
+            }
+        } catch (error) {
+            console.error('❌ Erro ao obter estado do ducking:', error);
+        }
+        return { rules: [], stats: {} };
+    }
+
+    async getProfiles() {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.get_profiles) {
+                return await window.pywebview.api.get_profiles();
+            }
+        } catch (error) {
+            console.error('❌ Erro ao listar perfis:', error);
+        }
+        return { profiles: [], active: null };
+    }
+
+    async saveProfile(profileName) {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.save_profile) {
+                return await window.pywebview.api.save_profile(profileName);
+            }
+        } catch (error) {
+            console.error(`❌ Erro ao salvar perfil ${profileName}:`, error);
+        }
+        return false;
+    }
+
+    async switchProfile(profileName) {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.switch_profile) {
+                return await window.pywebview.api.switch_profile(profileName);
+            }
+        } catch (error) {
+            console.error(`❌ Erro ao aplicar perfil ${profileName}:`, error);
+        }
+        return null;
+    }
+
+    async setSpectrumEnabled(enabled) {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.set_spectrum_enabled) {
+                await window.pywebview.api.set_spectrum_enabled(enabled);
+            }
+        } catch (error) {
+            console.error('❌ Erro ao alternar analisador de espectro:', error);
+        }
+    }
+
+    async resetMeterClips() {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.reset_meter_clips) {
+                await window.pywebview.api.reset_meter_clips();
+            }
+        } catch (error) {
+            console.error('❌ Erro ao limpar clip dos medidores:', error);
+        }
+    }
+
+    async flushVolumeUpdates() {
+        try {
+            if (window.pywebview && window.pywebview.api && window.pywebview.api.flush_volume_updates) {
+                await window.pywebview.api.flush_volume_updates();
+            }
+        } catch (error) {
+            console.error('❌ Erro ao aplicar volumes pendentes:', error);
+        }
+    }
+
+    async setAppVolume(appName, volume, fadeMs = 0, curve = 'linear') {
         try {
             if (window.pywebview && window.pywebview.api) {
-                await window.pywebview.api.set_app_volume(appName, volume);
+                await window.pywebview.api.set_app_volume(appName, volume, fadeMs, curve);
                 console.log(`🔊 Volume do ${appName} definido para ${volume}%`);
             } else {
                 // Fallback para mock
@@ -151,10 +318,10 @@ class PythonAPIClient {
         }
     }
 
-    async setMasterVolume(volume) {
+    async setMasterVolume(volume, fadeMs = 0, curve = 'linear') {
         try {
             if (window.pywebview && window.pywebview.api) {
-                await window.pywebview.api.set_master_volume(volume);
+                await window.pywebview.api.set_master_volume(volume, fadeMs, curve);
                 console.log(`🎛️ Volume master definido para ${volume}%`);
             } else {
                 // Fallback para mock
@@ -250,10 +417,10 @@ class PythonAPIClient {
         }
     }
 
-    async setDeviceVolume(deviceId, deviceType, volume) {
+    async setDeviceVolume(deviceId, deviceType, volume, fadeMs = 0, curve = 'linear') {
         try {
             if (window.pywebview && window.pywebview.api) {
-                await window.pywebview.api.set_device_volume(deviceId, deviceType, volume);
+                await window.pywebview.api.set_device_volume(deviceId, deviceType, volume, fadeMs, curve);
                 console.log(`🔊 Volume do dispositivo ${deviceId} definido para ${volume}%`);
             } else {
                 console.log(`🔧 Mock: Volume do dispositivo ${deviceId} definido para ${volume}%`);
@@ -409,6 +576,35 @@ class PythonAPIClient {
         }
     }
 
+    async routeChannelToDevice(channelId, deviceId) {
+        try {
+            if (window.pywebview && window.pywebview.api) {
+                const result = await window.pywebview.api.route_channel_to_device(channelId, deviceId);
+                console.log(`🔀 Canal ${channelId} ${result.ok ? 'roteado' : 'falhou ao rotear'} para dispositivo ${deviceId}`);
+                return result;
+            } else {
+                console.log(`🔧 Mock: Roteando canal ${channelId} para ${deviceId}`);
+                return { ok: true, apps: 0, sessions: 0 };
+            }
+        } catch (error) {
+            console.error(`❌ Erro ao rotear canal ${channelId}:`, error);
+            return { ok: false, error: String(error) };
+        }
+    }
+
+    async getAppRoutes() {
+        try {
+            if (window.pywebview && window.pywebview.api) {
+                return await window.pywebview.api.get_app_routes();
+            } else {
+                return [];
+            }
+        } catch (error) {
+            console.error('❌ Erro ao obter tabela de roteamento:', error);
+            return [];
+        }
+    }
+
     async getAppRouting(appName) {
         try {
             if (window.pywebview && window.pywebview.api) {
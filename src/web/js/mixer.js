@@ -1,3 +1,12 @@
+const iconCache = new Map();
+
+function load_app_icon(iconId) {
+    if (!iconCache.has(iconId)) {
+        iconCache.set(iconId, pywebview.api.get_app_icon(iconId));
+    }
+    return iconCache.get(iconId);
+}
+
 window.addEventListener('pywebviewready', function() {
     pywebview.api.get_audio_apps().then(update_app_list);
     pywebview.api.get_master_state().then(setup_master_controls);
@@ -20,7 +29,7 @@ function update_app_list(apps) {
 
         const audioCardHTML = `
             <div class="audio-card" data-app-name="${app.name}">
-                ${app.icon ? `<img src="${app.icon}" class="app-icon">` : '<div class="app-icon-placeholder"></div>'}
+                ${app.icon_id ? `<img data-icon-id="${app.icon_id}" class="app-icon">` : '<div class="app-icon-placeholder"></div>'}
                 <span class="app-name">${app.name}</span>
                 <div class="volume-control">
                     <button class="mute-btn" title="Mutar/Desmutar ${app.name}">
@@ -34,6 +43,12 @@ function update_app_list(apps) {
         contentBody.insertAdjacentHTML('beforeend', audioCardHTML);
     });
 
+    document.querySelectorAll('.app-icon[data-icon-id]').forEach(img => {
+        load_app_icon(img.dataset.iconId).then(icon => {
+            if (icon) img.src = icon;
+        });
+    });
+
     document.querySelectorAll('.form-range').forEach(slider => {
         slider.addEventListener('input', function() {
             const appName = this.closest('.audio-card').dataset.appName;